@@ -3,27 +3,49 @@ from __future__ import annotations
 
 import asyncio
 import voluptuous as vol
-from typing import Final
-from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Final
+from dataclasses import dataclass, field
+from functools import partial
+from importlib import import_module
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers import config_validation as cv, device_registry as dr, entity_registry as er
 from homeassistant.const import Platform
-from homeassistant.helpers.storage import Store
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 
-from bluetooth_mesh.messages.properties import PropertyID
-
-from bt_mesh_ctrl.mesh_cfgclient_conf import MeshCfgclientConf
+from bt_mesh_ctrl.mesh_cfgclient_conf import MeshCfgclientConf, MeshCfgModel
 from bt_mesh_ctrl import BtMeshModelId
 
-from .application import BtMeshApplication
-from .entity import BtMeshEntity
+from .entity import (
+    BtMeshEntity,
+    vendor_tables,
+    discard_device_info,
+    prune_device_info,
+)
+from .state_store import BtMeshStateStore
+from .sensor_properties import to_property_id
+from .sensor_descriptors import (
+    BtMeshSensorDescriptors,
+    BtMeshSensorDescriptorTemplates,
+    RetryBackoff,
+    template_key,
+)
+from .sensor_cadence import BtMeshSensorCadence
+from .thermostat_ranges import BtMeshThermostatRanges
+from .scheduler import BtMeshRefreshScheduler
+from .mesh_conf_watcher import MeshConfWatcher
+from .mesh_diff import MeshConfSnapshot, MeshConfDiff, diff_mesh_conf
+from .metrics import BtMeshMetricsView, METRIC_REFRESH_QUEUE_DEPTH
+from .shards import BtMeshShardRouter, shard_uuid
+from .watchdog import BtMeshWatchdog
 from .const import (
     DOMAIN,
     PLATFORMS,
     BT_MESH_CONFIG,
+    BT_MESH_DESCRIPTOR_TEMPLATES,
     CONF_DBUS_APP_PATH,
     CONF_DBUS_APP_TOKEN,
     CONF_MESH_CFGCLIENT_CONFIG_PATH,
@@ -33,12 +55,54 @@ from .const import (
     CONF_PASSIVE,
     CONF_UPDATE_TIME,
     CONF_KEEPALIVE_TIME,
-    STORAGE_SENSOR_DESCRIPTORS,
+    CONF_CADENCE,
+    CONF_SENSOR_CADENCE,
+    CONF_PUSH_ONLY,
+    CONF_METRIC_SENSORS,
+    CONF_SIMULATION,
+    CONF_WATCHDOG,
+    CONF_WATCHDOG_THRESHOLD,
+    CONF_WATCHDOG_INTERVAL,
+    CONF_SCENES,
+    CONF_SCENE_ADDRESS,
+    CONF_SCENE_NAMES,
+    CONF_TIME_SERVER,
+    CONF_TIME_ADDRESS,
+    CONF_TIME_APP_KEY,
+    CONF_TIME_PERIOD,
+    CONF_SHARDS,
+    CONF_SHARD_RANGES,
+    CONF_SHARD_ROUTING,
+    SHARD_ROUTING_STATIC,
+    SHARD_ROUTINGS,
+    CONF_SIM_NODES,
+    CONF_SIM_MODELS,
+    CONF_SIM_LATENCY,
+    CONF_SIM_JITTER,
+    CONF_SIM_HOPS,
+    CONF_SIM_LOSS,
+    CONF_SIM_PUBLISH_INTERVAL,
+    CONF_SIM_SEGMENT_DELAY,
+    CONF_SIM_SEED,
+    SIM_MODELS,
+    DEFAULT_WATCHDOG_THRESHOLD,
+    DEFAULT_WATCHDOG_INTERVAL,
+    DEFAULT_SCENE_ADDRESS,
+    DEFAULT_TIME_PERIOD,
     DEFAULT_DBUS_APP_PATH,
     DEFAULT_MESH_CFGCLIENT_CONFIG_PATH,
     BT_MESH_DISCOVERY_ENTITY_NEW,
+    BT_MESH_MODEL_UPDATED,
+    BT_MESH_RECONNECTED,
+    G_MESH_CONF_RETRY_INTERVAL,
+    G_STALE_CHECK_INTERVAL,
+    G_SENSOR_DESCRIPTORS_CONCURRENCY,
 )
 
+if TYPE_CHECKING:
+    from .application import BtMeshApplication
+    from .scene import BtMeshScenes
+
 import logging
 _LOGGER = logging.getLogger(__name__)
 
@@ -65,6 +129,7 @@ SENSOR_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_UPDATE_TIME): cv.positive_int,
         vol.Optional(CONF_KEEPALIVE_TIME): cv.positive_int,
+        vol.Optional(CONF_CADENCE): cv.boolean,
         vol.Optional(CONF_SENSOR_DESCRIPTORS): vol.All(
             cv.ensure_list,
             [SENSOR_DESCRIPTOR_SCHEMA]
@@ -82,6 +147,68 @@ NODE_SCHEMA = vol.Schema(
     extra=vol.ALLOW_EXTRA
 )
 
+SIMULATION_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_SIM_NODES): vol.All(vol.Coerce(int), vol.Range(min=1, max=0x7eff)),
+        vol.Optional(CONF_SIM_MODELS): vol.All(cv.ensure_list, [vol.In(SIM_MODELS)]),
+        vol.Optional(CONF_SIM_LATENCY): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_SIM_JITTER): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
+        vol.Optional(CONF_SIM_HOPS): vol.All(vol.Coerce(int), vol.Range(min=1, max=127)),
+        vol.Optional(CONF_SIM_LOSS): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
+        vol.Optional(CONF_SIM_PUBLISH_INTERVAL): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_SIM_SEGMENT_DELAY): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_SIM_SEED): vol.Coerce(int),
+    }
+)
+
+WATCHDOG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_WATCHDOG_THRESHOLD, default=DEFAULT_WATCHDOG_THRESHOLD): vol.All(
+            vol.Coerce(float), vol.Range(min=0.001)
+        ),
+        vol.Optional(CONF_WATCHDOG_INTERVAL, default=DEFAULT_WATCHDOG_INTERVAL): vol.All(
+            vol.Coerce(float), vol.Range(min=0.01)
+        ),
+    }
+)
+
+SCENES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_SCENE_ADDRESS, default=DEFAULT_SCENE_ADDRESS): vol.All(
+            vol.Coerce(int), vol.Range(min=0x0001, max=0xffff)
+        ),
+        vol.Optional(CONF_SCENE_NAMES, default={}): {
+            vol.All(vol.Coerce(int), vol.Range(min=1, max=0xffff)): cv.string
+        },
+    }
+)
+
+TIME_SERVER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_TIME_ADDRESS): vol.All(vol.Coerce(int), vol.Range(min=0xc000, max=0xffff)),
+        vol.Optional(CONF_TIME_APP_KEY, default=0): vol.All(vol.Coerce(int), vol.Range(min=0, max=0xfff)),
+        vol.Optional(CONF_TIME_PERIOD, default=DEFAULT_TIME_PERIOD): vol.All(
+            vol.Coerce(float), vol.Range(min=10)
+        ),
+    }
+)
+
+UNICAST_RANGE_SCHEMA = vol.All(
+    vol.ExactSequence([
+        vol.All(vol.Coerce(int), vol.Range(min=0x0001, max=0x7fff)),
+        vol.All(vol.Coerce(int), vol.Range(min=0x0001, max=0x7fff)),
+    ]),
+    vol.Coerce(tuple)
+)
+
+SHARD_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DBUS_APP_PATH): cv.string,
+        vol.Optional(CONF_DBUS_APP_TOKEN, default=0): vol.Coerce(int),
+        vol.Optional(CONF_SHARD_RANGES, default=[]): vol.All(cv.ensure_list, [UNICAST_RANGE_SCHEMA]),
+    }
+)
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.Schema(
@@ -89,6 +216,15 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(CONF_DBUS_APP_PATH, default=DEFAULT_DBUS_APP_PATH): cv.string,
                 vol.Optional(CONF_MESH_CFGCLIENT_CONFIG_PATH, default=DEFAULT_MESH_CFGCLIENT_CONFIG_PATH): cv.string,
                 vol.Optional(CONF_NODES, default={}): vol.Any(None, {cv.string: NODE_SCHEMA}),
+                vol.Optional(CONF_SENSOR_CADENCE, default=False): cv.boolean,
+                vol.Optional(CONF_PUSH_ONLY, default=False): cv.boolean,
+                vol.Optional(CONF_METRIC_SENSORS, default=False): cv.boolean,
+                vol.Optional(CONF_SIMULATION): vol.Any(None, SIMULATION_SCHEMA),
+                vol.Optional(CONF_WATCHDOG): vol.Any(None, WATCHDOG_SCHEMA),
+                vol.Optional(CONF_SCENES): vol.Any(None, SCENES_SCHEMA),
+                vol.Optional(CONF_TIME_SERVER): vol.Any(None, TIME_SERVER_SCHEMA),
+                vol.Optional(CONF_SHARDS, default=[]): vol.All(cv.ensure_list, [SHARD_SCHEMA]),
+                vol.Optional(CONF_SHARD_ROUTING, default=SHARD_ROUTING_STATIC): vol.In(SHARD_ROUTINGS),
             },
             extra=vol.ALLOW_EXTRA
         )
@@ -104,6 +240,21 @@ class BtMeshData:
     app: BtMeshApplication
     mesh_conf: MeshCfgclientConf
     discovered: list
+    state_store: BtMeshStateStore
+    descriptors: BtMeshSensorDescriptors
+    descriptors_backoff: RetryBackoff
+    sensor_cadence: BtMeshSensorCadence
+    thermostat_ranges: BtMeshThermostatRanges
+    scheduler: BtMeshRefreshScheduler
+    shards: BtMeshShardRouter
+    reload_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    retry_unsub: Callable[[], None] | None = None
+    devices_config_updated: bool = True
+    sensors_config_updated: bool = True
+    discovery_done: bool = False
+    mesh_snapshot: MeshConfSnapshot | None = None
+    watchdog: BtMeshWatchdog | None = None
+    scenes: BtMeshScenes | None = None
 
 
 type BtMeshConfigEntry = ConfigEntry[BtMeshData]
@@ -114,6 +265,18 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][BT_MESH_CONFIG] = config[DOMAIN]
+    # descriptors of the products are shared by the entries
+    templates = BtMeshSensorDescriptorTemplates(hass)
+    await templates.async_load()
+    hass.data[DOMAIN][BT_MESH_DESCRIPTOR_TEMPLATES] = templates
+
+    hass.http.register_view(BtMeshMetricsView)
+    # services and the trace recorder they start are imported on setup,
+    # not on integration load
+    services = await hass.async_add_import_executor_job(
+        import_module, f"{__package__}.services"
+    )
+    await services.async_setup_services(hass)
 
     return True
 
@@ -125,13 +288,65 @@ async def async_setup_entry(hass: HomeAssistant, entry: BtMeshConfigEntry) -> bo
 #    _LOGGER.debug(f"BT_MESH_CONFIG: {hass.data[DOMAIN][BT_MESH_CONFIG]}")
 #    _LOGGER.debug(f"filename = {entry.data[CONF_MESH_CFGCLIENT_CONFIG_PATH]}")
 
-    # create BtMesh application
-    app = BtMeshApplication(
-        hass,
-        uuid=entry.entry_id,                    # FIXME: is not UUID
-        path=entry.data[CONF_DBUS_APP_PATH],
-        token=entry.data[CONF_DBUS_APP_TOKEN]
-    )
+    # bluetooth_mesh models and vendor tables are imported on setup,
+    # not on integration load
+    await hass.async_add_executor_job(vendor_tables)
+
+    domain_conf = hass.data[DOMAIN][BT_MESH_CONFIG]
+    if entry.data.get(CONF_SIMULATION):
+        # simulated network instead of bluetooth-meshd, its configuration
+        # is written to the file read by MeshCfgclientConf, entry options
+        # override the YAML parameters (used by the scale benchmark)
+        simulator = await hass.async_add_import_executor_job(
+            import_module, f"{__package__}.simulator"
+        )
+        app = simulator.BtMeshSimulatedApplication(
+            hass,
+            uuid=entry.entry_id,
+            path=entry.data[CONF_DBUS_APP_PATH],
+            token=entry.data[CONF_DBUS_APP_TOKEN],
+            options=simulator.SimulationOptions.from_config(
+                {**(domain_conf.get(CONF_SIMULATION) or {}), **entry.options}
+            )
+        )
+        await hass.async_add_executor_job(
+            simulator.write_mesh_conf,
+            entry.data[CONF_MESH_CFGCLIENT_CONFIG_PATH],
+            app.mesh
+        )
+        # simulated shards are other radios of the same network
+        create_shard_app = partial(
+            simulator.BtMeshSimulatedApplication, hass, mesh=app.mesh
+        )
+    else:
+        application = await hass.async_add_import_executor_job(
+            import_module, f"{__package__}.application"
+        )
+
+        # create BtMesh application
+        app = application.BtMeshApplication(
+            hass,
+            uuid=entry.entry_id,                    # FIXME: is not UUID
+            path=entry.data[CONF_DBUS_APP_PATH],
+            token=entry.data[CONF_DBUS_APP_TOKEN]
+        )
+        create_shard_app = partial(application.BtMeshApplication, hass)
+
+    # additional application instances, each attached to bluetooth-meshd
+    # with own D-Bus path and token, the nodes are assigned to them by
+    # unicast address ranges
+    shards = BtMeshShardRouter(domain_conf[CONF_SHARD_ROUTING])
+    shards.add(entry.data[CONF_DBUS_APP_PATH], app)
+    for shard_conf in domain_conf[CONF_SHARDS]:
+        shards.add(
+            shard_conf[CONF_DBUS_APP_PATH],
+            create_shard_app(
+                uuid=shard_uuid(entry.entry_id, shard_conf[CONF_DBUS_APP_PATH]),
+                path=shard_conf[CONF_DBUS_APP_PATH],
+                token=shard_conf[CONF_DBUS_APP_TOKEN]
+            ),
+            shard_conf[CONF_SHARD_RANGES]
+        )
 
     # create mesh network config
     mesh_conf = MeshCfgclientConf(
@@ -142,8 +357,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: BtMeshConfigEntry) -> bo
         domain_conf=hass.data[DOMAIN][BT_MESH_CONFIG],
         app=app,
         mesh_conf=mesh_conf,
-        discovered=set()
+        discovered=set(),
+        state_store=BtMeshStateStore(hass, entry.entry_id),
+        descriptors=BtMeshSensorDescriptors(
+            hass, entry.entry_id, hass.data[DOMAIN][BT_MESH_DESCRIPTOR_TEMPLATES]
+        ),
+        descriptors_backoff=RetryBackoff(),
+        sensor_cadence=BtMeshSensorCadence(hass, entry.entry_id),
+        thermostat_ranges=BtMeshThermostatRanges(hass, entry.entry_id),
+        scheduler=BtMeshRefreshScheduler(hass),
+        shards=shards
     )
+    scheduler = entry.runtime_data.scheduler
+    app.metrics.set_gauge(METRIC_REFRESH_QUEUE_DEPTH, lambda: scheduler.queue_depth)
+
+    # optional loop lag watchdog, the message callback is instrumented
+    # before it's registered on connect
+    if CONF_WATCHDOG in domain_conf:
+        watchdog_conf = domain_conf[CONF_WATCHDOG] or WATCHDOG_SCHEMA({})
+        watchdog = BtMeshWatchdog(
+            hass,
+            threshold=watchdog_conf[CONF_WATCHDOG_THRESHOLD],
+            interval=watchdog_conf[CONF_WATCHDOG_INTERVAL]
+        )
+        for shard_app in shards.apps:
+            watchdog.instrument(shard_app, "_bt_mesh_msg_callback")
+        watchdog.async_start(entry)
+        entry.async_on_unload(watchdog.async_stop)
+        entry.runtime_data.watchdog = watchdog
 
     # Function: process exception
     try:
@@ -153,58 +394,195 @@ async def async_setup_entry(hass: HomeAssistant, entry: BtMeshConfigEntry) -> bo
         _LOGGER.error(f"Failed to connect to dBUS: {e}")
         return False
 
+    # nodes of the shard failed to connect are served by the primary one
+    for shard in shards.shards[1:]:
+        try:
+            await shard.app.dbus_connect()
+            await shard.app.connect()
+        except Exception as e:
+            _LOGGER.error(f"Failed to connect shard {shard.name} to dBUS: {e}")
+            shards.remove(shard)
+
+    # Time Status is published by the primary application, relayed to the
+    # nodes subscribed to the group address
+    time_server_conf = domain_conf.get(CONF_TIME_SERVER)
+    if time_server_conf and not entry.data.get(CONF_SIMULATION):
+        entry.async_on_unload(
+            app.time_server_publish_start(
+                time_server_conf[CONF_TIME_ADDRESS],
+                time_server_conf[CONF_TIME_APP_KEY],
+                time_server_conf[CONF_TIME_PERIOD]
+            )
+        )
+    scheduler.async_stage("connect")
+
+    # restore last known model state before the entities are added
+    await entry.runtime_data.state_store.async_load()
+    await entry.runtime_data.descriptors.async_load()
+    await entry.runtime_data.sensor_cadence.async_load()
+    await entry.runtime_data.thermostat_ranges.async_load()
+    scheduler.async_stage("restore")
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    scheduler.async_stage("platforms")
+
+    # warm-up entities state in priority order
+    scheduler.async_start(entry)
+
+    # entities are not polled by HA, outdated ones are queued periodically
+    if domain_conf[CONF_PUSH_ONLY]:
+        entry.async_on_unload(
+            async_track_time_interval(
+                hass,
+                partial(async_refresh_stale, entry),
+                timedelta(seconds=G_STALE_CHECK_INTERVAL)
+            )
+        )
 
-    # run task to track modifications to the Bt Mesh configuration file
-    track_mesh_conf_task = entry.async_create_background_task(
+    # refresh the entities not updated since bluetooth-meshd is back
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            BT_MESH_RECONNECTED,
+            partial(async_refresh_after_reconnect, entry)
+        )
+    )
+
+    # initial discovery, then track modifications to the Bt Mesh configuration file
+    async_schedule_reload_mesh_conf(hass, entry)
+
+    watcher = MeshConfWatcher(
         hass,
-        track_mesh_conf(hass, entry),
-        f"{DOMAIN}_{entry.title}_track_mesh_conf"
+        filename=entry.data[CONF_MESH_CFGCLIENT_CONFIG_PATH],
+        action=partial(async_schedule_reload_mesh_conf, hass, entry),
     )
+    watcher.async_start()
+    entry.async_on_unload(watcher.async_stop)
 
     return True
 
 
-async def track_mesh_conf(hass: HomeAssistant, entry: BtMeshConfigEntry):
-    """The task of tracking changes to the configuration file and then 
-       configuring new devices and removing unused ones."""
-    devices_config_updated = True
-    sensors_config_updated = True
+@callback
+def async_refresh_stale(entry: BtMeshConfigEntry, _now: datetime) -> None:
+    """Refresh the outdated entities of the push-only network."""
+    runtime_data = entry.runtime_data
+    runtime_data.scheduler.async_schedule_stale(runtime_data.state_store.entities)
+
+
+@callback
+def async_refresh_after_reconnect(
+    entry: BtMeshConfigEntry,
+    app: BtMeshApplication,
+    reconnected: float
+) -> None:
+    """Queue one refresh of the entities served by the reconnected
+       application, the ones updated by the replayed SET or by the
+       node publications since the reconnect are skipped."""
+    runtime_data = entry.runtime_data
+    if app not in runtime_data.shards.apps:
+        return
+    for entity in runtime_data.state_store.entities:
+        if entity.passive or entity.app is not app:
+            continue
+        if entity.last_update is None or entity.last_update < reconnected:
+            runtime_data.scheduler.async_schedule(entity)
+
+
+@callback
+def async_schedule_reload_mesh_conf(hass: HomeAssistant, entry: BtMeshConfigEntry) -> None:
+    """Run the Mesh network configuration reload task."""
+    entry.async_create_background_task(
+        hass,
+        async_reload_mesh_conf(hass, entry),
+        f"{DOMAIN}_{entry.title}_reload_mesh_conf"
+    )
+
+
+async def async_reload_mesh_conf(hass: HomeAssistant, entry: BtMeshConfigEntry) -> None:
+    """Reload the Mesh network configuration file and then configure new
+       devices and remove unused ones."""
+    runtime_data = entry.runtime_data
 
-    """Reload Mesh network configuration task."""
-    while True:
-        if entry.runtime_data.mesh_conf.is_modified():
+    async with runtime_data.reload_lock:
+        if runtime_data.retry_unsub is not None:
+            runtime_data.retry_unsub()
+            runtime_data.retry_unsub = None
+
+        mesh_diff = None
+        if runtime_data.mesh_conf.is_modified():
             _LOGGER.debug("reload_mesh_network_handler(), config modified")
             try:
-                await hass.async_add_executor_job(entry.runtime_data.mesh_conf.load)
-                devices_config_updated = False
-                sensors_config_updated = False
-
-                # remove unbinded models and unprovisioned devices
-                await cleanup_entity_registry(hass, entry)
-                await cleanup_device_registry(hass, entry)
+                await hass.async_add_executor_job(runtime_data.mesh_conf.load)
+                snapshot = MeshConfSnapshot.from_mesh_conf(runtime_data.mesh_conf)
+
+                if runtime_data.mesh_snapshot is None:
+                    # initial load, remove models and devices deleted
+                    # while HA has been stopped
+                    runtime_data.devices_config_updated = False
+                    runtime_data.sensors_config_updated = False
+                    await cleanup_entity_registry(hass, entry)
+                    await cleanup_device_registry(hass, entry)
+                else:
+                    mesh_diff = diff_mesh_conf(runtime_data.mesh_snapshot, snapshot)
+                    _LOGGER.debug(f"mesh config changes: {mesh_diff}")
+                    await apply_mesh_diff(hass, entry, mesh_diff)
+                runtime_data.mesh_snapshot = snapshot
             except FileNotFoundError:
                 _LOGGER.error(f"Mesh Network config file not found:")
                 pass
 
-        # looking for a new devices on startup
-        if not devices_config_updated:
-            devices_config_updated = await load_devices_config(hass, entry)
-
-        # looking for a new sensors on startup
-        if not sensors_config_updated:
-            sensors_config_updated = await load_sensors_config(hass, entry)
-
-
-        await asyncio.sleep(5)
+        # looking for a new devices, only added ones on the incremental reload
+        if not runtime_data.devices_config_updated:
+            runtime_data.devices_config_updated = await load_devices_config(hass, entry)
+        elif mesh_diff is not None and mesh_diff.models_added:
+            runtime_data.devices_config_updated = \
+                await load_devices_config(hass, entry, mesh_diff.models_added)
+
+        # looking for a new sensors, only added ones on the incremental reload
+        if not runtime_data.sensors_config_updated:
+            runtime_data.sensors_config_updated = await load_sensors_config(hass, entry)
+        elif mesh_diff is not None and mesh_diff.models_added:
+            runtime_data.sensors_config_updated = \
+                await load_sensors_config(hass, entry, mesh_diff.models_added)
+
+        # the first discovery pass is finished
+        if not runtime_data.discovery_done:
+            runtime_data.discovery_done = True
+            runtime_data.scheduler.async_stage("discovery")
+            runtime_data.scheduler.async_discovery_done()
+
+        # retry devices which failed to configure, sensors when the first
+        # node backoff expires
+        if not runtime_data.devices_config_updated or not runtime_data.sensors_config_updated:
+            retry_interval = G_MESH_CONF_RETRY_INTERVAL
+            if runtime_data.devices_config_updated:
+                retry_interval = runtime_data.descriptors_backoff.next_retry_delay(retry_interval)
+
+            @callback
+            def _async_retry(_now: datetime) -> None:
+                runtime_data.retry_unsub = None
+                async_schedule_reload_mesh_conf(hass, entry)
+
+            runtime_data.retry_unsub = async_call_later(
+                hass,
+                retry_interval,
+                _async_retry
+            )
 
 
-async def load_devices_config(hass: HomeAssistant, entry: BtMeshConfigEntry) -> bool:
+async def load_devices_config(
+    hass: HomeAssistant,
+    entry: BtMeshConfigEntry,
+    cfg_models: list[MeshCfgModel] | None=None
+) -> bool:
     """Loading node models (except the sensor) from the config and adding them to the HA."""
     mesh_conf = entry.runtime_data.mesh_conf
     _LOGGER.debug(f"load_devices_config(): start, {entry.runtime_data.domain_conf}")
 
-    for cfg_model in mesh_conf.get_models():
+    if cfg_models is None:
+        cfg_models = mesh_conf.get_models()
+
+    for cfg_model in cfg_models:
         _LOGGER.debug(f"model: model_id={cfg_model.model_id}, {cfg_model.unique_id}")
 
         # sensor model is loaded in dedicated task
@@ -233,9 +611,13 @@ async def load_devices_config(hass: HomeAssistant, entry: BtMeshConfigEntry) ->
     return True
 
 
-async def load_sensors_config(hass: HomeAssistant, entry: BtMeshConfigEntry) -> bool:
-    """Loading sensor models (except the sensor) from the config and adding them to the HA."""
-    app = entry.runtime_data.app
+async def load_sensors_config(
+    hass: HomeAssistant,
+    entry: BtMeshConfigEntry,
+    cfg_models: list[MeshCfgModel] | None=None
+) -> bool:
+    """Loading sensor models from the config and adding them to the HA."""
+    shards = entry.runtime_data.shards
     mesh_conf = entry.runtime_data.mesh_conf
 
     # get descriptors from config
@@ -249,91 +631,203 @@ async def load_sensors_config(hass: HomeAssistant, entry: BtMeshConfigEntry) ->
                         CONF_SENSOR_DESCRIPTORS in node_conf[Platform.SENSOR]
         }
 
-    # get descriptors from persistent storage
-    descriptors_store: Store[dict[int, Any]] = Store(hass, 1, STORAGE_SENSOR_DESCRIPTORS)
-    descriptors = await descriptors_store.async_load()
+    descriptors = entry.runtime_data.descriptors
 
     _LOGGER.debug(f"load_sensors_config(): start")
 
-    cfg_models = []
-    for model_id in SENSOR_MODELS:
-        cfg_models.extend(mesh_conf.get_models_by_model_id(model_id))
+    if cfg_models is None:
+        cfg_models = []
+        for model_id in SENSOR_MODELS:
+            cfg_models.extend(mesh_conf.get_models_by_model_id(model_id))
+    else:
+        cfg_models = [cfg_model for cfg_model in cfg_models if cfg_model.model_id in SENSOR_MODELS]
 
-    result = True
+    # group models by node, descriptors are fetched once per node
+    nodes: dict[str, list[MeshCfgModel]] = {}
     for cfg_model in cfg_models:
-        unicast_addr_key = f"{cfg_model.unicast_addr:04x}"
-        _LOGGER.debug(f"sensor device: {cfg_model.name}")
+        nodes.setdefault(f"{cfg_model.unicast_addr:04x}", []).append(cfg_model)
 
-        try:
-            node_conf = entry.runtime_data.domain_conf[CONF_NODES][unicast_addr_key]
-        except KeyError:
-            node_conf = {}
+    backoff = entry.runtime_data.descriptors_backoff
+    fetch: list[str] = []
+    # nodes waiting for descriptors of the same product being fetched
+    fetch_templates: dict[str, list[str]] = {}
+    result = True
+    for unicast_addr_key, node_models in nodes.items():
+        _LOGGER.debug(f"sensor device: {unicast_addr_key}")
 
         # get descriptors from config
         if unicast_addr_key in descriptors_conf:
             _LOGGER.debug("    get descriptors from config")
-            sensor_descriptors = descriptors_conf[unicast_addr_key]
+            descriptors.async_set(unicast_addr_key, descriptors_conf[unicast_addr_key])
         # get descriptors from local storage
-        elif descriptors is not None and unicast_addr_key in descriptors:
+        elif unicast_addr_key in descriptors:
             _LOGGER.debug("    get descriptors from local storage")
-            sensor_descriptors = descriptors[unicast_addr_key]
-        # get descriptors from device
+            descriptors.async_set_template(node_models[0].device, descriptors.get(unicast_addr_key))
+        # get descriptors of the same product and firmware version
+        elif (template := descriptors.get_template(node_models[0].device)) is not None:
+            _LOGGER.debug(f"    get descriptors from template {template_key(node_models[0].device)}")
+            descriptors.async_set(unicast_addr_key, template)
+        # wait for descriptors of the same product requested from other node
+        elif template_key(node_models[0].device) in fetch_templates:
+            _LOGGER.debug(f"    wait for template {template_key(node_models[0].device)}")
+            fetch_templates[template_key(node_models[0].device)].append(unicast_addr_key)
+            continue
+        # get descriptors from device, unless the node is in backoff
+        elif backoff.ready(unicast_addr_key):
+            fetch.append(unicast_addr_key)
+            fetch_templates[template_key(node_models[0].device)] = []
+            continue
         else:
-            _LOGGER.debug("    get descriptors from device")
-            _sensor_descriptors = await app.sensor_descriptor_get(
+            _LOGGER.debug(f"    {unicast_addr_key} in backoff, skip")
+            result = False
+            continue
+
+        async_add_sensors(hass, entry, node_models, descriptors.get(unicast_addr_key))
+
+    # descriptors are requested outside the global GET lock, a node that
+    # doesn't answer holds one of the slots until its timeout
+    semaphore = asyncio.Semaphore(G_SENSOR_DESCRIPTORS_CONCURRENCY)
+
+    async def fetch_descriptors(unicast_addr_key: str) -> bool:
+        cfg_model = nodes[unicast_addr_key][0]
+        async with semaphore:
+            _LOGGER.debug(f"    get descriptors from device {unicast_addr_key}")
+            _sensor_descriptors = await shards.app_for(cfg_model.unicast_addr).sensor_descriptor_get(
                 destination=cfg_model.unicast_addr,
                 app_index=cfg_model.app_key,
             )
-            sensor_descriptors = [
-                {
-                    "sensor_property_id": propery.sensor_property_id,
-                    "sensor_positive_tolerance": propery.sensor_positive_tolerance,
-                    "sensor_negative_tolerance": propery.sensor_negative_tolerance,
-                    "sensor_sampling_funcion": propery.sensor_sampling_funcion,
-                    "sensor_measurement_period": propery.sensor_measurement_period,
-                    "sensor_update_interval": propery.sensor_update_interval,
-                }
-                for propery in _sensor_descriptors
-            ] if _sensor_descriptors else None
-
-        if sensor_descriptors:
-            descriptors[unicast_addr_key] = sensor_descriptors
-            for propery in sensor_descriptors:
-                unique_id = BtMeshEntity.unique_id_sensor(cfg_model, PropertyID(propery["sensor_property_id"]))
-
-                # skip already discovered sensors
-                if unique_id in entry.runtime_data.discovered:
-                    _LOGGER.debug(f"    {unique_id} already discovered")
-                    continue
-
-                async_dispatcher_send(
-                    hass,
-                    BT_MESH_DISCOVERY_ENTITY_NEW.format(cfg_model.model_id),
-                    *(entry.runtime_data.app, cfg_model, propery, node_conf)
-                )
-
-                # mark sensor discovered
-                entry.runtime_data.discovered.add(unique_id)
-        else:
-            _LOGGER.debug(f"fail to get descriptors for device {cfg_model.device.unicast_addr:04x}")
-            result = False
 
-    # save updated descriptors to persistent strage
-    await descriptors_store.async_save(descriptors)
+        if not _sensor_descriptors:
+            backoff.failed(unicast_addr_key)
+            _LOGGER.debug(f"fail to get descriptors for device {unicast_addr_key}")
+            return False
+
+        backoff.succeeded(unicast_addr_key)
+        sensor_descriptors = [
+            {
+                "sensor_property_id": propery.sensor_property_id,
+                "sensor_positive_tolerance": propery.sensor_positive_tolerance,
+                "sensor_negative_tolerance": propery.sensor_negative_tolerance,
+                "sensor_sampling_funcion": propery.sensor_sampling_funcion,
+                "sensor_measurement_period": propery.sensor_measurement_period,
+                "sensor_update_interval": propery.sensor_update_interval,
+            }
+            for propery in _sensor_descriptors
+        ]
+        descriptors.async_set(unicast_addr_key, sensor_descriptors)
+        descriptors.async_set_template(cfg_model.device, sensor_descriptors, fetched=True)
+
+        # publish sensors as soon as their descriptors arrive,
+        # including nodes of the same product
+        async_add_sensors(hass, entry, nodes[unicast_addr_key], sensor_descriptors)
+        for waiting_addr_key in fetch_templates[template_key(cfg_model.device)]:
+            descriptors.async_set(waiting_addr_key, sensor_descriptors)
+            async_add_sensors(hass, entry, nodes[waiting_addr_key], sensor_descriptors)
+        return True
+
+    if fetch:
+        results = await asyncio.gather(*(fetch_descriptors(key) for key in fetch))
+        result = result and all(results)
 
     _LOGGER.debug(f"load_sensors_config(): finished, result={result}")
 
     return result
 
 
+@callback
+def async_add_sensors(
+    hass: HomeAssistant,
+    entry: BtMeshConfigEntry,
+    cfg_models: list[MeshCfgModel],
+    sensor_descriptors: list[dict]
+) -> None:
+    """Create sensor entities of the node models for the descriptors."""
+    # cadence is set through the Sensor Setup Server of the node
+    sensor_setup = any(
+        cfg_model.model_id == BtMeshModelId.SensorSetupServer for cfg_model in cfg_models
+    )
+    for cfg_model in cfg_models:
+        try:
+            node_conf = entry.runtime_data.domain_conf[CONF_NODES][f"{cfg_model.unicast_addr:04x}"]
+        except KeyError:
+            node_conf = {}
+
+        for propery in sensor_descriptors:
+            unique_id = BtMeshEntity.unique_id_sensor(cfg_model, to_property_id(propery["sensor_property_id"]))
+
+            # skip already discovered sensors
+            if unique_id in entry.runtime_data.discovered:
+                _LOGGER.debug(f"    {unique_id} already discovered")
+                continue
+
+            async_dispatcher_send(
+                hass,
+                BT_MESH_DISCOVERY_ENTITY_NEW.format(cfg_model.model_id),
+                *(entry.runtime_data.app, cfg_model, propery, node_conf, sensor_setup)
+            )
+
+            # mark sensor discovered
+            entry.runtime_data.discovered.add(unique_id)
+
+
+async def apply_mesh_diff(
+    hass: HomeAssistant,
+    entry: BtMeshConfigEntry,
+    mesh_diff: MeshConfDiff
+) -> None:
+    """Remove entities and devices of the deleted or unbinded models and
+       update entities of the changed ones, using registry indexes."""
+    entity_registry = er.async_get(hass)
+    device_registry = dr.async_get(hass)
+
+    descriptors = entry.runtime_data.descriptors
+
+    for cfg_model in mesh_diff.models_removed:
+        for unique_id in entity_unique_ids(cfg_model, descriptors):
+            for platform in PLATFORMS:
+                entity_id = entity_registry.async_get_entity_id(platform, DOMAIN, unique_id)
+                if entity_id is not None:
+                    _LOGGER.debug(f"remove entity: {entity_id}")
+                    entity_registry.async_remove(entity_id)
+            entry.runtime_data.discovered.discard(unique_id)
+
+    for cfg_model in mesh_diff.models_changed:
+        async_dispatcher_send(
+            hass,
+            BT_MESH_MODEL_UPDATED.format(cfg_model.unique_id),
+            cfg_model
+        )
+
+    for cfg_device in mesh_diff.devices_removed:
+        device_entry = device_registry.async_get_device(
+            identifiers={(DOMAIN, str(cfg_device.unique_id))}
+        )
+        descriptors.async_pop(f"{cfg_device.unicast_addr:04x}")
+        entry.runtime_data.sensor_cadence.async_pop_node(f"{cfg_device.unicast_addr:04x}")
+        entry.runtime_data.thermostat_ranges.async_pop_node(f"{cfg_device.unicast_addr:04x}")
+        entry.runtime_data.descriptors_backoff.succeeded(f"{cfg_device.unicast_addr:04x}")
+        discard_device_info(cfg_device)
+        if device_entry is not None:
+            device_registry.async_remove_device(device_entry.id)
+            _LOGGER.debug(f"removed_device: id={device_entry.id}")
+
+
+def entity_unique_ids(cfg_model: MeshCfgModel, descriptors: BtMeshSensorDescriptors) -> list[str]:
+    """Unique id of the entities created for the model."""
+    if cfg_model.model_id in SENSOR_MODELS:
+        return [
+            BtMeshEntity.unique_id_sensor(cfg_model, to_property_id(propery["sensor_property_id"]))
+                for propery in descriptors.get(f"{cfg_model.unicast_addr:04x}", ())
+        ]
+    return [BtMeshEntity.unique_id_generic(cfg_model)]
+
+
 async def cleanup_entity_registry(hass: HomeAssistant, entry: BtMeshConfigEntry) -> None:
     """Remove deleted or unbinded models from entity registry."""
     mesh_conf =  entry.runtime_data.mesh_conf
     entity_registry = er.async_get(hass)
 
-    # get descriptors from persistent storage
-    descriptors_store: Store[dict[int, Any]] = Store(hass, 1, STORAGE_SENSOR_DESCRIPTORS)
-    descriptors = await descriptors_store.async_load()
+    descriptors = entry.runtime_data.descriptors
 
     # load list of entities unique id from Bed Mesh config
     configured_models = set()
@@ -342,19 +836,27 @@ async def cleanup_entity_registry(hass: HomeAssistant, entry: BtMeshConfigEntry)
         if cfg_model.model_id in SENSOR_MODELS:
             unicast_addr_key = f"{cfg_model.unicast_addr:04x}"
             if unicast_addr_key in descriptors:
-                for propery in descriptors[unicast_addr_key]:
+                for propery in descriptors.get(unicast_addr_key):
                     configured_models.add(
                         BtMeshEntity.unique_id_sensor(
                             cfg_model,
-                            PropertyID(propery["sensor_property_id"])
+                            to_property_id(propery["sensor_property_id"])
                         )
                     )
         else:
             configured_models.add(BtMeshEntity.unique_id_generic(cfg_model))
 
-    # remove unused entities from registry
+    # remove unused entities from registry, the network entities (scenes,
+    # metric sensors) are not bound to a model, the metric sensors are
+    # removed when they are disabled in the configuration
+    metric_sensors = entry.runtime_data.domain_conf[CONF_METRIC_SENSORS]
     entries = er.async_entries_for_config_entry(entity_registry, entry.entry_id)
     for reg_entry in entries:
+        if reg_entry.unique_id.startswith(f"{entry.entry_id}-metrics-"):
+            if metric_sensors:
+                continue
+        elif reg_entry.unique_id.startswith(f"{entry.entry_id}-"):
+            continue
         if reg_entry.unique_id not in configured_models:
             _LOGGER.debug(f"remove entity: {reg_entry.entity_id}")
             entity_registry.async_remove(reg_entry.entity_id)
@@ -366,30 +868,44 @@ async def cleanup_device_registry(hass: HomeAssistant, entry: BtMeshConfigEntry)
     mesh_conf =  entry.runtime_data.mesh_conf
     device_registry = dr.async_get(hass)
 
-    # get descriptors from persistent storage
-    descriptors_store: Store[dict[int, Any]] = Store(hass, 1, STORAGE_SENSOR_DESCRIPTORS)
-    descriptors = await descriptors_store.async_load()
+    descriptors = entry.runtime_data.descriptors
 
+    cfg_devices = mesh_conf.get_devices()
     provisioned_devices: set[str] = set(
-        [str(cfg_device.unique_id) for cfg_device in mesh_conf.get_devices()]
+        [str(cfg_device.unique_id) for cfg_device in cfg_devices]
     )
+    prune_device_info(cfg_devices)
 
     device_registry = dr.async_get(hass)
     for device_entry in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
         for identifier in device_entry.identifiers:
             if identifier[0] == DOMAIN and identifier[1] not in provisioned_devices:
                 unicast_addr_key = device_entry.name.removeprefix(f"{DOMAIN}_")
-                descriptors.pop(unicast_addr_key, None)
+                descriptors.async_pop(unicast_addr_key)
+                entry.runtime_data.sensor_cadence.async_pop_node(unicast_addr_key)
+                entry.runtime_data.thermostat_ranges.async_pop_node(unicast_addr_key)
                 device_registry.async_remove_device(device_entry.id)
                 _LOGGER.debug(f"removed_device: id={device_entry.id}")
 
-    # save updated descriptors to persistent strage
-    await descriptors_store.async_save(descriptors)
-
 
 async def async_unload_entry(hass: HomeAssistant, entry: BtMeshConfigEntry) -> bool:
     """Unloading the BT Mesh platforms."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        app = entry.runtime_data.app
-        await app.dbus_disconnect()
+        entry.runtime_data.scheduler.async_stop()
+        if entry.runtime_data.retry_unsub is not None:
+            entry.runtime_data.retry_unsub()
+            entry.runtime_data.retry_unsub = None
+        await entry.runtime_data.state_store.async_unload()
+        for app in entry.runtime_data.shards.apps:
+            await app.dbus_disconnect()
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: BtMeshConfigEntry) -> None:
+    """Remove the persistent data of the BT Mesh entry."""
+    await BtMeshStateStore(hass, entry.entry_id).async_remove()
+    await BtMeshSensorCadence(hass, entry.entry_id).async_remove()
+    await BtMeshThermostatRanges(hass, entry.entry_id).async_remove()
+    await BtMeshSensorDescriptors(
+        hass, entry.entry_id, hass.data[DOMAIN][BT_MESH_DESCRIPTOR_TEMPLATES]
+    ).async_remove()
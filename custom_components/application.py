@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from uuid import UUID
 
 #from dataclasses import asdict, dataclass, field
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 
@@ -26,10 +28,12 @@ from bluetooth_mesh.models.vendor.thermostat import ThermostatClient
 from bluetooth_mesh.models.time import TimeServer, TimeSetupServer
 from bluetooth_mesh.messages.generic.onoff import GenericOnOffOpcode
 from bluetooth_mesh.messages.generic.battery import GenericBatteryOpcode
+from bluetooth_mesh.messages.generic.level import GenericLevelOpcode
 from bluetooth_mesh.messages.light.lightness import LightLightnessOpcode
 from bluetooth_mesh.messages.light.ctl import LightCTLOpcode
 from bluetooth_mesh.messages.light.hsl import LightHSLOpcode
 from bluetooth_mesh.messages.sensor import SensorOpcode, SensorSetupOpcode
+from bluetooth_mesh.messages.scene import SceneOpcode
 from bluetooth_mesh.messages.vendor.thermostat import (
     ThermostatOpcode,
     ThermostatSubOpcode,
@@ -41,15 +45,32 @@ from bluetooth_mesh.messages.properties import PropertyID
 from bt_mesh_ctrl import BtMeshModelId, BtMeshOpcode
 
 from .time_server import TimeServerMixin
+from .shards import BtMeshReachability, BtMeshMessageDedup
+from .traffic import BtMeshTrafficLog, TRAFFIC_IN, TRAFFIC_OUT
+from .metrics import (
+    BtMeshMetrics,
+    METRIC_QUEUE_WAIT,
+    METRIC_GET_QUEUE_DEPTH,
+    node_label,
+)
 from .const import (
     DEFAULT_DBUS_APP_PATH,
     G_SEND_INTERVAL,
     G_TIMEOUT,
     G_UNACK_RETRANSMISSIONS,
     G_UNACK_INTERVAL,
+    G_SENSOR_DESCRIPTORS_TIMEOUT,
+    G_RECONNECT_MIN_DELAY,
+    G_RECONNECT_MAX_DELAY,
+    G_RECONNECT_REQUEST_WAIT,
+    DOMAIN,
     BT_MESH_MSG,
+    BT_MESH_RECONNECTED,
 )
 
+if TYPE_CHECKING:
+    from .trace import BtMeshTraceRecorder
+
 import logging
 _LOGGER = logging.getLogger(__name__)
 
@@ -99,6 +120,22 @@ class MainElement(Element):
         TimeSetupServer
     ]
 
+    def message_received(
+        self,
+        source: int,
+        app_index: int,
+        destination: Union[int, UUID],
+        data: bytes
+    ):
+        self.application.traffic.record(TRAFFIC_IN, source, destination, data)
+        # the models dispatch the parsed message synchronously, the raw
+        # payload is the dedup key of the message callback
+        self.application._received_payload = data
+        try:
+            super().message_received(source, app_index, destination, data)
+        finally:
+            self.application._received_payload = None
+
 
 class BtMeshApplication(Application, TimeServerMixin):
     COMPANY_ID = 0x05f1  # Linux Foundation
@@ -115,10 +152,16 @@ class BtMeshApplication(Application, TimeServerMixin):
     _token_ring: SimpleTokenRing
     _uuid: str
     hass: HomeAssistant
+    metrics: BtMeshMetrics
+    traffic: BtMeshTrafficLog
+    trace: BtMeshTraceRecorder | None
+    reachability: BtMeshReachability
+    dedup: BtMeshMessageDedup | None
 
     subs = (
         (GenericOnOffClient, GenericOnOffOpcode.GENERIC_ONOFF_STATUS),
         (GenericBatteryClient, GenericBatteryOpcode.GENERIC_BATTERY_STATUS),
+        (GenericLevelClient, GenericLevelOpcode.GENERIC_LEVEL_STATUS),
         (SensorClient, SensorOpcode.SENSOR_STATUS),
         (SensorClient, SensorOpcode.SENSOR_DESCRIPTOR_STATUS),
         (LightLightnessClient, LightLightnessOpcode.LIGHT_LIGHTNESS_STATUS),
@@ -127,8 +170,35 @@ class BtMeshApplication(Application, TimeServerMixin):
         (LightHSLClient, LightHSLOpcode.LIGHT_HSL_STATUS),
         (LightHSLClient, LightHSLOpcode.LIGHT_HSL_TARGET_STATUS),
         (ThermostatClient, ThermostatOpcode.VENDOR_THERMOSTAT),
+        (SceneClient, SceneOpcode.SCENE_STATUS),
+        (SceneClient, SceneOpcode.SCENE_REGISTER_STATUS),
     )
 
+    # status messages confirming the state of the SET requests, the first
+    # one completes the SET, the Generic Level changes are confirmed by the
+    # Level Status of the node or by the status of the light model bound
+    # to the level
+    confirm_opcodes = {
+        "generic_onoff_set": (GenericOnOffOpcode.GENERIC_ONOFF_STATUS,),
+        "generic_level_delta_set": (
+            GenericLevelOpcode.GENERIC_LEVEL_STATUS,
+            LightLightnessOpcode.LIGHT_LIGHTNESS_STATUS,
+            LightCTLOpcode.LIGHT_CTL_STATUS,
+            LightHSLOpcode.LIGHT_HSL_STATUS,
+        ),
+        "generic_level_move_set": (
+            GenericLevelOpcode.GENERIC_LEVEL_STATUS,
+            LightLightnessOpcode.LIGHT_LIGHTNESS_STATUS,
+            LightCTLOpcode.LIGHT_CTL_STATUS,
+            LightHSLOpcode.LIGHT_HSL_STATUS,
+        ),
+        "light_lightness_set": (LightLightnessOpcode.LIGHT_LIGHTNESS_STATUS,),
+        "light_ctl_set": (LightCTLOpcode.LIGHT_CTL_STATUS,),
+        "light_hsl_set": (LightHSLOpcode.LIGHT_HSL_STATUS, LightHSLOpcode.LIGHT_HSL_TARGET_STATUS),
+        "scene_store": (SceneOpcode.SCENE_REGISTER_STATUS,),
+        "thermostat_set": (ThermostatOpcode.VENDOR_THERMOSTAT,),
+    }
+
 
     def __init__(self, hass, uuid, path, token=None):
         """Initialize bluetooth_mesh application."""
@@ -143,6 +213,29 @@ class BtMeshApplication(Application, TimeServerMixin):
         self.pin_cb = None
 
         self._lock_get = asyncio.Lock()
+        self._get_waiting = 0
+
+        self.metrics = BtMeshMetrics(send_interval=G_SEND_INTERVAL)
+        self.metrics.set_gauge(METRIC_GET_QUEUE_DEPTH, lambda: self.queue_depth)
+
+        self.traffic = BtMeshTrafficLog()
+        self._handlers_registered = False
+        self.trace = None
+
+        self.reachability = BtMeshReachability()
+        # shared by the sharded instances, set by the shard router
+        self.dedup = None
+        # access payload of the message being dispatched
+        self._received_payload: bytes | None = None
+
+        # bluetooth-meshd connection, the requests wait for it and the SET
+        # requests are kept to be sent on reconnect, the latest per node
+        # and request
+        self._connected = asyncio.Event()
+        self._connected.set()
+        self._reconnect_task: asyncio.Task | None = None
+        self._pending_sets: dict[tuple[int, str], tuple[Callable, tuple, dict]] = {}
+        self.reconnects = 0
 
         super().__init__(self.hass.loop)
 
@@ -156,15 +249,99 @@ class BtMeshApplication(Application, TimeServerMixin):
     def token_ring(self) -> SimpleTokenRing:
         return self._token_ring
 
+    @property
+    def queue_depth(self) -> int:
+        """GET requests waiting for the request lock."""
+        return self._get_waiting
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    @property
+    def pending_sets(self) -> int:
+        return len(self._pending_sets)
+
     def dbus_disconnected(self, owner) -> any:
-        pass
+        """bluetooth-meshd left the bus, attach again when it's back. The
+           application, entities and subscriptions are kept."""
+        self.hass.loop.call_soon_threadsafe(self._async_disconnected)
+
+    def _async_disconnected(self) -> None:
+        _LOGGER.warning(f"{self.PATH}: bluetooth-meshd disconnected, reconnecting")
+        self._connected.clear()
+        if self._reconnect_task is None:
+            self._reconnect_task = self.hass.async_create_background_task(
+                self._async_reconnect(),
+                f"{DOMAIN}_reconnect_{self.PATH}"
+            )
+
+    async def _async_reconnect(self) -> None:
+        """Attach with exponential backoff, then send the pending SET
+           requests and signal the entities to refresh."""
+        delay = G_RECONNECT_MIN_DELAY
+        try:
+            while True:
+                await asyncio.sleep(delay)
+                try:
+                    await self.connect()
+                except Exception as e:
+                    _LOGGER.debug(f"{self.PATH}: reconnect failed: {repr(e)}, retry in {delay}s")
+                    delay = min(delay * 2, G_RECONNECT_MAX_DELAY)
+                    continue
+                break
+        finally:
+            self._reconnect_task = None
+
+        self.reconnects += 1
+        reconnected = time.time()
+        self._connected.set()
+        _LOGGER.info(f"{self.PATH}: bluetooth-meshd reconnected, replay {len(self._pending_sets)} requests")
+
+        # a request is kept again if the connection is lost during replay
+        while self._pending_sets and self._connected.is_set():
+            key = next(iter(self._pending_sets))
+            destination, name = key
+            request, args, kwargs = self._pending_sets.pop(key)
+            try:
+                await request(*args, **kwargs)
+            except Exception as e:
+                _LOGGER.error(f"{self.PATH}: failed to replay {name} to {node_label(destination)}: {repr(e)}")
+
+        async_dispatcher_send(self.hass, BT_MESH_RECONNECTED, self, reconnected)
+
+    async def _wait_connected(self) -> bool:
+        """Wait for bluetooth-meshd to reconnect, False if it's still away."""
+        if self._connected.is_set():
+            return True
+        try:
+            await asyncio.wait_for(self._connected.wait(), G_RECONNECT_REQUEST_WAIT)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def dbus_disconnect(self) -> None:
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        await super().dbus_disconnect()
 
     def _register(self):
         super()._register()
 
+        # the models keep the handlers over the reconnects to bluetooth-meshd,
+        # registered again they would handle each message once more
+        if self._handlers_registered:
+            return
+        self._handlers_registered = True
+
         # start Time Server
         self.time_server_init()
 
+        # log outbound messages of all models
+        for model_class in MainElement.MODELS:
+            self._log_outbound(self.elements[0][model_class])
+
         # register message callbacks on all supported opcodes
         for sub in self.subs:
             client = self.elements[0][sub[0]]
@@ -172,6 +349,16 @@ class BtMeshApplication(Application, TimeServerMixin):
             client.app_message_callbacks[opcode].add(self._bt_mesh_msg_callback)
 
 
+    def _log_outbound(self, model: Model) -> None:
+        send_app = model.send_app
+
+        async def wrapper(destination: int, app_index: int, data: bytes, *args, **kwargs):
+            self.traffic.record(TRAFFIC_OUT, None, destination, data)
+            return await send_app(destination, app_index, data, *args, **kwargs)
+
+        model.send_app = wrapper
+
+
     ##################################################
     def display_numeric(self, type: str, number: int):
         """Application callback to show requested PIN code."""
@@ -197,6 +384,17 @@ class BtMeshApplication(Application, TimeServerMixin):
         message: ParsedMeshMessage
     ):
         """Passing messages to Bt mesh entities."""
+        self.metrics.state_confirmed(node_label(source), message.opcode)
+        self.reachability.observe(source, True)
+        # the sharded instances receive the same messages, the entities
+        # get the first copy
+        payload = self._received_payload
+        if self.dedup is not None and payload is not None and self.dedup.duplicate(
+            (source, payload), time.monotonic()
+        ):
+            return
+        if self.trace is not None:
+            self.trace.record(source, app_index, destination, message)
         async_dispatcher_send(
             self.hass,
             BT_MESH_MSG.format(source, message.opcode),
@@ -211,23 +409,94 @@ class BtMeshApplication(Application, TimeServerMixin):
            preventing a large number of simultaneous requests."""
         async def wrapper(*args, **kwargs):
             self = args[0]
-            async with self._lock_get:
+            if not await self._wait_connected():
+                return None
+            node = node_label(kwargs.get("destination"))
+            request = query_func.__name__
+            queued = time.monotonic()
+            self._get_waiting += 1
+            try:
+                await self._lock_get.acquire()
+            finally:
+                self._get_waiting -= 1
+            try:
+                started = time.monotonic()
+                self.metrics.observe(METRIC_QUEUE_WAIT, node, request, started - queued)
                 try:
-                    return await query_func(*args, **kwargs)
+                    result = await query_func(*args, **kwargs)
                 except asyncio.TimeoutError:
-                    pass
+                    self.metrics.request_done(node, request, started, timeout=True)
+                    self.reachability.observe(kwargs.get("destination"), False)
+                else:
+                    self.metrics.request_done(node, request, started, timeout=False)
+                    self.reachability.observe(kwargs.get("destination"), True)
+                    return result
+            finally:
+                self._lock_get.release()
             return None
         return wrapper
 
+    def bluetooth_mesh_fetch(query_func):
+        """Decorator for the one-time requests sent outside the global GET
+           lock, the caller limits the number of simultaneous requests."""
+        async def wrapper(*args, **kwargs):
+            self = args[0]
+            if not await self._wait_connected():
+                return None
+            node = node_label(kwargs.get("destination"))
+            request = query_func.__name__
+            started = time.monotonic()
+            try:
+                result = await query_func(*args, **kwargs)
+            except asyncio.TimeoutError:
+                self.metrics.request_done(node, request, started, timeout=True)
+                self.reachability.observe(kwargs.get("destination"), False)
+                return None
+            self.metrics.request_done(node, request, started, timeout=False)
+            self.reachability.observe(kwargs.get("destination"), True)
+            return result
+        return wrapper
+
+    def bluetooth_mesh_unack(query_func):
+        """Decorator for the unacknowledged requests, they wait for
+           bluetooth-meshd to reconnect and are dropped if it's still away."""
+        async def wrapper(*args, **kwargs):
+            self = args[0]
+            if not await self._wait_connected():
+                _LOGGER.warning(
+                    f"{self.PATH}: bluetooth-meshd is disconnected, "
+                    f"{query_func.__name__} to {node_label(kwargs.get('destination'))} is not sent"
+                )
+                return None
+            return await query_func(*args, **kwargs)
+        return wrapper
+
     def bluetooth_mesh_set(query_func):
         """Decorator for setting the state of a Bt grid model
            with handling of the Timeout exception."""
         async def wrapper(*args, **kwargs):
             self = args[0]
+            node = node_label(kwargs.get("destination"))
+            request = query_func.__name__
+            started = time.monotonic()
+            # confirmed by the status message of the node, not by the ack
+            self.metrics.set_started(node, request, started, self.confirm_opcodes.get(request, ()))
+            if not self._connected.is_set():
+                # the latest SET of the node and request is sent on
+                # reconnect, the entity keeps its optimistic state until then
+                key = (kwargs.get("destination"), request)
+                self._pending_sets.pop(key, None)
+                self._pending_sets[key] = (wrapper, args, kwargs)
+                return None
             try:
-                return await query_func(*args, **kwargs)
+                result = await query_func(*args, **kwargs)
             except asyncio.TimeoutError:
-                pass
+                self.metrics.request_done(node, request, started, timeout=True)
+                self.reachability.observe(kwargs.get("destination"), False)
+            else:
+                self.metrics.request_done(node, request, started, timeout=False)
+                self.reachability.observe(kwargs.get("destination"), True)
+                return result
             return None
         return wrapper
 
@@ -263,6 +532,48 @@ class BtMeshApplication(Application, TimeServerMixin):
             timeout=G_TIMEOUT
         )
 
+    # GenericLevel, bound to the lightness of the light nodes
+    @bluetooth_mesh_set
+    async def generic_level_delta_set(
+        self,
+        destination: int,
+        app_index: int,
+        delta_level: int,
+        transition_time: float=None
+    ) -> any:
+        """Change GenericLevel state by delta"""
+        client = self.elements[0][GenericLevelClient]
+        return await client.delta_set(
+            destination=destination,
+            app_index=app_index,
+            delta_level=delta_level,
+            delay=None if transition_time is None else 0,
+            transition_time=transition_time,
+            send_interval=G_SEND_INTERVAL,
+            timeout=G_TIMEOUT
+        )
+
+    @bluetooth_mesh_set
+    async def generic_level_move_set(
+        self,
+        destination: int,
+        app_index: int,
+        delta_level: int,
+        transition_time: float
+    ) -> any:
+        """Move GenericLevel state by delta_level per transition_time,
+           zero delta stops the move"""
+        client = self.elements[0][GenericLevelClient]
+        return await client.move_set(
+            destination=destination,
+            app_index=app_index,
+            delta_level=delta_level,
+            delay=0,
+            transition_time=transition_time,
+            send_interval=G_SEND_INTERVAL,
+            timeout=G_TIMEOUT
+        )
+
     # LightLightness
     @bluetooth_mesh_get
     async def light_lightness_get(self, destination: int, app_index: int) -> any:
@@ -328,22 +639,18 @@ class BtMeshApplication(Application, TimeServerMixin):
         transition_time: float=None
     ) -> any:
         """Set LightCTL state"""
-        try:
-            client = self.elements[0][LightCTLClient]
-            return await client.set(
-                destination=destination,
-                app_index=app_index,
-                ctl_lightness=ctl_lightness,
-                ctl_temperature=ctl_temperature,
-                ctl_delta_uv=0,
-                delay=None if transition_time is None else 0,
-                transition_time=transition_time,
-                send_interval=G_SEND_INTERVAL,
-                timeout=G_TIMEOUT
-            )
-        except asyncio.TimeoutError:
-            pass
-        return None
+        client = self.elements[0][LightCTLClient]
+        return await client.set(
+            destination=destination,
+            app_index=app_index,
+            ctl_lightness=ctl_lightness,
+            ctl_temperature=ctl_temperature,
+            ctl_delta_uv=0,
+            delay=None if transition_time is None else 0,
+            transition_time=transition_time,
+            send_interval=G_SEND_INTERVAL,
+            timeout=G_TIMEOUT
+        )
 
     # LightHSL
     @bluetooth_mesh_get
@@ -405,14 +712,16 @@ class BtMeshApplication(Application, TimeServerMixin):
         )
 
     # Sensor
-    @bluetooth_mesh_get
+    @bluetooth_mesh_fetch
     async def sensor_descriptor_get(self, destination: int, app_index: int) -> any:
+        """Get Sensor Descriptors, fetched once per node, the segmented
+           status has its own timeout"""
         client = self.elements[0][SensorClient]
         return await client.descriptor_get(
             destination=destination,
             app_index=app_index,
             send_interval=G_SEND_INTERVAL,
-            timeout=G_TIMEOUT
+            timeout=G_SENSOR_DESCRIPTORS_TIMEOUT
         )
 
     @bluetooth_mesh_get
@@ -435,6 +744,82 @@ class BtMeshApplication(Application, TimeServerMixin):
                     return property
         return None
 
+    @bluetooth_mesh_set
+    async def sensor_cadence_set(
+        self,
+        destination: int,
+        app_index: int,
+        property_id: PropertyID,
+        fast_cadence_period_divisor: int,
+        status_trigger_type: int,
+        status_trigger_delta_down: float,
+        status_trigger_delta_up: float,
+        status_min_interval: int,
+        fast_cadence_low: float,
+        fast_cadence_high: float
+    ) -> any:
+        """Set Sensor Cadence of the property"""
+        client = self.elements[0][SensorClient]
+        return await client.cadence_set(
+            destination=destination,
+            app_index=app_index,
+            property_id=property_id,
+            fast_cadence_period_divisor=fast_cadence_period_divisor,
+            status_trigger_type=status_trigger_type,
+            status_trigger_delta_down=status_trigger_delta_down,
+            status_trigger_delta_up=status_trigger_delta_up,
+            status_min_interval=status_min_interval,
+            fast_cadence_low=fast_cadence_low,
+            fast_cadence_high=fast_cadence_high,
+            send_interval=G_SEND_INTERVAL,
+            timeout=G_TIMEOUT
+        )
+
+
+    # Scene
+    @bluetooth_mesh_get
+    async def scene_register_get(self, destination: int, app_index: int) -> any:
+        """Get Scene Register state"""
+        client = self.elements[0][SceneClient]
+        return await client.register_get(
+            destination=destination,
+            app_index=app_index,
+            send_interval=G_SEND_INTERVAL,
+            timeout=G_TIMEOUT
+        )
+
+    @bluetooth_mesh_set
+    async def scene_store(self, destination: int, app_index: int, scene_number: int) -> any:
+        """Store the current node state as the scene, returns Scene Register state"""
+        client = self.elements[0][SceneClient]
+        return await client.store(
+            destination=destination,
+            app_index=app_index,
+            scene_number=scene_number,
+            send_interval=G_SEND_INTERVAL,
+            timeout=G_TIMEOUT
+        )
+
+    @bluetooth_mesh_unack
+    async def scene_recall(
+        self,
+        destination: int,
+        app_index: int,
+        scene_number: int,
+        transition_time: float=None
+    ) -> None:
+        """Recall the scene with unacknowledged message, the destination is
+           usually a group address"""
+        client = self.elements[0][SceneClient]
+        await client.recall_unack(
+            destination=destination,
+            app_index=app_index,
+            scene_number=scene_number,
+            delay=None if transition_time is None else 0,
+            transition_time=transition_time,
+            retransmissions=G_UNACK_RETRANSMISSIONS,
+            send_interval=G_UNACK_INTERVAL
+        )
 
     # Vendor Thermostat
     @bluetooth_mesh_get
@@ -459,6 +844,38 @@ class BtMeshApplication(Application, TimeServerMixin):
             timeout=G_TIMEOUT
         )
 
+    @bluetooth_mesh_get
+    async def thermostat_state_get(
+        self,
+        destination: int,
+        app_index: int,
+        with_range: bool=False
+    ) -> tuple[any, any]:
+        """Get Vendor Thermostat state and temperature range in one request
+           slot. Both requests share the VENDOR_THERMOSTAT opcode, the status
+           is matched by the opcode only, so the range is requested after
+           the state is received. Returns the state and the range, None if
+           it's not answered."""
+        client = self.elements[0][ThermostatClient]
+        state = await client.get(
+            destination=destination,
+            app_index=app_index,
+            send_interval=G_SEND_INTERVAL,
+            timeout=G_TIMEOUT
+        )
+        temperature_range = None
+        if with_range:
+            try:
+                temperature_range = await client.range_get(
+                    destination=destination,
+                    app_index=app_index,
+                    send_interval=G_SEND_INTERVAL,
+                    timeout=G_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                _LOGGER.debug(f"thermostat range of {destination:04x} is not received")
+        return state, temperature_range
+
     @bluetooth_mesh_set
     async def thermostat_set(
         self,
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from typing import TYPE_CHECKING
 
 from construct import Container
 
@@ -22,7 +23,6 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 
-from bluetooth_mesh.models.vendor.thermostat import ThermostatClient
 from bluetooth_mesh.messages.vendor.thermostat import (
     ThermostatOpcode,
     ThermostatSubOpcode,
@@ -32,7 +32,6 @@ from bluetooth_mesh.messages.vendor.thermostat import (
 
 from bt_mesh_ctrl import BtMeshModelId
 
-from .application import BtMeshApplication
 from .entity import BtMeshEntity
 from .const import (
     BT_MESH_DISCOVERY_ENTITY_NEW,
@@ -43,8 +42,13 @@ from .const import (
     G_MESH_CACHE_INVALIDATE_TIMEOUT,
     G_SEND_INTERVAL,
     G_TIMEOUT,
+    REFRESH_PRIORITY_CLIMATE,
 )
 
+if TYPE_CHECKING:
+    from .application import BtMeshApplication
+    from .thermostat_ranges import BtMeshThermostatRanges
+
 import logging
 _LOGGER = logging.getLogger(__name__)
 
@@ -98,6 +102,8 @@ class BtMeshClimate_Thermostat(BtMeshEntity, ClimateEntity):
         ThermostatOpcode.VENDOR_THERMOSTAT,
     )
 
+    refresh_priority = REFRESH_PRIORITY_CLIMATE
+
     _attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT]
     _attr_supported_features = (
         ClimateEntityFeature.TARGET_TEMPERATURE
@@ -108,7 +114,9 @@ class BtMeshClimate_Thermostat(BtMeshEntity, ClimateEntity):
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
 
     _flag_update_range = True
+    _ranges: BtMeshThermostatRanges | None = None
 
+    @callback
     def receive_message(
         self,
         source: int,
@@ -124,28 +132,45 @@ class BtMeshClimate_Thermostat(BtMeshEntity, ClimateEntity):
                     #self.update_model_state_thr(vendor_message.thermostat_status)
                     self.update_model_state(vendor_message.thermostat_status)
             case ThermostatSubOpcode.THERMOSTAT_RANGE_STATUS:
-                self._attr_min_temp = vendor_message.thermostat_range_status.min_temperature
-                self._attr_max_temp = vendor_message.thermostat_range_status.max_temperature
+                self.update_range(
+                    vendor_message.thermostat_range_status.min_temperature,
+                    vendor_message.thermostat_range_status.max_temperature
+                )
+                # the thermostat is available once its range is known
+                self.async_write_model_state()
             case _:
                 pass
 
+    async def async_added_to_hass(self) -> None:
+        """Restore the temperature range, it's requested only when unknown."""
+        self._ranges = self.platform.config_entry.runtime_data.thermostat_ranges
+        temperature_range = self._ranges.get(f"{self.unicast_addr:04x}")
+        if temperature_range is not None:
+            self._attr_min_temp, self._attr_max_temp = temperature_range
+            self._flag_update_range = False
+        await super().async_added_to_hass()
+
+    def update_range(self, min_temperature: float, max_temperature: float) -> None:
+        self._attr_min_temp = min_temperature
+        self._attr_max_temp = max_temperature
+        self._flag_update_range = False
+        if self._ranges is not None:
+            self._ranges.async_set(f"{self.unicast_addr:04x}", min_temperature, max_temperature)
 
     async def query_model_state(self) -> any:
-        """Query Vendor Thermostat state."""
-        if self._flag_update_range:
-            result = await self.app.thermostat_range_get(
-                destination=self.unicast_addr,
-                app_index=self.app_key,
-            )
-            if result is not None:
-                self._attr_min_temp = result.min_temperature
-                self._attr_max_temp = result.max_temperature
-                self._flag_update_range = False
-
-        return await self.app.thermostat_get(
+        """Query Vendor Thermostat state, with the range until it's known."""
+        result = await self.app.thermostat_state_get(
             destination=self.unicast_addr,
             app_index=self.app_key,
+            with_range=self._flag_update_range
         )
+        if result is None:
+            return None
+
+        state, temperature_range = result
+        if temperature_range is not None:
+            self.update_range(temperature_range.min_temperature, temperature_range.max_temperature)
+        return state
 
     async def thermostat_set(self, onoff: int, temperature: float) -> any:
         if self.model_state is None:
@@ -171,14 +196,14 @@ class BtMeshClimate_Thermostat(BtMeshEntity, ClimateEntity):
                 )
             )
 
-    async def async_update(self):
-        """Update the data from the thermostat."""
-
-        if self.model_state is not None:
-            self._attr_current_temperature = self.model_state.present_temperature
-            self._attr_target_temperature = self.model_state.target_temperature
-            if self.model_state.onoff_status:
-                if self.model_state.heater_status:
+    @callback
+    def update_attributes(self, state: any) -> None:
+        """Update the data from the thermostat state."""
+        if state is not None:
+            self._attr_current_temperature = state.present_temperature
+            self._attr_target_temperature = state.target_temperature
+            if state.onoff_status:
+                if state.heater_status:
                     self._attr_hvac_action = HVACAction.HEATING
                 else:
                     self._attr_hvac_action = HVACAction.IDLE
@@ -1,12 +1,14 @@
 """Config flow for BT Mesh."""
 
 import asyncio
+from importlib import import_module
 import async_timeout
 import uuid
 import socket
 
 from homeassistant import config_entries
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.storage import STORAGE_DIR
 import voluptuous as vol
 from .const import (
     DOMAIN,
@@ -14,9 +16,10 @@ from .const import (
     CONF_DBUS_APP_PATH,
     CONF_DBUS_APP_TOKEN,
     CONF_MESH_CFGCLIENT_CONFIG_PATH,
-    DEFAULT_MESH_JOIN_TIMEOUT
+    CONF_SIMULATION,
+    DEFAULT_MESH_JOIN_TIMEOUT,
+    SIMULATION_MESH_CONF,
 )
-from .application import BtMeshApplication
 
 import logging
 _LOGGER = logging.getLogger(__name__)
@@ -45,11 +48,26 @@ class BtMeshConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             entry_data = self.hass.data[DOMAIN]
             self.config = entry_data[BT_MESH_CONFIG]
 
+        # simulated network, no provisioning
+        if CONF_SIMULATION in self.config:
+            return self.async_create_entry(
+                title = "Bluetooth Mesh Simulation",
+                data = {
+                    CONF_DBUS_APP_PATH: self.config[CONF_DBUS_APP_PATH],
+                    CONF_DBUS_APP_TOKEN: 0,
+                    CONF_MESH_CFGCLIENT_CONFIG_PATH: self.hass.config.path(STORAGE_DIR, SIMULATION_MESH_CONF),
+                    CONF_SIMULATION: True,
+                }
+            )
+
         # create BT Mesh application
 
         _LOGGER.debug("async_step_user: app=%s" % (self.app))
         if self.app is None:
-            self.app = BtMeshApplication(
+            application = await self.hass.async_add_import_executor_job(
+                import_module, f"{__package__}.application"
+            )
+            self.app = application.BtMeshApplication(
                 hass=self.hass,
                 path=self.config[CONF_DBUS_APP_PATH],
                 # TODO: put derive UUID to application
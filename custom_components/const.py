@@ -11,15 +11,19 @@ PLATFORMS: Final = (
     Platform.LIGHT,
     Platform.SENSOR,
     Platform.CLIMATE,
+    Platform.SCENE,
 )
 
 
 BT_MESH_DISCOVERY_ENTITY_NEW: Final = "bt_mesh_discovery_entity_new.{}"
 BT_MESH_MSG: Final = "bt_mesh_msg.{:x}_{:x}"
 BT_MESH_INVALIDATE: Final = "bt_mesh_invalidate.{:x}"
+BT_MESH_MODEL_UPDATED: Final = "bt_mesh_model_updated.{}"
+BT_MESH_RECONNECTED: Final = "bt_mesh_reconnected"
 
 # domain data keys
 BT_MESH_CONFIG: Final = "config"
+BT_MESH_DESCRIPTOR_TEMPLATES: Final = "descriptor_templates"
 #BT_MESH_APPLICATION: Final = "application"
 #BT_MESH_CFGCLIENT_CONF: Final = "mesh_cfgclient_conf"
 #BT_MESH_ALREADY_DISCOVERED: Final = "bt_mesh_already_discovered"
@@ -34,14 +38,89 @@ CONF_SENSOR_DESCRIPTORS: Final = "sensor_descriptors"
 CONF_PASSIVE: Final = "passive"
 CONF_UPDATE_TIME: Final = "update_time"
 CONF_KEEPALIVE_TIME: Final = "keepalive_time"
+CONF_CADENCE: Final = "cadence"
+CONF_SENSOR_CADENCE: Final = "sensor_cadence"
+CONF_PUSH_ONLY: Final = "push_only"
+CONF_METRIC_SENSORS: Final = "metric_sensors"
+CONF_SIMULATION: Final = "simulation"
+CONF_WATCHDOG: Final = "watchdog"
+CONF_WATCHDOG_THRESHOLD: Final = "threshold"
+CONF_WATCHDOG_INTERVAL: Final = "interval"
+CONF_SCENES: Final = "scenes"
+CONF_SCENE_ADDRESS: Final = "address"
+CONF_SCENE_NAMES: Final = "names"
+CONF_TIME_SERVER: Final = "time_server"
+CONF_TIME_ADDRESS: Final = "address"
+CONF_TIME_APP_KEY: Final = "app_key"
+CONF_TIME_PERIOD: Final = "period"
+CONF_SHARDS: Final = "shards"
+CONF_SHARD_RANGES: Final = "unicast_ranges"
+CONF_SHARD_ROUTING: Final = "shard_routing"
+
+# simulation config keys
+CONF_SIM_NODES: Final = "nodes"
+CONF_SIM_MODELS: Final = "models"
+CONF_SIM_LATENCY: Final = "latency"
+CONF_SIM_JITTER: Final = "jitter"
+CONF_SIM_HOPS: Final = "hops"
+CONF_SIM_LOSS: Final = "loss"
+CONF_SIM_PUBLISH_INTERVAL: Final = "publish_interval"
+CONF_SIM_SEGMENT_DELAY: Final = "segment_delay"
+CONF_SIM_SEED: Final = "seed"
+
+# simulated node kinds
+SIM_MODEL_ONOFF: Final = "onoff"
+SIM_MODEL_LIGHTNESS: Final = "lightness"
+SIM_MODEL_CTL: Final = "ctl"
+SIM_MODEL_HSL: Final = "hsl"
+SIM_MODEL_SENSOR: Final = "sensor"
+SIM_MODEL_THERMOSTAT: Final = "thermostat"
+SIM_MODELS: Final = (
+    SIM_MODEL_ONOFF,
+    SIM_MODEL_LIGHTNESS,
+    SIM_MODEL_CTL,
+    SIM_MODEL_HSL,
+    SIM_MODEL_SENSOR,
+    SIM_MODEL_THERMOSTAT,
+)
+
+# request routing across the application instances
+SHARD_ROUTING_STATIC: Final = "static"
+SHARD_ROUTING_REACHABILITY: Final = "reachability"
+SHARD_ROUTINGS: Final = (
+    SHARD_ROUTING_STATIC,
+    SHARD_ROUTING_REACHABILITY,
+)
 
 STORAGE_SENSOR_DESCRIPTORS:Final = "bt_mesh.sensor_descriptors"
+STORAGE_SENSOR_DESCRIPTOR_TEMPLATES: Final = "bt_mesh.sensor_descriptor_templates"
+STORAGE_MODEL_STATES: Final = "bt_mesh.model_states"
+STORAGE_SENSOR_CADENCE: Final = "bt_mesh.sensor_cadence"
+STORAGE_THERMOSTAT_RANGES: Final = "bt_mesh.thermostat_ranges"
 
 # config file defaults
 DEFAULT_DBUS_APP_PATH: Final = "/mesh/homeassistant/client0"
 DEFAULT_MESH_CFGCLIENT_CONFIG_PATH: Final = "~/.config/meshcfg/config_db.json"
 DEFAULT_MESH_JOIN_TIMEOUT: Final = 120
 
+DEFAULT_SIM_NODES: Final = 12
+DEFAULT_SIM_LATENCY: Final = 0.03
+DEFAULT_SIM_JITTER: Final = 0.3
+DEFAULT_SIM_HOPS: Final = 1
+DEFAULT_SIM_LOSS: Final = 0.0
+DEFAULT_SIM_PUBLISH_INTERVAL: Final = 60
+DEFAULT_SIM_SEGMENT_DELAY: Final = 0.03
+SIMULATION_MESH_CONF: Final = "bt_mesh.simulation_db.json"
+
+DEFAULT_WATCHDOG_THRESHOLD: Final = 0.05
+DEFAULT_WATCHDOG_INTERVAL: Final = 0.5
+
+# scenes are recalled on all nodes by default
+DEFAULT_SCENE_ADDRESS: Final = 0xffff
+
+# Time Status publication period, s
+DEFAULT_TIME_PERIOD: Final = 60
+
 DEFAULT_LIGHT_BRIGHTNESS: Final = 128
 DEFAULT_LIGHT_TEMPERATURE: Final = 4600
 
@@ -53,3 +132,95 @@ G_UNACK_INTERVAL: Final = 0.05
 
 G_MESH_CACHE_UPDATE_TIMEOUT: Final = 15
 G_MESH_CACHE_INVALIDATE_TIMEOUT: Final = 360
+
+G_MESH_CONF_DEBOUNCE: Final = 1.0
+G_MESH_CONF_POLL_INTERVAL: Final = 5
+G_MESH_CONF_RETRY_INTERVAL: Final = 5
+
+G_SCENE_REFRESH_DELAY: Final = 2
+G_LEVEL_REFRESH_DELAY: Final = 0.5
+
+# refresh queue workers, the queries are still serialized by the GET lock
+# of the application instance, the shards are queried in parallel
+G_REFRESH_CONCURRENCY: Final = 4
+
+# push-only mode: interval of the outdated model state check, s
+G_STALE_CHECK_INTERVAL: Final = 30
+
+# Time Server: local time zone check interval, s, search horizon of the
+# next DST change, s
+G_TIME_ZONE_CHECK_INTERVAL: Final = 60
+G_TIME_ZONE_CHANGE_HORIZON: Final = 366 * 86400
+
+# bluetooth-meshd reconnect backoff, time the requests wait for it
+G_RECONNECT_MIN_DELAY: Final = 0.5
+G_RECONNECT_MAX_DELAY: Final = 30
+G_RECONNECT_REQUEST_WAIT: Final = 10
+
+# reachability routing: weight of the new request result, score of the
+# instance without results, score gain needed to leave the owner instance,
+# score loss per queued GET request
+G_SHARD_REACHABILITY_ALPHA: Final = 0.2
+G_SHARD_REACHABILITY_PRIOR: Final = 0.5
+G_SHARD_SWITCH_MARGIN: Final = 0.2
+G_SHARD_LOAD_PENALTY: Final = 0.05
+# copies of the message received by several instances within the window
+# are dispatched once
+G_SHARD_DEDUP_WINDOW: Final = 0.5
+G_REFRESH_SEND_INTERVAL: Final = 0.1
+
+# model state refresh priority, lower is first
+REFRESH_PRIORITY_CONTROL: Final = 0
+REFRESH_PRIORITY_CLIMATE: Final = 1
+REFRESH_PRIORITY_SENSOR: Final = 2
+REFRESH_PRIORITY_BATTERY: Final = 3
+
+G_SENSOR_DESCRIPTORS_SAVE_DELAY: Final = 10
+G_SENSOR_DESCRIPTORS_CONCURRENCY: Final = 4
+G_SENSOR_DESCRIPTORS_TIMEOUT: Final = 5
+G_SENSOR_DESCRIPTORS_BACKOFF_MIN: Final = 5
+G_SENSOR_DESCRIPTORS_BACKOFF_MAX: Final = 600
+
+G_THERMOSTAT_RANGES_SAVE_DELAY: Final = 10
+
+# sensor cadence, trigger delta in percent, min interval in seconds
+G_SENSOR_CADENCE_CONCURRENCY: Final = 4
+G_SENSOR_CADENCE_SAVE_DELAY: Final = 10
+G_SENSOR_CADENCE_MIN_DELTA: Final = 1.0
+G_SENSOR_CADENCE_MIN_INTERVAL: Final = 1.0
+# the property with cadence is polled on this interval, in case the
+# node has no publication configured
+G_SENSOR_CADENCE_POLL_INTERVAL: Final = 900
+
+G_MESH_STATE_SAVE_INTERVAL: Final = 300
+G_MESH_STATE_RESTORE_MAX_AGE: Final = 86400
+
+# request latency histogram buckets, seconds
+G_METRICS_LATENCY_BUCKETS: Final = (0.05, 0.1, 0.2, 0.4, 0.6, 1.0, 2.5, 5.0, 10.0)
+G_METRICS_CONFIRM_TIMEOUT: Final = 30
+
+G_TRAFFIC_LOG_SIZE: Final = 512
+G_TRAFFIC_LATENCY_TIMEOUT: Final = 10
+
+G_TRACE_MAX_RECORDS: Final = 100000
+G_TRACE_MAX_DURATION: Final = 3600
+
+G_WATCHDOG_MAX_EVENTS: Final = 50
+G_WATCHDOG_LAG_SAMPLES: Final = 1000
+G_WATCHDOG_STACK_LIMIT: Final = 20
+
+# services
+SERVICE_TRACE_START: Final = "trace_start"
+SERVICE_TRACE_STOP: Final = "trace_stop"
+SERVICE_TRACE_REPLAY: Final = "trace_replay"
+SERVICE_SCENE_STORE: Final = "scene_store"
+SERVICE_LEVEL_STEP: Final = "level_step"
+SERVICE_LEVEL_MOVE: Final = "level_move"
+SERVICE_LEVEL_STOP: Final = "level_stop"
+
+ATTR_CONFIG_ENTRY_ID: Final = "config_entry_id"
+ATTR_FILENAME: Final = "filename"
+ATTR_SPEED: Final = "speed"
+ATTR_MAX_DURATION: Final = "max_duration"
+ATTR_SCENE_NUMBER: Final = "scene_number"
+ATTR_STEP: Final = "step"
@@ -0,0 +1,47 @@
+"""Diagnostics support for BT Mesh."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.core import HomeAssistant
+
+from . import BtMeshConfigEntry
+from .const import CONF_DBUS_APP_TOKEN
+
+
+TO_REDACT = {CONF_DBUS_APP_TOKEN}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,
+    entry: BtMeshConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    runtime_data = entry.runtime_data
+    app = runtime_data.app
+
+    return {
+        "entry": async_redact_data(entry.data, TO_REDACT),
+        "scheduler": runtime_data.scheduler.as_dict(),
+        "cache": {
+            "discovered": len(runtime_data.discovered),
+            "sensor_descriptors": len(runtime_data.descriptors),
+            "sensor_descriptor_templates": runtime_data.descriptors.templates_count,
+            "sensor_cadence": len(runtime_data.sensor_cadence),
+            "thermostat_ranges": len(runtime_data.thermostat_ranges),
+            "descriptors_backoff": runtime_data.descriptors_backoff.as_dict(),
+            "entities": {
+                entity.entity_id: entity.cache_state
+                    for entity in runtime_data.state_store.entities
+            },
+        },
+        "metrics": app.metrics.as_dict(),
+        "traffic": {
+            shard.name: shard.app.traffic.records()
+                for shard in runtime_data.shards.shards
+        },
+        "scenes": None if runtime_data.scenes is None else runtime_data.scenes.as_dict(),
+        "shards": runtime_data.shards.as_dict(),
+        "watchdog": None if runtime_data.watchdog is None else runtime_data.watchdog.as_dict(),
+    }
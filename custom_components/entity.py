@@ -4,12 +4,11 @@ from __future__ import annotations
 import asyncio
 import time
 
-from typing import Union
+from functools import cache
+from typing import TYPE_CHECKING, Union
 from uuid import UUID
 
-from bluetooth_mesh.messages.properties import PropertyID
-from bluetooth_mesh.utils import ParsedMeshMessage
-
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity, DeviceInfo
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
@@ -22,31 +21,92 @@ from bt_mesh_ctrl import (
     BtSensorAttrPropertyId,
 )
 from bt_mesh_ctrl.mesh_cfgclient_conf import MeshCfgModel
-from bt_mesh_ctrl.product import product
-
-from bluetooth_numbers import company
-
-from .application import BtMeshApplication
+from .state_store import BtMeshStateStore
+from .scheduler import BtMeshRefreshScheduler
 from .const import (
     DOMAIN,
+    CONF_PUSH_ONLY,
+    REFRESH_PRIORITY_SENSOR,
     G_MESH_CACHE_UPDATE_TIMEOUT,
     G_MESH_CACHE_INVALIDATE_TIMEOUT,
     BT_MESH_MSG,
     BT_MESH_INVALIDATE,
+    BT_MESH_MODEL_UPDATED,
 )
 
+if TYPE_CHECKING:
+    from bluetooth_mesh.messages.properties import PropertyID
+    from bluetooth_mesh.utils import ParsedMeshMessage
+
+    from .application import BtMeshApplication
+    from .shards import BtMeshShardRouter
+
 import logging
 _LOGGER = logging.getLogger(__name__)
 
 
 
+@cache
+def vendor_tables() -> tuple[dict, dict]:
+    """Company and product name tables, loaded on first use."""
+    from bluetooth_numbers import company
+    from bt_mesh_ctrl.product import product
+    return company, product
+
+
+# device UUID: (device fields the info is built from, device info)
+_device_info_cache: dict[str, tuple[tuple, DeviceInfo]] = {}
+
+
+def device_info(cfg_device: any) -> DeviceInfo:
+    """Device info shared by all entities of the device, built once
+       per device and rebuilt if the device configuration is changed."""
+    key = str(cfg_device.uuid)
+    fields = (cfg_device.unicast_addr, cfg_device.cid, cfg_device.pid, cfg_device.vid)
+    cached = _device_info_cache.get(key)
+    if cached is not None and cached[0] == fields:
+        return cached[1]
+
+    company, product = vendor_tables()
+    unicast_addr, cid, pid, vid = fields
+    info = DeviceInfo(
+        identifiers={(DOMAIN, str(cfg_device.unique_id))},
+        name=f"{DOMAIN}_{unicast_addr:04x}",
+        manufacturer=company[cid] if cid in company else f"{cid:04x}",
+        model=product[(cid, pid)] if (cid, pid) in product else f"{cid:04x}:{pid:04x}",
+        model_id=f"{cid:04x}:{pid:04x}",
+        sw_version=f"{vid:04x}",
+    )
+    _device_info_cache[key] = (fields, info)
+    return info
+
+
+def discard_device_info(cfg_device: any) -> None:
+    """Forget device info of the removed device."""
+    _device_info_cache.pop(str(cfg_device.uuid), None)
+
+
+def prune_device_info(cfg_devices: list) -> None:
+    """Forget device info of the devices not in the list."""
+    keep = {str(cfg_device.uuid) for cfg_device in cfg_devices}
+    for key in [key for key in _device_info_cache if key not in keep]:
+        del _device_info_cache[key]
+
+
+@cache
+def opcode_key(opcode: int) -> str:
+    """Name of the parsed message field of the opcode."""
+    return BtMeshOpcode.get(opcode).name.lower()
+
+
 class ClassNotFoundError(Exception):
     """Factory could not find the class."""
 
 
 class BtMeshEntity(Entity):
     """Basic representation of a BT Mesh service."""
-    app: BtMeshApplication
+    _app: BtMeshApplication
+    _shards: BtMeshShardRouter | None
     cfg_model: MeshCfgModel
     subs: list[([type], [int])]
 
@@ -54,12 +114,18 @@ class BtMeshEntity(Entity):
     update_timeout: float
     invalidate_timeout: float
     passive: bool
+    push_only: bool = False
+    refresh_priority: int = REFRESH_PRIORITY_SENSOR
     #update_threshold = 0.5
 
     _lock: asyncio.Lock
     #_task: asyncio.Task
     _query_task: asyncio.Task
     _last_update: [float | None]
+    _state_restored: bool
+    _state_store: BtMeshStateStore | None
+    _scheduler: BtMeshRefreshScheduler | None
+    _refresh_pending: bool
 
     @staticmethod
     def unique_id_generic(cfg_model: MeshCfgModel) -> str:
@@ -87,21 +153,11 @@ class BtMeshEntity(Entity):
         passive: bool=False
     ) -> None:
         """Initialize model entity."""
-        self.app = app
+        self._app = app
+        self._shards = None
         self.cfg_model = cfg_model
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, str(self.cfg_model.device.unique_id))},
-            name=f"{DOMAIN}_{self.cfg_model.device.unicast_addr:04x}",
-            manufacturer=company[self.cfg_model.device.cid] \
-                if self.cfg_model.device.cid in company \
-                    else f"{self.cfg_model.device.cid:04x}",
-            model=product[(self.cfg_model.device.cid, self.cfg_model.device.pid)] \
-                if (self.cfg_model.device.cid, self.cfg_model.device.pid) in product \
-                    else f"{self.cfg_model.device.cid:04x}:{self.cfg_model.device.pid:04x}",
-            model_id=f"{self.cfg_model.device.cid:04x}:{self.cfg_model.device.pid:04x}",
-            sw_version=f"{self.cfg_model.device.vid:04x}",
-        )
+        self._attr_device_info = device_info(self.cfg_model.device)
         self._attr_unique_id = BtMeshEntity.unique_id_generic(self.cfg_model)
         self._attr_name = BtMeshEntity.name_generic(self.cfg_model)
 
@@ -111,6 +167,10 @@ class BtMeshEntity(Entity):
 
         self._last_update = None
         self._model_state = None
+        self._state_restored = False
+        self._state_store = None
+        self._scheduler = None
+        self._refresh_pending = False
 
         self.invalidate_timeout = invalidate_timeout
         self.update_timeout = update_timeout
@@ -120,9 +180,36 @@ class BtMeshEntity(Entity):
 
         _LOGGER.debug(f"BtMeshEntity: {self.name} invalidate_timeout={invalidate_timeout}, update_timeout={update_timeout}, passive={passive}")
 
+    @property
+    def should_poll(self) -> bool:
+        """Entities of the push-only network are updated by the received
+           messages and the refresh scheduler, not polled by HA."""
+        return not self.push_only
+
+    @property
+    def app(self) -> BtMeshApplication:
+        """Application instance the requests to the node go through."""
+        if self._shards is None:
+            return self._app
+        return self._shards.app_for(self.unicast_addr)
+
     async def async_added_to_hass(self) -> None:
         """Connect to an updater."""
         _LOGGER.debug(f"async_added_to_hass()")
+        runtime_data = self.platform.config_entry.runtime_data
+
+        self.push_only = runtime_data.domain_conf.get(CONF_PUSH_ONLY, False)
+
+        # requests are routed when the nodes are sharded
+        if len(runtime_data.shards) > 1:
+            self._shards = runtime_data.shards
+
+        # timed callbacks are connected when the watchdog is enabled
+        if runtime_data.watchdog is not None:
+            runtime_data.watchdog.instrument(
+                self, "receive_message", "update_model_state", "update_attributes"
+            )
+
         # TODO: rework for coordinator
         if hasattr(self, 'status_opcodes'):
             for opcode in self.status_opcodes:
@@ -138,8 +225,36 @@ class BtMeshEntity(Entity):
             self.invalidate_model_state,
         )
 
-        self._query_model_state()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.app.hass,
+                BT_MESH_MODEL_UPDATED.format(self.cfg_model.unique_id),
+                self.update_cfg_model,
+            )
+        )
+
+        self._state_store = runtime_data.state_store
+        self._state_store.async_register(self)
+        self.restore_model_state(self._state_store.get(self.unique_id))
+
+        # initial query goes through the scheduler budget
+        self._scheduler = runtime_data.scheduler
+        if not self.passive:
+            self._scheduler.async_schedule(self)
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Keep the last model state in the snapshot."""
+        if self._state_store is not None:
+            self._state_store.async_unregister(self)
+
+    @callback
+    def update_cfg_model(self, cfg_model: MeshCfgModel) -> None:
+        """Model configuration is changed, e.g. bound to other application key."""
+        _LOGGER.debug(f"{self.name} configuration updated, app_key={cfg_model.app_key}")
+        self.cfg_model = cfg_model
+        self.invalidate_model_state()
+
+    @callback
     def receive_message(
         self,
         source: int,
@@ -147,9 +262,8 @@ class BtMeshEntity(Entity):
         destination: Union[int, UUID],
         message: ParsedMeshMessage
     ):
-        opcode_name = BtMeshOpcode.get(message.opcode).name.lower()
-        #self.update_model_state_thr(message[opcode_name])
-        self.update_model_state(message[opcode_name])
+        #self.update_model_state_thr(message[opcode_key(message.opcode)])
+        self.update_model_state(message[opcode_key(message.opcode)])
 
     @property
     def unicast_addr(self) -> int:
@@ -166,27 +280,98 @@ class BtMeshEntity(Entity):
         """Bt mesh entity Model Id"""
         return self.cfg_model.model_id
 
+    @property
+    def last_update(self) -> float | None:
+        """Time of the last model state update."""
+        return self._last_update
+
+    @property
+    def cached_model_state(self) -> any:
+        """Last received or restored model state, without the expiry check
+           and the query of the model_state."""
+        return self._model_state
+
+    @property
+    def state_restored(self) -> bool:
+        """The model state is restored from the snapshot, not received."""
+        return self._state_restored
+
+    @property
+    def refresh_pending(self) -> bool:
+        """The model state query is queued in the refresh scheduler."""
+        return self._refresh_pending
+
+    @refresh_pending.setter
+    def refresh_pending(self, value: bool) -> None:
+        self._refresh_pending = value
+
     @property
     def model_state(self) -> any:
         """Model state with cache."""
-        if self._last_update is not None and (self._last_update + self.invalidate_timeout) >= time.time():
-            valid = (self._last_update + self.update_timeout) >= time.time()
-            if not valid and not self.passive:
-                self._query_model_state()
-#            if self.name == "00fc-LightCTLServer":
-#                _LOGGER.debug(f"Get moled state: {self.name}: {self._model_state}")
-            return self._model_state
+        if self._last_update is not None:
+            age = time.time() - self._last_update
+            if age <= self.invalidate_timeout:
+                if age > self.update_timeout and not self.passive:
+                    self._query_model_state()
+#                if self.name == "00fc-LightCTLServer":
+#                    _LOGGER.debug(f"Get moled state: {self.name}: {self._model_state}")
+                return self._model_state
 
         self._query_model_state()
         return None
 
+    @property
+    def cache_state(self) -> dict:
+        """Model state cache summary."""
+        age = None if self._last_update is None else round(time.time() - self._last_update, 1)
+        return {
+            "age": age,
+            "valid": age is not None and age <= self.update_timeout,
+            "expired": age is None or age > self.invalidate_timeout,
+            "restored": self._state_restored,
+            "refresh_pending": self._refresh_pending,
+            "passive": self.passive,
+        }
+
+    @callback
     def update_model_state(self, state: any):
         """Update Bt mesh entity model state."""
 #        if self.name == "00fc-LightCTLServer":
 #            _LOGGER.debug(f"Update model state {self.name}: {state}")
         self._last_update = time.time()
         self._model_state = state
-        self.schedule_update_ha_state()
+        self._state_restored = False
+        self.async_write_model_state()
+
+    @callback
+    def restore_model_state(self, state: any):
+        """Set the model state restored from the snapshot, it's marked as stale
+           and refreshed from the network."""
+        if state is None:
+            return
+        self._last_update = time.time() - self.update_timeout
+        self._model_state = state
+        self._state_restored = True
+        self.async_write_model_state()
+
+    @callback
+    def async_write_model_state(self) -> None:
+        """Write the attributes of the cached model state, none if it's
+           expired, the node is not queried."""
+        if self.hass is None:
+            return
+        expired = self._last_update is None or \
+            time.time() - self._last_update > self.invalidate_timeout
+        self.update_attributes(None if expired else self._model_state)
+        self.async_write_ha_state()
+
+    @callback
+    def update_attributes(self, state: any) -> None:
+        """Set the entity attributes from the model state."""
+
+    async def async_update(self) -> None:
+        """Polled entity queries the outdated model state."""
+        self.update_attributes(self.model_state)
 
 #    def update_model_state_thr(self, state: any):
 #        async def _set_value_after_delay(state: any):
@@ -204,17 +389,21 @@ class BtMeshEntity(Entity):
 #        self._task = self.app.loop.create_task(_set_value_after_delay(state))
 #        _LOGGER.debug(f"update_model_state(): {self.unicast_addr:04x}, state={state}")
 
-    def _query_model_state(self):
-        async def query_model_state_task():
-            async with self._lock:
-                state = await self.query_model_state()
-                _LOGGER.debug(f"Get {self.name} state: {repr(state)} [{time.time():f}]")
-                if state is not None:
-                    self.update_model_state(state)
+    async def async_refresh_model_state(self) -> None:
+        """Query model state from the network and update the entity."""
+        async with self._lock:
+            state = await self.query_model_state()
+            _LOGGER.debug(f"Get {self.name} state: {repr(state)} [{time.time():f}]")
+            if state is not None:
+                self.update_model_state(state)
 
-        if not self.passive:
+    @callback
+    def _query_model_state(self):
+        if self._refresh_pending:
+            _LOGGER.debug(f"{self.name} already scheduled, ignore query")
+        elif not self.passive:
             if self._query_task is None or self._query_task.done():
-                self._query_task = self.app.hass.async_create_task(query_model_state_task())
+                self._query_task = self.app.hass.async_create_task(self.async_refresh_model_state())
                 _LOGGER.debug(f"Querye model state {self.name}")
             else:
                 _LOGGER.debug(f"{self.name} already running, ignore query")
@@ -225,6 +414,7 @@ class BtMeshEntity(Entity):
     async def query_model_state(self) -> any:
         return None
 
+    @callback
     def invalidate_model_state(self):
 #        _LOGGER.debug(f"Invalidate model state {self.name}")
         self._last_update = time.time() - self.update_timeout
@@ -3,21 +3,22 @@ from __future__ import annotations
 
 import math
 import asyncio
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
 
 from construct import Container
 
-from bluetooth_mesh.models.generic.onoff import GenericOnOffClient
-from bluetooth_mesh.models.light.lightness import LightLightnessClient
-from bluetooth_mesh.models.light.ctl import LightCTLClient
-from bluetooth_mesh.models.light.hsl import LightHSLClient
 from bluetooth_mesh.messages.light.lightness import LightLightnessOpcode
 from bluetooth_mesh.messages.light.ctl import LightCTLOpcode
 from bluetooth_mesh.messages.light.hsl import LightHSLOpcode
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later
 from homeassistant.components import light
 from homeassistant.components.light import (
     ATTR_TRANSITION,
@@ -32,11 +33,10 @@ from homeassistant.components.light import (
 )
 from homeassistant.const import Platform
 
-from bt_mesh_ctrl import BtMeshModelId, BtMeshOpcode
+from bt_mesh_ctrl import BtMeshModelId
 from bt_mesh_ctrl.mesh_cfgclient_conf import MeshCfgModel
 
-from .application import BtMeshApplication
-from .entity import BtMeshEntity, ClassNotFoundError
+from .entity import BtMeshEntity, opcode_key, ClassNotFoundError
 from .const import (
     BT_MESH_DISCOVERY_ENTITY_NEW,
     DEFAULT_LIGHT_BRIGHTNESS,
@@ -46,12 +46,28 @@ from .const import (
     G_MESH_CACHE_INVALIDATE_TIMEOUT,
     CONF_UPDATE_TIME,
     CONF_KEEPALIVE_TIME,
+    REFRESH_PRIORITY_CONTROL,
+    SERVICE_LEVEL_STEP,
+    SERVICE_LEVEL_MOVE,
+    SERVICE_LEVEL_STOP,
+    ATTR_STEP,
+    ATTR_SPEED,
+    G_LEVEL_REFRESH_DELAY,
 )
 
+if TYPE_CHECKING:
+    from .application import BtMeshApplication
+
 import logging
 _LOGGER = logging.getLogger(__name__)
 
 
+# Generic Move Set delta_level is Int16, the delta of one transition step
+LEVEL_MOVE_DELTA_MAX = 0x7fff
+# Generic Default Transition Time resolution
+LEVEL_MOVE_STEP_RESOLUTION = 0.1
+
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -107,6 +123,26 @@ async def async_setup_entry(
             async_add_light,
         )
     )
+
+    # relative dimming run by the node with Generic Level messages
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_LEVEL_STEP,
+        {
+            vol.Required(ATTR_STEP): vol.All(vol.Coerce(float), vol.Range(min=-100, max=100)),
+            vol.Optional(ATTR_TRANSITION): vol.All(vol.Coerce(float), vol.Range(min=0, max=300)),
+        },
+        "async_level_step",
+    )
+    platform.async_register_entity_service(
+        SERVICE_LEVEL_MOVE,
+        {
+            vol.Required(ATTR_SPEED): vol.All(vol.Coerce(float), vol.Range(min=-100, max=100)),
+        },
+        "async_level_move",
+    )
+    platform.async_register_entity_service(SERVICE_LEVEL_STOP, {}, "async_level_stop")
+
     return True
 
 
@@ -114,6 +150,78 @@ class BtMeshLightEntity(BtMeshEntity, LightEntity):
     """Common representation of a BT Mesh Light entity."""
 
     model_id: int
+    refresh_priority = REFRESH_PRIORITY_CONTROL
+
+    _level_refresh_unsub = None
+
+    @staticmethod
+    def percent_to_level(percent: float) -> int:
+        """Generic Level change of the percent of the lightness range."""
+        return round(percent * 65535 / 100)
+
+    @classmethod
+    def level_move_step(cls, speed: float) -> tuple[int, float]:
+        """Generic Move delta level and transition step of the speed percent
+           per second, the step is shortened for the speeds above 50 %/s
+           to keep the delta in Int16."""
+        transition_time = 1.0
+        delta_level = cls.percent_to_level(speed)
+        if abs(delta_level) > LEVEL_MOVE_DELTA_MAX:
+            steps = math.floor(LEVEL_MOVE_DELTA_MAX / abs(delta_level) / LEVEL_MOVE_STEP_RESOLUTION)
+            transition_time = round(steps * LEVEL_MOVE_STEP_RESOLUTION, 1)
+            delta_level = cls.percent_to_level(speed * transition_time)
+        return delta_level, transition_time
+
+    async def async_level_step(self, step: float, transition: float | None=None) -> None:
+        """Change the lightness by step percent with Generic Delta Set, the
+           node applies it to its current level."""
+        result = await self.app.generic_level_delta_set(
+            destination=self.unicast_addr,
+            app_index=self.app_key,
+            delta_level=self.percent_to_level(step),
+            transition_time=transition,
+        )
+        if result is not None and "remaining_time" in result:
+            transition = result.remaining_time
+        self._async_refresh_after(transition or 0)
+
+    async def async_level_move(self, speed: float) -> None:
+        """Ramp the lightness by speed percent per second with Generic Move
+           Set until the range limit or stop, 0 stops the ramp."""
+        delta_level, transition_time = self.level_move_step(speed)
+        await self.app.generic_level_move_set(
+            destination=self.unicast_addr,
+            app_index=self.app_key,
+            delta_level=delta_level,
+            transition_time=transition_time,
+        )
+        self._async_refresh_after(100 / abs(speed) if speed else 0)
+
+    async def async_level_stop(self) -> None:
+        """Stop the lightness ramp."""
+        await self.async_level_move(0)
+
+    @callback
+    def _async_refresh_after(self, delay: float) -> None:
+        """Query the lightness when the node finishes the change."""
+        @callback
+        def _async_refresh(_now: datetime) -> None:
+            self._level_refresh_unsub = None
+            self.invalidate_model_state()
+
+        if self._level_refresh_unsub is not None:
+            self._level_refresh_unsub()
+        self._level_refresh_unsub = async_call_later(
+            self.hass,
+            delay + G_LEVEL_REFRESH_DELAY,
+            _async_refresh
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        if self._level_refresh_unsub is not None:
+            self._level_refresh_unsub()
+            self._level_refresh_unsub = None
+        await super().async_will_remove_from_hass()
 
     @staticmethod
     def brightness_hass_to_btmesh(val: int) -> int:
@@ -174,13 +282,14 @@ class BtMeshLight_LightLightness(BtMeshLightEntity):
             self.update_model_state(Container(present_lightness=lightness))
         self.invalidate_device_state()
 
-    async def async_update(self) -> None:
+    @callback
+    def update_attributes(self, state: any) -> None:
         """Update LightEntity state from latest LightLightness."""
-        if self.model_state is not None:
-            if "remaining_time" in self.model_state and self.model_state.remaining_time > 0:
-                lightness = self.model_state.target_lightness
+        if state is not None:
+            if "remaining_time" in state and state.remaining_time > 0:
+                lightness = state.target_lightness
             else:
-                lightness = self.model_state.present_lightness
+                lightness = state.present_lightness
             self._attr_brightness = BtMeshLightEntity.brightness_btmesh_to_hass(lightness)
             self._attr_is_on = self._attr_brightness > 0
             self._attr_available = True
@@ -246,6 +355,7 @@ class BtMeshLight_LightCTL(BtMeshLightEntity):
     _last_state: tuple[int, int] | None = None
     _flag_update_temperature_range = True
 
+    @callback
     def receive_message(
         self,
         source: int,
@@ -254,13 +364,14 @@ class BtMeshLight_LightCTL(BtMeshLightEntity):
         message: ParsedMeshMessage
     ):
         """Receive status reports from LightCTL model."""
-        opcode_name = BtMeshOpcode.get(message.opcode).name.lower()
+        opcode_name = opcode_key(message.opcode)
         match message.opcode:
             case LightCTLOpcode.LIGHT_CTL_STATUS:
                 super().receive_message(source, app_index, destination, message)
             case LightCTLOpcode.LIGHT_CTL_TEMPERATURE_RANGE_STATUS:
                 self._attr_min_color_temp_kelvin = message[opcode_name].range_min
                 self._attr_max_color_temp_kelvin = message[opcode_name].range_max
+                self.async_write_ha_state()
             case _:
                 pass
 
@@ -306,15 +417,16 @@ class BtMeshLight_LightCTL(BtMeshLightEntity):
             )
         self.invalidate_device_state()
 
-    async def async_update(self) -> None:
+    @callback
+    def update_attributes(self, state: any) -> None:
         """Update LightEntity state from latest LightCTL."""
-        if self.model_state is not None:
-            if "remaining_time" in self.model_state and self.model_state.remaining_time > 0:
-                lightness = self.model_state.target_ctl_lightness
-                temperature = self.model_state.target_ctl_temperature
+        if state is not None:
+            if "remaining_time" in state and state.remaining_time > 0:
+                lightness = state.target_ctl_lightness
+                temperature = state.target_ctl_temperature
             else:
-                lightness = self.model_state.present_ctl_lightness
-                temperature = self.model_state.present_ctl_temperature
+                lightness = state.present_ctl_lightness
+                temperature = state.present_ctl_temperature
             self._attr_brightness = BtMeshLightEntity.brightness_btmesh_to_hass(lightness)
             self._attr_color_temp_kelvin = temperature
             self._attr_is_on = self._attr_brightness > 0
@@ -428,21 +540,22 @@ class BtMeshLight_LightHSL(BtMeshLightEntity):
             app_index=self.app_key,
         )
 
-    async def async_update(self) -> None:
+    @callback
+    def update_attributes(self, state: any) -> None:
         """Update LightEntity state from latest LightHSL."""
-        if self.model_state is not None:
-            self._attr_brightness = BtMeshLightEntity.brightness_btmesh_to_hass(self.model_state.hsl_lightness)
+        if state is not None:
+            self._attr_brightness = BtMeshLightEntity.brightness_btmesh_to_hass(state.hsl_lightness)
             self._attr_hs_color = BtMeshLightEntity.color_btmesh_to_hass(
-                self.model_state.hsl_hue, self.model_state.hsl_saturation
+                state.hsl_hue, state.hsl_saturation
             )
             self._attr_is_on = self._attr_brightness > 0
             self._attr_available = True
 
-            if self._last_state is None or self.model_state.hsl_lightness > 0:
+            if self._last_state is None or state.hsl_lightness > 0:
                 self._last_state = (
-                    self.model_state.hsl_lightness,
-                    self.model_state.hsl_hue,
-                    self.model_state.hsl_saturation
+                    state.hsl_lightness,
+                    state.hsl_hue,
+                    state.hsl_saturation
                 )
         else:
             self._attr_available = False
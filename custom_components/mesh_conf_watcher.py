@@ -0,0 +1,151 @@
+"""Watcher of the meshcfg network configuration file."""
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import struct
+from datetime import datetime, timedelta
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    G_MESH_CONF_DEBOUNCE,
+    G_MESH_CONF_POLL_INTERVAL,
+)
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+
+
+# inotify(7) flags
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+IN_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class MeshConfWatcher:
+    """Call action when the watched file is changed. The parent directory is
+       watched with inotify so the atomic renames are detected, bursts of
+       events are debounced. Falls back to calling action periodically where
+       inotify is not available, the action checks the file modification."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        filename: str,
+        action: Callable[[], None],
+        debounce: float=G_MESH_CONF_DEBOUNCE,
+        poll_interval: float=G_MESH_CONF_POLL_INTERVAL
+    ) -> None:
+        self.hass = hass
+        self.filename = os.path.abspath(os.path.expanduser(filename))
+        self.action = action
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+
+        self._fd: int | None = None
+        self._debounce_handle: asyncio.TimerHandle | None = None
+        self._unsub_poll: Callable[[], None] | None = None
+
+    @property
+    def mode(self) -> str:
+        if self._fd is not None:
+            return "inotify"
+        if self._unsub_poll is not None:
+            return "poll"
+        return "stopped"
+
+    @callback
+    def async_start(self) -> None:
+        """Start watching the file."""
+        try:
+            self._fd = self._inotify_open()
+            self.hass.loop.add_reader(self._fd, self._read_events)
+            _LOGGER.debug(f"watching {self.filename} with inotify")
+        except (OSError, AttributeError) as e:
+            _LOGGER.warning(f"inotify is not available ({e}), polling {self.filename}")
+            self._close()
+            self._unsub_poll = async_track_time_interval(
+                self.hass,
+                self._async_poll,
+                timedelta(seconds=self.poll_interval),
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop watching the file."""
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+            self._debounce_handle = None
+        if self._unsub_poll is not None:
+            self._unsub_poll()
+            self._unsub_poll = None
+        if self._fd is not None:
+            self.hass.loop.remove_reader(self._fd)
+        self._close()
+
+    def _inotify_open(self) -> int:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        wd = libc.inotify_add_watch(
+            fd,
+            os.fsencode(os.path.dirname(self.filename)),
+            IN_WATCH_MASK
+        )
+        if wd < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, os.strerror(errno))
+        return fd
+
+    def _close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    @callback
+    def _read_events(self) -> None:
+        try:
+            data = os.read(self._fd, 4096)
+        except BlockingIOError:
+            return
+
+        basename = os.fsencode(os.path.basename(self.filename))
+        offset = 0
+        while offset + INOTIFY_EVENT.size <= len(data):
+            _wd, mask, _cookie, length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if name == basename:
+                self._schedule_action()
+
+    @callback
+    def _schedule_action(self) -> None:
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+        self._debounce_handle = self.hass.loop.call_later(self.debounce, self._fire)
+
+    @callback
+    def _fire(self) -> None:
+        self._debounce_handle = None
+        self.action()
+
+    @callback
+    def _async_poll(self, _now: datetime) -> None:
+        self.action()
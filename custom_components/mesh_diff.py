@@ -0,0 +1,74 @@
+"""Difference between two loads of the Mesh network configuration."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from bt_mesh_ctrl.mesh_cfgclient_conf import MeshCfgclientConf, MeshCfgModel
+
+
+
+@dataclass(frozen=True)
+class MeshConfSnapshot:
+    """Provisioned devices and bound models of the network configuration."""
+    models: dict[str, MeshCfgModel]
+    devices: dict[str, any]
+
+    @classmethod
+    def from_mesh_conf(cls, mesh_conf: MeshCfgclientConf) -> MeshConfSnapshot:
+        return cls(
+            models={cfg_model.unique_id: cfg_model for cfg_model in mesh_conf.get_models()},
+            devices={str(cfg_device.unique_id): cfg_device for cfg_device in mesh_conf.get_devices()},
+        )
+
+
+@dataclass
+class MeshConfDiff:
+    """Models and devices added, removed or changed between two snapshots."""
+    models_added: list[MeshCfgModel] = field(default_factory=list)
+    models_removed: list[MeshCfgModel] = field(default_factory=list)
+    models_changed: list[MeshCfgModel] = field(default_factory=list)
+    devices_added: list[any] = field(default_factory=list)
+    devices_removed: list[any] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.models_added or self.models_removed or self.models_changed or
+            self.devices_added or self.devices_removed
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"models +{len(self.models_added)} -{len(self.models_removed)} "
+            f"~{len(self.models_changed)}, devices +{len(self.devices_added)} "
+            f"-{len(self.devices_removed)}"
+        )
+
+
+def diff_mesh_conf(old: MeshConfSnapshot, new: MeshConfSnapshot) -> MeshConfDiff:
+    """Compare two snapshots, a model with changed application key
+       is reported as changed."""
+    result = MeshConfDiff()
+
+    for unique_id, cfg_model in new.models.items():
+        old_model = old.models.get(unique_id)
+        if old_model is None:
+            result.models_added.append(cfg_model)
+        elif old_model.app_key != cfg_model.app_key:
+            result.models_changed.append(cfg_model)
+
+    result.models_removed = [
+        cfg_model for unique_id, cfg_model in old.models.items()
+            if unique_id not in new.models
+    ]
+
+    result.devices_added = [
+        cfg_device for unique_id, cfg_device in new.devices.items()
+            if unique_id not in old.devices
+    ]
+    result.devices_removed = [
+        cfg_device for unique_id, cfg_device in old.devices.items()
+            if unique_id not in new.devices
+    ]
+
+    return result
@@ -0,0 +1,245 @@
+"""BT Mesh request metrics registry."""
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable
+from http import HTTPStatus
+
+from aiohttp import web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.config_entries import ConfigEntryState
+
+from .const import (
+    DOMAIN,
+    G_METRICS_CONFIRM_TIMEOUT,
+    G_METRICS_LATENCY_BUCKETS,
+)
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+
+
+# counters, labeled by node and request
+METRIC_REQUESTS = "requests"
+METRIC_TIMEOUTS = "timeouts"
+METRIC_RETRANSMISSIONS = "retransmissions"
+
+# histograms, labeled by node and request
+METRIC_RTT = "rtt_seconds"
+METRIC_QUEUE_WAIT = "queue_wait_seconds"
+METRIC_CONFIRM_LATENCY = "confirm_latency_seconds"
+
+# gauges
+METRIC_GET_QUEUE_DEPTH = "get_queue_depth"
+METRIC_REFRESH_QUEUE_DEPTH = "refresh_queue_depth"
+
+METRICS_HELP: dict[str, tuple[str, str]] = {
+    METRIC_REQUESTS: ("counter", "Requests sent to the node"),
+    METRIC_TIMEOUTS: ("counter", "Requests without response, timed out SET falls back to optimistic state"),
+    METRIC_RETRANSMISSIONS: ("counter", "Estimated retransmissions of the acknowledged requests"),
+    METRIC_RTT: ("histogram", "Round trip time of the answered requests"),
+    METRIC_QUEUE_WAIT: ("histogram", "Time the GET request waited for the request lock"),
+    METRIC_CONFIRM_LATENCY: ("histogram", "Time from the SET service call to the status message of the node"),
+    METRIC_GET_QUEUE_DEPTH: ("gauge", "GET requests waiting for the request lock"),
+    METRIC_REFRESH_QUEUE_DEPTH: ("gauge", "Entities waiting in the refresh queue"),
+}
+
+
+def node_label(destination: any) -> str:
+    return f"{destination:04x}" if isinstance(destination, int) else "unknown"
+
+
+class Histogram:
+    """Cumulative bucket histogram in the Prometheus layout."""
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.sum += value
+        self.count += 1
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+
+    @property
+    def mean(self) -> float | None:
+        return self.sum / self.count if self.count else None
+
+
+class BtMeshMetrics:
+    """In-process counters, histograms and gauges of the mesh requests,
+       labeled by node unicast address and request name."""
+
+    def __init__(
+        self,
+        send_interval: float,
+        buckets: tuple[float, ...]=G_METRICS_LATENCY_BUCKETS,
+        confirm_timeout: float=G_METRICS_CONFIRM_TIMEOUT
+    ) -> None:
+        self.send_interval = send_interval
+        self.buckets = buckets
+        self.confirm_timeout = confirm_timeout
+
+        self.counters: dict[tuple[str, str, str], int] = {}
+        self.histograms: dict[tuple[str, str, str], Histogram] = {}
+        self.gauges: dict[str, Callable[[], float]] = {}
+        # (node, status opcode): (monotonic time of the SET request, request
+        # name, status opcodes confirming it)
+        self._pending_sets: dict[tuple[str, int], tuple[float, str, tuple[int, ...]]] = {}
+
+    def inc(self, metric: str, node: str, request: str, value: int=1) -> None:
+        key = (metric, node, request)
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, metric: str, node: str, request: str, value: float) -> None:
+        key = (metric, node, request)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(self.buckets)
+        histogram.observe(value)
+
+    def set_gauge(self, metric: str, value_fn: Callable[[], float]) -> None:
+        self.gauges[metric] = value_fn
+
+    def total(self, metric: str) -> int:
+        """Counter summed over all nodes and requests."""
+        return sum(value for key, value in self.counters.items() if key[0] == metric)
+
+    def mean(self, metric: str) -> float | None:
+        """Histogram mean over all nodes and requests."""
+        total = count = 0
+        for key, histogram in self.histograms.items():
+            if key[0] == metric:
+                total += histogram.sum
+                count += histogram.count
+        return total / count if count else None
+
+    def gauge(self, metric: str) -> float | None:
+        value_fn = self.gauges.get(metric)
+        return value_fn() if value_fn is not None else None
+
+    def request_done(self, node: str, request: str, started: float, timeout: bool) -> None:
+        """Account the finished acknowledged request, the number of
+           retransmissions is estimated from the send interval."""
+        elapsed = time.monotonic() - started
+        self.inc(METRIC_REQUESTS, node, request)
+        if timeout:
+            self.inc(METRIC_TIMEOUTS, node, request)
+        else:
+            self.observe(METRIC_RTT, node, request, elapsed)
+        retransmissions = int(elapsed / self.send_interval)
+        if retransmissions:
+            self.inc(METRIC_RETRANSMISSIONS, node, request, retransmissions)
+
+    def set_started(self, node: str, request: str, started: float, opcodes: Iterable[int]) -> None:
+        """SET is requested, wait for the node to report the state with one
+           of the status opcodes. The SET repeated before the confirmation,
+           or replayed on reconnect, is measured from the first request."""
+        opcodes = tuple(opcodes)
+        for opcode in opcodes:
+            pending = self._pending_sets.get((node, opcode))
+            if pending is not None and pending[1] == request and started - pending[0] <= self.confirm_timeout:
+                continue
+            self._pending_sets[(node, opcode)] = (started, request, opcodes)
+
+    def state_confirmed(self, node: str, opcode: int) -> None:
+        """The node reported its state, complete the pending SET, the
+           statuses of the other opcodes don't confirm it again."""
+        pending = self._pending_sets.pop((node, opcode), None)
+        if pending is None:
+            return
+        started, request, opcodes = pending
+        for other in opcodes:
+            if self._pending_sets.get((node, other)) == pending:
+                del self._pending_sets[(node, other)]
+        latency = time.monotonic() - started
+        if latency <= self.confirm_timeout:
+            self.observe(METRIC_CONFIRM_LATENCY, node, request, latency)
+
+    def as_dict(self) -> dict:
+        """Metrics summary."""
+        return {
+            "counters": {
+                f"{metric}[{node}/{request}]": value
+                    for (metric, node, request), value in self.counters.items()
+            },
+            "histograms": {
+                f"{metric}[{node}/{request}]": {
+                    "count": histogram.count,
+                    "mean": histogram.mean,
+                }
+                    for (metric, node, request), histogram in self.histograms.items()
+            },
+            "gauges": {metric: self.gauge(metric) for metric in self.gauges},
+        }
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items())
+
+
+def render_prometheus(networks: Iterable[tuple[str, BtMeshMetrics]]) -> str:
+    """Metrics of the mesh networks in the Prometheus text format."""
+    networks = list(networks)
+    lines = []
+    for metric, (metric_type, description) in METRICS_HELP.items():
+        name = f"{DOMAIN}_{metric}" + ("_total" if metric_type == "counter" else "")
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {metric_type}")
+
+        for network, metrics in networks:
+            if metric_type == "counter":
+                for (key, node, request), value in metrics.counters.items():
+                    if key == metric:
+                        lines.append(f"{name}{{{_labels(network=network, node=node, request=request)}}} {value}")
+
+            elif metric_type == "histogram":
+                for (key, node, request), histogram in metrics.histograms.items():
+                    if key != metric:
+                        continue
+                    labels = _labels(network=network, node=node, request=request)
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                    lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+                    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+            else:
+                value = metrics.gauge(metric)
+                if value is not None:
+                    lines.append(f"{name}{{{_labels(network=network)}}} {value}")
+
+    return "\n".join(lines) + "\n"
+
+
+class BtMeshMetricsView(HomeAssistantView):
+    """Metrics of the loaded mesh networks for Prometheus scraping."""
+
+    url = f"/api/{DOMAIN}/metrics"
+    name = f"api:{DOMAIN}:metrics"
+
+    async def get(self, request: web.Request) -> web.Response:
+        hass = request.app[KEY_HASS]
+        # the instances of the sharded network are labeled by D-Bus path
+        networks = [
+            (entry.title if index == 0 else f"{entry.title}:{shard.name}", shard.app.metrics)
+                for entry in hass.config_entries.async_entries(DOMAIN)
+                    if entry.state is ConfigEntryState.LOADED
+                        for index, shard in enumerate(entry.runtime_data.shards.shards)
+        ]
+        return web.Response(
+            text=render_prometheus(networks),
+            content_type="text/plain",
+            status=HTTPStatus.OK,
+        )
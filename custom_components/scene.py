@@ -0,0 +1,288 @@
+"""BT MESH scene integration"""
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.components.light import ATTR_TRANSITION
+from homeassistant.components.scene import Scene
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later
+
+from bluetooth_mesh.messages.scene import SceneOpcode
+
+from bt_mesh_ctrl import BtMeshModelId
+from bt_mesh_ctrl.mesh_cfgclient_conf import MeshCfgModel
+
+from .entity import opcode_key
+from .const import (
+    DOMAIN,
+    BT_MESH_DISCOVERY_ENTITY_NEW,
+    BT_MESH_MSG,
+    CONF_SCENES,
+    CONF_SCENE_ADDRESS,
+    CONF_SCENE_NAMES,
+    DEFAULT_SCENE_ADDRESS,
+    G_SCENE_REFRESH_DELAY,
+)
+
+if TYPE_CHECKING:
+    from . import BtMeshConfigEntry
+    from .application import BtMeshApplication
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigType,
+    add_entities: AddEntitiesCallback
+) -> None:
+    """Set up the scenes stored on the Scene Server nodes."""
+    runtime_data = config_entry.runtime_data
+    scenes = BtMeshScenes(
+        hass,
+        config_entry,
+        add_entities,
+        runtime_data.domain_conf.get(CONF_SCENES) or {}
+    )
+    runtime_data.scenes = scenes
+    config_entry.async_on_unload(scenes.async_stop)
+
+    @callback
+    def async_add_scene_server(
+        app: BtMeshApplication,
+        cfg_model: MeshCfgModel,
+        node_conf: dict
+    ) -> None:
+        scenes.async_add_server(cfg_model)
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            BT_MESH_DISCOVERY_ENTITY_NEW.format(BtMeshModelId.SceneServer),
+            async_add_scene_server,
+        )
+    )
+
+    return True
+
+
+class BtMeshScenes:
+    """Scene registers of the Scene Server nodes, a scene entity is added
+       for every scene number stored on the nodes or named in the config."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: BtMeshConfigEntry,
+        add_entities: AddEntitiesCallback,
+        conf: dict
+    ) -> None:
+        self.hass = hass
+        self.entry = entry
+        self.add_entities = add_entities
+        self.address = conf.get(CONF_SCENE_ADDRESS, DEFAULT_SCENE_ADDRESS)
+        self.names = conf.get(CONF_SCENE_NAMES, {})
+
+        # Scene Server unicast address: application key index
+        self.servers: dict[int, int] = {}
+        # Scene Server unicast address: primary address of its node
+        self.nodes: dict[int, int] = {}
+        # scene number: unicast addresses of the nodes storing it
+        self.members: dict[int, set[int]] = {}
+        self.entities: dict[int, BtMeshScene] = {}
+
+        self._unsubs = []
+        self._refresh_unsub = None
+
+        for number in self.names:
+            self._async_add_scene(number)
+
+    @callback
+    def async_add_server(self, cfg_model: MeshCfgModel) -> None:
+        """Track the scene register of the node."""
+        unicast_addr = cfg_model.unicast_addr
+        known = unicast_addr in self.servers
+        self.servers[unicast_addr] = cfg_model.app_key
+        self.nodes[unicast_addr] = cfg_model.device.unicast_addr
+        if known:
+            return
+
+        self._unsubs.append(
+            async_dispatcher_connect(
+                self.hass,
+                BT_MESH_MSG.format(unicast_addr, SceneOpcode.SCENE_REGISTER_STATUS),
+                self._async_register_status,
+            )
+        )
+        self.entry.async_create_background_task(
+            self.hass,
+            self._async_query_register(unicast_addr),
+            f"{DOMAIN}_scene_register_{unicast_addr:04x}"
+        )
+
+    async def _async_query_register(self, unicast_addr: int) -> None:
+        shards = self.entry.runtime_data.shards
+        status = await shards.app_for(unicast_addr).scene_register_get(
+            destination=unicast_addr,
+            app_index=self.servers[unicast_addr]
+        )
+        if status is not None:
+            self._async_update_register(unicast_addr, status)
+        else:
+            _LOGGER.debug(f"scene register of {unicast_addr:04x} is not received")
+
+    @callback
+    def _async_register_status(
+        self,
+        source: int,
+        app_index: int,
+        destination: int,
+        message: any
+    ) -> None:
+        self._async_update_register(source, message[opcode_key(message.opcode)])
+
+    @callback
+    def _async_update_register(self, unicast_addr: int, status: any) -> None:
+        stored = {number for number in status.scenes if number > 0}
+        for number, members in self.members.items():
+            if number not in stored:
+                members.discard(unicast_addr)
+        for number in stored:
+            self.members.setdefault(number, set()).add(unicast_addr)
+            self._async_add_scene(number)
+
+        for entity in self.entities.values():
+            if entity.hass is not None:
+                entity.async_write_ha_state()
+
+    @callback
+    def _async_add_scene(self, number: int) -> None:
+        if number in self.entities:
+            return
+        entity = BtMeshScene(self, number, self.names.get(number))
+        self.entities[number] = entity
+        self.add_entities([entity])
+
+    async def async_store(self, number: int, addresses: set[int] | None=None) -> dict[str, str]:
+        """Store the current state of the nodes as the scene, all Scene
+           Server nodes by default. Returns the status of every node."""
+        shards = self.entry.runtime_data.shards
+        result = {}
+        for unicast_addr, app_key in list(self.servers.items()):
+            if addresses is not None and unicast_addr not in addresses:
+                continue
+            status = await shards.app_for(unicast_addr).scene_store(
+                destination=unicast_addr,
+                app_index=app_key,
+                scene_number=number
+            )
+            if status is None:
+                result[f"{unicast_addr:04x}"] = "timeout"
+                continue
+            self._async_update_register(unicast_addr, status)
+            result[f"{unicast_addr:04x}"] = getattr(status.status_code, "name", str(status.status_code)).lower()
+        return result
+
+    async def async_recall(self, number: int, transition: float | None=None) -> None:
+        """Recall the scene with one message to the scene address, all nodes
+           run it in parallel and publish their new state. The message is
+           sent by every shard owning the nodes storing the scene."""
+        started = time.time()
+        shards = self.entry.runtime_data.shards
+        # application instance: key index of the Scene Servers it reaches
+        routes: dict[BtMeshApplication, int] = {}
+        for unicast_addr in sorted(self.members.get(number, ())):
+            if unicast_addr in self.servers:
+                routes.setdefault(shards.app_for(unicast_addr), self.servers[unicast_addr])
+        if not routes:
+            routes[shards.app_for(self.address)] = next(iter(self.servers.values()), 0)
+
+        for app, app_key in routes.items():
+            await app.scene_recall(
+                destination=self.address,
+                app_index=app_key,
+                scene_number=number,
+                transition_time=transition
+            )
+
+        # refresh the entities of the nodes silent after the transition
+        @callback
+        def _async_refresh(_now: datetime) -> None:
+            self._refresh_unsub = None
+            self._async_refresh_silent(number, started)
+
+        if self._refresh_unsub is not None:
+            self._refresh_unsub()
+        self._refresh_unsub = async_call_later(
+            self.hass,
+            (transition or 0) + G_SCENE_REFRESH_DELAY,
+            _async_refresh
+        )
+
+    @callback
+    def _async_refresh_silent(self, number: int, since: float) -> None:
+        """Query the entities on all elements of the nodes storing the
+           scene, the Scene Server is on one element of the node only."""
+        nodes = {
+            self.nodes[unicast_addr]
+                for unicast_addr in self.members.get(number, ())
+                if unicast_addr in self.nodes
+        }
+        runtime_data = self.entry.runtime_data
+        for entity in runtime_data.state_store.entities:
+            if entity.cfg_model.device.unicast_addr not in nodes or entity.passive:
+                continue
+            if entity.last_update is None or entity.last_update < since:
+                runtime_data.scheduler.async_schedule(entity)
+
+    @callback
+    def async_stop(self) -> None:
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+        if self._refresh_unsub is not None:
+            self._refresh_unsub()
+            self._refresh_unsub = None
+
+    def as_dict(self) -> dict:
+        return {
+            "address": f"{self.address:04x}",
+            "servers": sorted(f"{unicast_addr:04x}" for unicast_addr in self.servers),
+            "scenes": {
+                number: sorted(f"{unicast_addr:04x}" for unicast_addr in members)
+                    for number, members in self.members.items()
+            },
+        }
+
+
+class BtMeshScene(Scene):
+    """Representation of a Bluetooth Mesh scene stored on the nodes."""
+
+    _attr_should_poll = False
+
+    def __init__(self, scenes: BtMeshScenes, number: int, name: str | None=None) -> None:
+        self.scenes = scenes
+        self.number = number
+        self._attr_unique_id = f"{scenes.entry.entry_id}-scene-{number}"
+        self._attr_name = name or f"Mesh scene {number}"
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        return {
+            "scene_number": self.number,
+            "nodes": sorted(
+                f"{unicast_addr:04x}" for unicast_addr in self.scenes.members.get(self.number, ())
+            ),
+        }
+
+    async def async_activate(self, **kwargs) -> None:
+        """Recall the mesh scene."""
+        await self.scenes.async_recall(self.number, kwargs.get(ATTR_TRANSITION))
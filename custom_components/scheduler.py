@@ -0,0 +1,165 @@
+"""BT Mesh entities model state refresh scheduler."""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from collections.abc import Iterable
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DOMAIN,
+    G_REFRESH_CONCURRENCY,
+    G_REFRESH_SEND_INTERVAL,
+)
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+
+
+class BtMeshRefreshScheduler:
+    """Queue of the entities model state queries, processed in priority
+       order under an airtime budget.
+
+       The queries of one application instance are serialized by its GET
+       lock, the workers only overlap the wait for the budget and the lock
+       with the query in flight. Queries run in parallel only for the nodes
+       of different shards, each shard application has its own lock."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        concurrency: int=G_REFRESH_CONCURRENCY,
+        send_interval: float=G_REFRESH_SEND_INTERVAL
+    ) -> None:
+        self.hass = hass
+        self.concurrency = concurrency
+        self.send_interval = send_interval
+
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._seq = itertools.count()
+        self._pending: set[str] = set()
+        self._workers: list[asyncio.Task] = []
+        self._budget_lock = asyncio.Lock()
+        self._next_send = 0.0
+
+        self._setup_time = time.monotonic()
+        self._discovery_done = False
+        self.warmup_entities = 0
+        self.warmup_failed = 0
+        self.warmup_time: float | None = None
+        self.stage_times: dict[str, float] = {}
+
+    @callback
+    def async_stage(self, stage: str) -> None:
+        """Mark the end of a startup stage."""
+        self.stage_times[stage] = round(time.monotonic() - self._setup_time, 3)
+        _LOGGER.debug(f"startup stage {stage}: {self.stage_times[stage]}s")
+
+    @callback
+    def async_start(self, entry: BtMeshConfigEntry) -> None:
+        """Start queue workers."""
+        for index in range(self.concurrency):
+            self._workers.append(
+                entry.async_create_background_task(
+                    self.hass,
+                    self._worker(),
+                    f"{DOMAIN}_{entry.title}_refresh_{index}"
+                )
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel queue workers."""
+        for task in self._workers:
+            task.cancel()
+        self._workers.clear()
+
+    @callback
+    def async_discovery_done(self) -> None:
+        """The initial discovery of the network models is finished."""
+        self._discovery_done = True
+        self._check_warmup_done()
+
+    @property
+    def warmup_done(self) -> bool:
+        return self.warmup_time is not None
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._pending)
+
+    def as_dict(self) -> dict:
+        """Scheduler state summary."""
+        return {
+            "stage_times": self.stage_times,
+            "discovery_done": self._discovery_done,
+            "warmup_entities": self.warmup_entities,
+            "warmup_failed": self.warmup_failed,
+            "warmup_time": self.warmup_time,
+            "queue_depth": self.queue_depth,
+            "workers": len(self._workers),
+        }
+
+    @callback
+    def async_schedule(self, entity: BtMeshEntity) -> None:
+        """Queue entity model state query."""
+        if entity.unique_id in self._pending:
+            return
+        self._pending.add(entity.unique_id)
+        entity.refresh_pending = True
+        if not self.warmup_done:
+            self.warmup_entities += 1
+        self._queue.put_nowait((entity.refresh_priority, next(self._seq), entity))
+
+    @callback
+    def async_schedule_stale(self, entities: Iterable[BtMeshEntity]) -> None:
+        """Queue the entities with outdated model state and update the ones
+           with expired state, replaces HA polling in the push-only mode."""
+        now = time.time()
+        for entity in entities:
+            if entity.hass is None:
+                continue
+            age = None if entity.last_update is None else now - entity.last_update
+            if not entity.passive and (age is None or age > entity.update_timeout):
+                self.async_schedule(entity)
+            if entity.available and (age is None or age > entity.invalidate_timeout):
+                entity.async_write_model_state()
+
+    async def _wait_budget(self) -> None:
+        """Limit the rate of the queries sent to the network."""
+        async with self._budget_lock:
+            delay = self._next_send - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_send = time.monotonic() + self.send_interval
+
+    async def _worker(self) -> None:
+        while True:
+            _priority, _seq, entity = await self._queue.get()
+            try:
+                await self._wait_budget()
+                if entity.hass is not None and not entity.passive:
+                    await entity.async_refresh_model_state()
+                    if not self.warmup_done and entity.cached_model_state is None:
+                        self.warmup_failed += 1
+            except Exception as e:
+                _LOGGER.error(f"failed to refresh {entity.name}: {repr(e)}")
+            finally:
+                entity.refresh_pending = False
+                self._pending.discard(entity.unique_id)
+                self._queue.task_done()
+                self._check_warmup_done()
+
+    @callback
+    def _check_warmup_done(self) -> None:
+        if self.warmup_done or not self._discovery_done or self._pending:
+            return
+        self.warmup_time = round(time.monotonic() - self._setup_time, 3)
+        _LOGGER.info(
+            f"warm-up finished: {self.warmup_entities} entities "
+            f"({self.warmup_failed} not responding), "
+            f"time to fully available {self.warmup_time}s"
+        )
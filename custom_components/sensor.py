@@ -2,14 +2,16 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING
 
 from construct import Container
 
 from bluetooth_mesh.messages.properties import PropertyID
 from bluetooth_mesh.messages.generic.battery import GenericBatteryOpcode
 from bluetooth_mesh.messages.sensor import SensorOpcode
-from bluetooth_mesh.models.generic.battery import GenericBatteryClient
-from bluetooth_mesh.models.sensor import SensorClient
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.typing import ConfigType
@@ -24,29 +26,50 @@ from homeassistant.components.sensor import (
 from homeassistant.const import (
     PERCENTAGE,
     EntityCategory,
-    UnitOfEnergy,
-    UnitOfElectricPotential,
-    UnitOfElectricCurrent,
-    UnitOfPower,
-    UnitOfTemperature,
     Platform,
+    UnitOfTime,
 )
 
-from bt_mesh_ctrl import BtMeshModelId, BtSensorAttrPropertyId, BtMeshOpcode
+from bt_mesh_ctrl import BtMeshModelId, BtSensorAttrPropertyId
 from bt_mesh_ctrl.mesh_cfgclient_conf import MeshCfgModel
 
-from .application import BtMeshApplication
-from .entity import BtMeshEntity, ClassNotFoundError
+from .entity import BtMeshEntity, opcode_key
+from .sensor_properties import (
+    BtMeshSensorEntityDescription,
+    get_sensor_description,
+    to_property_id,
+    sensor_value,
+)
+from .metrics import (
+    BtMeshMetrics,
+    METRIC_REQUESTS,
+    METRIC_TIMEOUTS,
+    METRIC_RETRANSMISSIONS,
+    METRIC_RTT,
+    METRIC_QUEUE_WAIT,
+    METRIC_CONFIRM_LATENCY,
+    METRIC_GET_QUEUE_DEPTH,
+    METRIC_REFRESH_QUEUE_DEPTH,
+)
 from .const import (
+    DOMAIN,
     BT_MESH_DISCOVERY_ENTITY_NEW,
     BT_MESH_MSG,
     CONF_UPDATE_TIME,
     CONF_KEEPALIVE_TIME,
     CONF_PASSIVE,
+    CONF_CADENCE,
+    CONF_SENSOR_CADENCE,
+    CONF_METRIC_SENSORS,
     G_MESH_CACHE_UPDATE_TIMEOUT,
     G_MESH_CACHE_INVALIDATE_TIMEOUT,
+    G_SENSOR_CADENCE_POLL_INTERVAL,
+    REFRESH_PRIORITY_BATTERY,
 )
 
+if TYPE_CHECKING:
+    from .application import BtMeshApplication
+
 import logging
 _LOGGER = logging.getLogger(__name__)
 
@@ -89,29 +112,41 @@ async def async_setup_entry(
         app: BtMeshApplication,
         cfg_model: MeshCfgModel,
         propery: dict,
-        node_conf: dict
+        node_conf: dict,
+        sensor_setup: bool=False
     ) -> None:
-        property_id = PropertyID(propery["sensor_property_id"])
+        property_id = to_property_id(propery["sensor_property_id"])
         update_interval = float(propery["sensor_update_interval"])
+        # update interval 0 is not applicable, the cache defaults are used
+        if update_interval > 0:
+            default_update_timeout = update_interval
+            default_invalidate_timeout = update_interval * 2.5
+        else:
+            default_update_timeout = G_MESH_CACHE_UPDATE_TIMEOUT
+            default_invalidate_timeout = G_MESH_CACHE_INVALIDATE_TIMEOUT
 
         platform_conf = node_conf.get(Platform.SENSOR, None) or {}
         update_timeout = platform_conf.get(CONF_UPDATE_TIME, \
-            node_conf.get(CONF_UPDATE_TIME, update_interval))
+            node_conf.get(CONF_UPDATE_TIME, default_update_timeout))
         invalidate_timeout = platform_conf.get(CONF_KEEPALIVE_TIME, \
-            node_conf.get(CONF_KEEPALIVE_TIME, update_interval * 2.5))
+            node_conf.get(CONF_KEEPALIVE_TIME, default_invalidate_timeout))
         passive = node_conf.get(CONF_PASSIVE, False)
+        cadence = sensor_setup and not passive and platform_conf.get(CONF_CADENCE, \
+            config_entry.runtime_data.domain_conf.get(CONF_SENSOR_CADENCE, False))
 
-        try:
-            sensor_entity = BtMeshSensorEntityFactory.get(property_id)(
-                app=app,
-                cfg_model=cfg_model,
-                update_timeout=update_timeout,
-                invalidate_timeout=invalidate_timeout,
-                passive=passive
-            )
-            async_add_entities([sensor_entity])
-        except ClassNotFoundError as e:
-            _LOGGER.error(f"failed to create BtMeshSensorEntity {cfg_model.unicast_addr}.{property_id:04x}: {repr(e)}")
+        async_add_entities(
+            [
+                BtMeshSensorEntity(
+                    description=BtMeshSensorEntityFactory.get(property_id),
+                    app=app,
+                    cfg_model=cfg_model,
+                    update_timeout=update_timeout,
+                    invalidate_timeout=invalidate_timeout,
+                    passive=passive,
+                    cadence_descriptor=propery if cadence else None
+                )
+            ]
+        )
 
     config_entry.async_on_unload(
         async_dispatcher_connect(
@@ -135,6 +170,16 @@ async def async_setup_entry(
         )
     )
 
+    # request metrics of the network, enabled in the configuration
+    if config_entry.runtime_data.domain_conf.get(CONF_METRIC_SENSORS, False):
+        metrics = config_entry.runtime_data.app.metrics
+        async_add_entities(
+            [
+                BtMeshMetricSensorEntity(config_entry, metrics, description)
+                    for description in METRIC_SENSORS
+            ]
+        )
+
     return True
 
 
@@ -155,6 +200,8 @@ class BtMeshGenericBatteryEntity(BtMeshEntity, SensorEntity):
         GenericBatteryOpcode.GENERIC_BATTERY_STATUS,
     )
 
+    refresh_priority = REFRESH_PRIORITY_BATTERY
+
     async def query_model_state(self) -> any:
         """Query GenericBattery state."""
         return await self.app.generic_battery_get(
@@ -162,33 +209,69 @@ class BtMeshGenericBatteryEntity(BtMeshEntity, SensorEntity):
             app_index=self.app_key,
         )
 
-    async def async_update(self) -> None:
-        """Fetch new state data for the sensor."""
-        self._attr_native_value = self.model_state.battery_level \
-            if self.model_state is not None else None
+    @callback
+    def update_attributes(self, state: any) -> None:
+        """Battery level of the GenericBattery state."""
+        self._attr_native_value = state.battery_level if state is not None else None
         self._attr_available = self._attr_native_value is not None
 
 
 # BT Mesh Sensor Server
 class BtMeshSensorEntity(BtMeshEntity, SensorEntity):
-    """Base class for Bluetooth Mesh sensor entity."""
+    """Bluetooth Mesh sensor property entity."""
 
+    entity_description: BtMeshSensorEntityDescription
     property_id: PropertyID
-    argument_keys: list
-    argument_round = 2
 
     status_opcodes = (
         SensorOpcode.SENSOR_STATUS,
         SensorOpcode.SENSOR_DESCRIPTOR_STATUS,
     )
 
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(
+        self,
+        description: BtMeshSensorEntityDescription,
+        *args,
+        cadence_descriptor: dict | None=None,
+        **kwargs
+    ) -> None:
+        self.entity_description = description
+        self.property_id = description.property_id
+        self.cadence_descriptor = cadence_descriptor
         BtMeshEntity.__init__(self, *args, **kwargs)
 
         # update sensor unique_id and name attributes
         self._attr_unique_id = BtMeshEntity.unique_id_sensor(self.cfg_model, self.property_id)
         self._attr_name = BtMeshEntity.name_sensor(self.cfg_model, self.property_id)
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self.cadence_descriptor is not None:
+            self.platform.config_entry.async_create_background_task(
+                self.hass,
+                self._async_configure_cadence(),
+                f"{DOMAIN}_sensor_cadence_{self.unique_id}"
+            )
+
+    async def _async_configure_cadence(self) -> None:
+        """The node publishes the significant changes of the property once
+           its cadence is set, if its Sensor Server publication is configured.
+           Polling is not stopped, the property is polled slowly: a confirmed
+           cadence doesn't prove the publication, the node without it is
+           still refreshed. The received statuses keep the others up to date,
+           they are rarely queried."""
+        sensor_cadence = self.platform.config_entry.runtime_data.sensor_cadence
+        if await sensor_cadence.async_configure(
+            self.app, self.cfg_model, self.property_id, self.cadence_descriptor
+        ):
+            self.update_timeout = max(
+                self.update_timeout, G_SENSOR_CADENCE_POLL_INTERVAL
+            )
+            self.invalidate_timeout = max(
+                self.invalidate_timeout, G_SENSOR_CADENCE_POLL_INTERVAL * 2.5
+            )
+
+    @callback
     def receive_message(
         self,
         source: int,
@@ -197,7 +280,7 @@ class BtMeshSensorEntity(BtMeshEntity, SensorEntity):
         message: ParsedMeshMessage
     ):
         """Receive status reports from Sensor model."""
-        opcode_name = BtMeshOpcode.get(message.opcode).name.lower()
+        opcode_name = opcode_key(message.opcode)
         match message.opcode:
             case SensorOpcode.SENSOR_STATUS:
                 for property in message[opcode_name]:
@@ -216,171 +299,118 @@ class BtMeshSensorEntity(BtMeshEntity, SensorEntity):
             property_id=self.property_id,
         )
 
-    async def sensor_get(self):
+    def sensor_get(self, prop: any) -> float | str | date | None:
         """Extract sensor value from response."""
-        try:
-            prop = self.model_state
-            for key in self.argument_keys:
-                prop = prop[key]
-            return round(float(prop), self.argument_round)
-        except TypeError:
-            pass
-        except Exception as e:
-            _LOGGER.error(f"BtMeshSensor: sensor_get(): {e}")
+        if prop is None:
             return None
+        return sensor_value(prop, self.entity_description)
 
-    async def async_update(self) -> None:
-        """Fetch new state data for the sensor."""
-        self._attr_native_value = await self.sensor_get()
+    @callback
+    def update_attributes(self, state: any) -> None:
+        """Sensor value of the property state."""
+        self._attr_native_value = self.sensor_get(state)
         self._attr_available = self._attr_native_value is not None
 
 
-class BtMeshSensor_PresentDeviceInputPower(BtMeshSensorEntity):
-    """Present Input Power sensor"""
+@dataclass(frozen=True, kw_only=True)
+class BtMeshMetricSensorEntityDescription(SensorEntityDescription):
+    """Network request metric description."""
+    value_fn: Callable[[BtMeshMetrics], float | None]
 
-    property_id = PropertyID.PRESENT_DEVICE_INPUT_POWER
-    entity_description = SensorEntityDescription(
-        key="present_device_input_power",
-        device_class=SensorDeviceClass.POWER,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        state_class=SensorStateClass.MEASUREMENT,
-        name="Power",
-    )
-    argument_keys = ["present_device_input_power", "power"]
-
-
-class BtMeshSensor_PresentInputCurrent(BtMeshSensorEntity):
-    """Present Input Current sensor."""
 
-    property_id = PropertyID.PRESENT_INPUT_CURRENT
-    entity_description = SensorEntityDescription(
-        key="present_input_current",
-        device_class=SensorDeviceClass.CURRENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        state_class=SensorStateClass.MEASUREMENT,
-        name="Current",
-    )
-    argument_keys = ["present_input_current", "current"]
+def _mean_ms(metric: str) -> Callable[[BtMeshMetrics], float | None]:
+    def value_fn(metrics: BtMeshMetrics) -> float | None:
+        mean = metrics.mean(metric)
+        return round(mean * 1000, 1) if mean is not None else None
+    return value_fn
 
 
-class BtMeshSensor_PreciseTotalDeviceEnergyUse(BtMeshSensorEntity):
-    """Energy Use sensor."""
-
-    property_id = PropertyID.PRECISE_TOTAL_DEVICE_ENERGY_USE
-    entity_description = SensorEntityDescription(
-        key="totalenergy",
-        device_class=SensorDeviceClass.ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+METRIC_SENSORS: tuple[BtMeshMetricSensorEntityDescription, ...] = (
+    BtMeshMetricSensorEntityDescription(
+        key=METRIC_REQUESTS,
+        name="Requests",
         state_class=SensorStateClass.TOTAL_INCREASING,
-        name="Total Energy",
-    )
-    argument_keys = ["precise_total_device_energy_use", "energy"]
-
-
-class BtMeshSensor_PresentInputVoltage(BtMeshSensorEntity):
-    """Input Voltage sensor"""
-
-    property_id = PropertyID.PRESENT_INPUT_VOLTAGE
-    entity_description = SensorEntityDescription(
-        key="present_input_voltage",
-        device_class=SensorDeviceClass.VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        value_fn=lambda metrics: metrics.total(METRIC_REQUESTS),
+    ),
+    BtMeshMetricSensorEntityDescription(
+        key=METRIC_TIMEOUTS,
+        name="Request timeouts",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.total(METRIC_TIMEOUTS),
+    ),
+    BtMeshMetricSensorEntityDescription(
+        key=METRIC_RETRANSMISSIONS,
+        name="Retransmissions",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.total(METRIC_RETRANSMISSIONS),
+    ),
+    BtMeshMetricSensorEntityDescription(
+        key=METRIC_RTT,
+        name="Mean round trip time",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
         state_class=SensorStateClass.MEASUREMENT,
-        name="Voltage",
-    )
-    argument_keys = ["present_input_voltage", "voltage"]
-
-
-class BtMeshSensor_Desired_Ambient_Temperature(BtMeshSensorEntity):
-    """Desired Ambient Temperatire sensor"""
-
-    property_id = PropertyID.DESIRED_AMBIENT_TEMPERATURE
-    entity_description = SensorEntityDescription(
-        key="desired_ambient_temperature",
-        device_class=SensorDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        value_fn=_mean_ms(METRIC_RTT),
+    ),
+    BtMeshMetricSensorEntityDescription(
+        key=METRIC_QUEUE_WAIT,
+        name="Mean queue wait",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
         state_class=SensorStateClass.MEASUREMENT,
-        name="Desired ambient temperatire",
-    )
-    argument_keys = ["desired_ambient_temperature", "temperature"]
-
-
-class BtMeshSensor_Precise_Present_Ambient_Temperature(BtMeshSensorEntity):
-    """Ambient Temperature sensor"""
-
-    property_id = PropertyID.PRECISE_PRESENT_AMBIENT_TEMPERATURE
-    entity_description = SensorEntityDescription(
-        key="precise_present_ambient_temperature",
-        device_class=SensorDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        value_fn=_mean_ms(METRIC_QUEUE_WAIT),
+    ),
+    BtMeshMetricSensorEntityDescription(
+        key=METRIC_CONFIRM_LATENCY,
+        name="Mean confirm latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
         state_class=SensorStateClass.MEASUREMENT,
-        name="Ambient temperatire",
-    )
-    argument_keys = ["precise_present_ambient_temperature", "temperature"]
-
-class BtMeshSensor_Precise_Present_Ambient_Temperature(BtMeshSensorEntity):
-    """Ambient Temperature sensor"""
-
-    property_id = PropertyID.PRECISE_PRESENT_AMBIENT_TEMPERATURE
-    entity_description = SensorEntityDescription(
-        key="precise_present_ambient_temperature",
-        device_class=SensorDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        value_fn=_mean_ms(METRIC_CONFIRM_LATENCY),
+    ),
+    BtMeshMetricSensorEntityDescription(
+        key=METRIC_GET_QUEUE_DEPTH,
+        name="Request queue depth",
         state_class=SensorStateClass.MEASUREMENT,
-        name="Ambient temperatire",
-    )
-    argument_keys = ["precise_present_ambient_temperature", "temperature"]
+        value_fn=lambda metrics: metrics.gauge(METRIC_GET_QUEUE_DEPTH),
+    ),
+    BtMeshMetricSensorEntityDescription(
+        key=METRIC_REFRESH_QUEUE_DEPTH,
+        name="Refresh queue depth",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.gauge(METRIC_REFRESH_QUEUE_DEPTH),
+    ),
+)
 
-class BtMeshSensor_Present_Ambient_Relative_Humidity(BtMeshSensorEntity):
-    """Ambient Humidity sensor"""
 
-    property_id = PropertyID.PRESENT_AMBIENT_RELATIVE_HUMIDITY
-    entity_description = SensorEntityDescription(
-        key="present_ambient_relative_humidity",
-        device_class=SensorDeviceClass.HUMIDITY,
-        native_unit_of_measurement=PERCENTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        name="Ambient humidity",
-    )
-    argument_keys = ["present_ambient_relative_humidity", "humidity"]
+class BtMeshMetricSensorEntity(SensorEntity):
+    """Diagnostic sensor of the network request metrics."""
 
-class BtMeshSensor_Present_Indoor_Relative_Humidity(BtMeshSensorEntity):
-    """Indoor Humidity sensor"""
+    entity_description: BtMeshMetricSensorEntityDescription
 
-    property_id = PropertyID.PRESENT_INDOOR_RELATIVE_HUMIDITY
-    entity_description = SensorEntityDescription(
-        key="present_indoor_relative_humidity",
-        device_class=SensorDeviceClass.HUMIDITY,
-        native_unit_of_measurement=PERCENTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        name="Indoor humidity",
-    )
-    argument_keys = ["present_indoor_relative_humidity", "humidity"]
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
 
-class BtMeshSensor_Present_Outdoor_Relative_Humidity(BtMeshSensorEntity):
-    """Outdoor Humidity sensor"""
+    def __init__(
+        self,
+        config_entry: ConfigType,
+        metrics: BtMeshMetrics,
+        description: BtMeshMetricSensorEntityDescription
+    ) -> None:
+        self.entity_description = description
+        self.metrics = metrics
+        self._attr_unique_id = f"{config_entry.entry_id}-metrics-{description.key}"
+        self._attr_name = f"{DOMAIN} {config_entry.title} {description.name}"
 
-    property_id = PropertyID.PRESENT_OUTDOOR_RELATIVE_HUMIDITY
-    entity_description = SensorEntityDescription(
-        key="present_outdoor_relative_humidity",
-        device_class=SensorDeviceClass.HUMIDITY,
-        native_unit_of_measurement=PERCENTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        name="Outdoor humidity",
-    )
-    argument_keys = ["present_outdoor_relative_humidity", "humidity"]
+    @property
+    def native_value(self) -> float | None:
+        return self.entity_description.value_fn(self.metrics)
 
 
 class BtMeshSensorEntityFactory(object):
     @staticmethod
-    def get(property_id: PropertyID) -> object:
-        if type(property_id) != PropertyID:
-            raise ValueError("property_id must be PropertyID")
-
-        raw_subclasses_ = BtMeshSensorEntity.__subclasses__()
-        classes: dict[int, Callable[..., object]] = {c.property_id:c for c in raw_subclasses_}
-        class_ = classes.get(property_id, None)
-        if class_ is not None:
-            return class_
+    def get(property_id: PropertyID | int) -> BtMeshSensorEntityDescription:
+        """Sensor property description from the precomputed registry."""
+        if not isinstance(property_id, int):
+            raise ValueError(f"property_id must be int or PropertyID, got {property_id!r}")
 
-        raise ClassNotFoundError
+        return get_sensor_description(property_id)
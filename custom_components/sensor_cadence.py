@@ -0,0 +1,129 @@
+"""BT Mesh sensor cadence derived from the sensor descriptors."""
+from __future__ import annotations
+
+import asyncio
+import math
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from bt_mesh_ctrl.mesh_cfgclient_conf import MeshCfgModel
+
+from .const import (
+    STORAGE_SENSOR_CADENCE,
+    G_SENSOR_CADENCE_CONCURRENCY,
+    G_SENSOR_CADENCE_SAVE_DELAY,
+    G_SENSOR_CADENCE_MIN_DELTA,
+    G_SENSOR_CADENCE_MIN_INTERVAL,
+)
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+
+
+# trigger deltas are percent of the measured value
+STATUS_TRIGGER_TYPE_PERCENT = 1
+
+# sensor tolerance is 12-bit, 4095 is 100 %, 0 is unspecified
+SENSOR_TOLERANCE_MAX = 4095
+
+# status min interval is 2^n ms
+STATUS_MIN_INTERVAL_MAX_EXP = 26
+
+
+def tolerance_percent(tolerance: int) -> float | None:
+    return tolerance * 100 / SENSOR_TOLERANCE_MAX if tolerance else None
+
+
+def cadence_from_descriptor(descriptor: dict) -> dict:
+    """Sensor Cadence of the property: status is published when the value
+       changes more than the measurement tolerance, at most once per the
+       measurement period, otherwise with the publish period.
+
+       Fast cadence is not used: the period divisor exponent is 0 (divisor
+       1) and the fast cadence range is empty, the descriptors carry no
+       thresholds to center it on. Both the divisor and the min interval
+       are sent as the exponent n, the interval is 2^n ms."""
+    delta_down = tolerance_percent(descriptor["sensor_negative_tolerance"]) or 0
+    delta_up = tolerance_percent(descriptor["sensor_positive_tolerance"]) or 0
+    min_interval = max(float(descriptor["sensor_measurement_period"]), G_SENSOR_CADENCE_MIN_INTERVAL)
+    exponent = min(math.ceil(math.log2(min_interval * 1000)), STATUS_MIN_INTERVAL_MAX_EXP)
+    return {
+        "fast_cadence_period_divisor": 0,
+        "status_trigger_type": STATUS_TRIGGER_TYPE_PERCENT,
+        "status_trigger_delta_down": round(max(delta_down, G_SENSOR_CADENCE_MIN_DELTA), 1),
+        "status_trigger_delta_up": round(max(delta_up, G_SENSOR_CADENCE_MIN_DELTA), 1),
+        "status_min_interval": exponent,
+        "fast_cadence_low": 0,
+        "fast_cadence_high": 0,
+    }
+
+
+class BtMeshSensorCadence:
+    """Sensor cadence configured on the nodes keyed by the unicast address
+       and property, saved so the configured nodes are not set again."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self.hass = hass
+        self._store: Store[dict[str, dict]] = Store(hass, 1, f"{STORAGE_SENSOR_CADENCE}.{entry_id}")
+        self._data: dict[str, dict] = {}
+        self._semaphore = asyncio.Semaphore(G_SENSOR_CADENCE_CONCURRENCY)
+
+    async def async_load(self) -> None:
+        self._data = await self._store.async_load() or {}
+        _LOGGER.debug(f"BtMeshSensorCadence: loaded {len(self._data)} properties")
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    async def async_configure(
+        self,
+        app: BtMeshApplication,
+        cfg_model: MeshCfgModel,
+        property_id: int,
+        descriptor: dict
+    ) -> bool:
+        """Set the cadence of the property on the node, True if the node
+           publishes the property changes."""
+        key = f"{cfg_model.unicast_addr:04x}:{int(property_id):04x}"
+        cadence = cadence_from_descriptor(descriptor)
+        if self._data.get(key) == cadence:
+            return True
+
+        async with self._semaphore:
+            status = await app.sensor_cadence_set(
+                destination=cfg_model.unicast_addr,
+                app_index=cfg_model.app_key,
+                property_id=property_id,
+                **cadence
+            )
+        if status is None:
+            _LOGGER.debug(f"sensor cadence {key} is not confirmed")
+            return False
+
+        _LOGGER.debug(f"sensor cadence {key}: {cadence}")
+        self._data[key] = cadence
+        self._async_schedule_save()
+        return True
+
+    @callback
+    def async_pop_node(self, unicast_addr_key: str) -> None:
+        """Forget the cadence of the removed node."""
+        keys = [key for key in self._data if key.startswith(f"{unicast_addr_key}:")]
+        for key in keys:
+            del self._data[key]
+        if keys:
+            self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, G_SENSOR_CADENCE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict]:
+        return self._data
+
+    async def async_remove(self) -> None:
+        """Remove the cadence records of the removed config entry."""
+        await self._store.async_remove()
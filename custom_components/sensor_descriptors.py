@@ -0,0 +1,195 @@
+"""BT Mesh sensor descriptors repository."""
+from __future__ import annotations
+
+import time
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    STORAGE_SENSOR_DESCRIPTORS,
+    STORAGE_SENSOR_DESCRIPTOR_TEMPLATES,
+    G_SENSOR_DESCRIPTORS_SAVE_DELAY,
+    G_SENSOR_DESCRIPTORS_BACKOFF_MIN,
+    G_SENSOR_DESCRIPTORS_BACKOFF_MAX,
+)
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+
+
+def template_key(cfg_device: any) -> str:
+    """Descriptors template key, identical products with the same firmware
+       have the same sensor descriptors."""
+    return f"{cfg_device.cid:04x}:{cfg_device.pid:04x}:{cfg_device.vid:04x}"
+
+
+class BtMeshSensorDescriptorTemplates:
+    """Sensor descriptors templates keyed by the product and firmware
+       version, shared by the entries, kept in memory and saved with a
+       delay only when changed."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._store: Store[dict[str, list]] = Store(hass, 1, STORAGE_SENSOR_DESCRIPTOR_TEMPLATES)
+        self._templates: dict[str, list[dict]] = {}
+        # products with the nodes storing different descriptors
+        self._invalid_templates: set[str] = set()
+
+    async def async_load(self) -> None:
+        """Load templates from persistent storage."""
+        self._templates = await self._store.async_load() or {}
+        _LOGGER.debug(f"BtMeshSensorDescriptorTemplates: loaded {len(self._templates)} templates")
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def get(self, cfg_device: any) -> list[dict] | None:
+        return self._templates.get(template_key(cfg_device))
+
+    @callback
+    def async_set(self, cfg_device: any, descriptors: list[dict], fetched: bool=False) -> None:
+        """Remember descriptors of the product. The descriptors fetched from
+           the node replace the template, the stored descriptors of a node
+           differing from it invalidate the template, the nodes of the
+           product are fetched until the new one is known."""
+        key = template_key(cfg_device)
+        template = self._templates.get(key)
+        if template == descriptors:
+            return
+        if fetched:
+            if template is not None:
+                _LOGGER.debug(f"BtMeshSensorDescriptorTemplates: template {key} is updated")
+            self._invalid_templates.discard(key)
+            self._templates[key] = descriptors
+        elif key in self._invalid_templates:
+            return
+        elif template is None:
+            self._templates[key] = descriptors
+        else:
+            _LOGGER.info(
+                f"BtMeshSensorDescriptorTemplates: nodes of {key} have different "
+                f"descriptors, template is dropped"
+            )
+            self._invalid_templates.add(key)
+            del self._templates[key]
+        self._store.async_delay_save(self._data_to_save, G_SENSOR_DESCRIPTORS_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, list[dict]]:
+        return self._templates
+
+
+class BtMeshSensorDescriptors:
+    """Sensor descriptors of the entry nodes keyed by the unicast address,
+       kept in memory and saved with a delay only when changed. The product
+       templates are shared by the entries."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        templates: BtMeshSensorDescriptorTemplates
+    ) -> None:
+        self.hass = hass
+        self._store: Store[dict[str, list]] = Store(
+            hass, 1, f"{STORAGE_SENSOR_DESCRIPTORS}.{entry_id}"
+        )
+        self._data: dict[str, list[dict]] = {}
+        self._templates = templates
+
+    async def async_load(self) -> None:
+        """Load descriptors from persistent storage."""
+        self._data = await self._store.async_load() or {}
+        _LOGGER.debug(f"BtMeshSensorDescriptors: loaded {len(self._data)} nodes")
+
+    async def async_remove(self) -> None:
+        """Remove descriptors from persistent storage."""
+        await self._store.async_remove()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def templates_count(self) -> int:
+        return len(self._templates)
+
+    def __contains__(self, unicast_addr_key: str) -> bool:
+        return unicast_addr_key in self._data
+
+    def get(self, unicast_addr_key: str, default: any=None) -> list[dict] | None:
+        return self._data.get(unicast_addr_key, default)
+
+    @callback
+    def async_set(self, unicast_addr_key: str, descriptors: list[dict]) -> None:
+        """Set node descriptors, schedule save if changed."""
+        if self._data.get(unicast_addr_key) == descriptors:
+            return
+        self._data[unicast_addr_key] = descriptors
+        self._async_schedule_save()
+
+    @callback
+    def async_pop(self, unicast_addr_key: str) -> list[dict] | None:
+        """Remove node descriptors, schedule save if removed."""
+        descriptors = self._data.pop(unicast_addr_key, None)
+        if descriptors is not None:
+            self._async_schedule_save()
+        return descriptors
+
+    def get_template(self, cfg_device: any) -> list[dict] | None:
+        return self._templates.get(cfg_device)
+
+    @callback
+    def async_set_template(self, cfg_device: any, descriptors: list[dict], fetched: bool=False) -> None:
+        """Remember descriptors of the product in the shared templates."""
+        self._templates.async_set(cfg_device, descriptors, fetched)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, G_SENSOR_DESCRIPTORS_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, list[dict]]:
+        return self._data
+
+
+class RetryBackoff:
+    """Per node exponential backoff of the failed requests."""
+
+    def __init__(
+        self,
+        min_delay: float=G_SENSOR_DESCRIPTORS_BACKOFF_MIN,
+        max_delay: float=G_SENSOR_DESCRIPTORS_BACKOFF_MAX
+    ) -> None:
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        # key: (failed attempts, monotonic time of the next attempt)
+        self._nodes: dict[str, tuple[int, float]] = {}
+
+    def ready(self, key: str) -> bool:
+        """The node can be requested now."""
+        node = self._nodes.get(key)
+        return node is None or node[1] <= time.monotonic()
+
+    def failed(self, key: str) -> None:
+        attempts = self._nodes.get(key, (0, 0))[0] + 1
+        delay = min(self.min_delay * 2 ** (attempts - 1), self.max_delay)
+        self._nodes[key] = (attempts, time.monotonic() + delay)
+
+    def succeeded(self, key: str) -> None:
+        self._nodes.pop(key, None)
+
+    def as_dict(self) -> dict:
+        """Failed nodes with the attempts and time to the next attempt."""
+        now = time.monotonic()
+        return {
+            key: {"attempts": attempts, "retry_in": round(max(0.0, retry - now), 1)}
+                for key, (attempts, retry) in self._nodes.items()
+        }
+
+    def next_retry_delay(self, default: float) -> float:
+        """Delay until the first node backoff expires."""
+        if not self._nodes:
+            return default
+        return max(0.0, min(node[1] for node in self._nodes.values()) - time.monotonic())
@@ -0,0 +1,417 @@
+"""BT Mesh sensor properties registry."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from enum import Enum
+from functools import cache
+from typing import TYPE_CHECKING
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorStateClass,
+    SensorEntityDescription,
+)
+from homeassistant.const import (
+    CONCENTRATION_PARTS_PER_BILLION,
+    CONCENTRATION_PARTS_PER_MILLION,
+    LIGHT_LUX,
+    PERCENTAGE,
+    UnitOfApparentPower,
+    UnitOfElectricCurrent,
+    UnitOfElectricPotential,
+    UnitOfEnergy,
+    UnitOfFrequency,
+    UnitOfPower,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+
+if TYPE_CHECKING:
+    from bluetooth_mesh.messages.properties import PropertyID
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+
+
+@dataclass(frozen=True, kw_only=True)
+class BtMeshSensorEntityDescription(SensorEntityDescription):
+    """Sensor property description, the value is found in the decoded
+       Sensor Status property by value_path and multiplied by scale."""
+    property_id: PropertyID | int
+    value_path: tuple[str, ...] = ()
+    scale: float = 1.0
+    precision: int = 2
+    numeric: bool = True
+
+
+# Characteristics: value field, device class, unit, state class, the value
+# field is a dotted path in the property format, empty for a bare value
+CHARACTERISTICS: dict[str, tuple] = {
+    # temperature
+    "temperature": ("temperature", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS, SensorStateClass.MEASUREMENT),
+    "temperature_statistics": ("average_temperature", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS, SensorStateClass.MEASUREMENT),
+    "temperature_range": ("minimum_temperature", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS, None),
+    "temperature_rating": ("temperature", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS, None),
+    "humidity": ("humidity", SensorDeviceClass.HUMIDITY, PERCENTAGE, SensorStateClass.MEASUREMENT),
+    "co2": ("concentration", SensorDeviceClass.CO2, CONCENTRATION_PARTS_PER_MILLION, SensorStateClass.MEASUREMENT),
+    "voc": ("concentration", SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS_PARTS, CONCENTRATION_PARTS_PER_BILLION, SensorStateClass.MEASUREMENT),
+    # light
+    "illuminance": ("illuminance", SensorDeviceClass.ILLUMINANCE, LIGHT_LUX, SensorStateClass.MEASUREMENT),
+    "luminous_flux": ("luminous_flux", None, "lm", SensorStateClass.MEASUREMENT),
+    "luminous_flux_range": ("minimum_luminous_flux", None, "lm", None),
+    "luminous_intensity": ("luminous_intensity", None, "cd", None),
+    "luminous_efficacy": ("luminous_efficacy", None, "lm/W", SensorStateClass.MEASUREMENT),
+    "luminous_energy": ("luminous_energy", None, "lm·h", SensorStateClass.TOTAL_INCREASING),
+    "luminous_exposure": ("luminous_exposure", None, "lx·h", SensorStateClass.TOTAL_INCREASING),
+    "light_output": ("light_output", None, "lm", None),
+    "lightness": ("perceived_lightness", None, None, None),
+    "color_temperature": ("correlated_color_temperature", None, UnitOfTemperature.KELVIN, SensorStateClass.MEASUREMENT),
+    "chromaticity": ("chromaticity_x_coordinate", None, None, SensorStateClass.MEASUREMENT),
+    "chromaticity_tolerance": ("chromaticity_tolerance", None, None, None),
+    "planckian_distance": ("distance_from_planckian", None, None, SensorStateClass.MEASUREMENT),
+    "color_rendering_index": ("color_rendering_index", None, None, None),
+    "coefficient": ("coefficient", None, None, None),
+    "time_setting": ("seconds", SensorDeviceClass.DURATION, UnitOfTime.SECONDS, None),
+    # electrical
+    "current": ("current", SensorDeviceClass.CURRENT, UnitOfElectricCurrent.AMPERE, SensorStateClass.MEASUREMENT),
+    "current_average": ("electric_current_value", SensorDeviceClass.CURRENT, UnitOfElectricCurrent.AMPERE, SensorStateClass.MEASUREMENT),
+    "current_statistics": ("average_electric_current_value", SensorDeviceClass.CURRENT, UnitOfElectricCurrent.AMPERE, SensorStateClass.MEASUREMENT),
+    "current_range": ("minimum_electric_current_value", SensorDeviceClass.CURRENT, UnitOfElectricCurrent.AMPERE, None),
+    "current_specification": ("typical_electric_current_value", SensorDeviceClass.CURRENT, UnitOfElectricCurrent.AMPERE, None),
+    "voltage": ("voltage", SensorDeviceClass.VOLTAGE, UnitOfElectricPotential.VOLT, SensorStateClass.MEASUREMENT),
+    "voltage_average": ("voltage_value", SensorDeviceClass.VOLTAGE, UnitOfElectricPotential.VOLT, SensorStateClass.MEASUREMENT),
+    "voltage_statistics": ("average_voltage_value", SensorDeviceClass.VOLTAGE, UnitOfElectricPotential.VOLT, SensorStateClass.MEASUREMENT),
+    "voltage_range": ("typical_voltage_value", SensorDeviceClass.VOLTAGE, UnitOfElectricPotential.VOLT, None),
+    "voltage_rating": ("voltage", SensorDeviceClass.VOLTAGE, UnitOfElectricPotential.VOLT, None),
+    "high_voltage": ("high_voltage", SensorDeviceClass.VOLTAGE, UnitOfElectricPotential.VOLT, SensorStateClass.MEASUREMENT),
+    "voltage_frequency": ("voltage_frequency", SensorDeviceClass.FREQUENCY, UnitOfFrequency.HERTZ, SensorStateClass.MEASUREMENT),
+    "frequency": ("frequency", SensorDeviceClass.FREQUENCY, UnitOfFrequency.HERTZ, SensorStateClass.MEASUREMENT),
+    "power": ("power", SensorDeviceClass.POWER, UnitOfPower.WATT, SensorStateClass.MEASUREMENT),
+    "power_specification": ("typical_power_value", SensorDeviceClass.POWER, UnitOfPower.WATT, None),
+    "power_rating": ("power", SensorDeviceClass.POWER, UnitOfPower.WATT, None),
+    "apparent_power": ("power", SensorDeviceClass.APPARENT_POWER, UnitOfApparentPower.VOLT_AMPERE, SensorStateClass.MEASUREMENT),
+    "power_factor": ("cosine_of_the_angle", SensorDeviceClass.POWER_FACTOR, None, SensorStateClass.MEASUREMENT),
+    "energy": ("energy", SensorDeviceClass.ENERGY, UnitOfEnergy.KILO_WATT_HOUR, SensorStateClass.TOTAL_INCREASING),
+    "energy_period": ("energy_value", SensorDeviceClass.ENERGY, UnitOfEnergy.KILO_WATT_HOUR, SensorStateClass.TOTAL),
+    "apparent_energy": ("energy", None, "kVAh", SensorStateClass.TOTAL_INCREASING),
+    # counters
+    "percentage": ("percentage", None, PERCENTAGE, SensorStateClass.MEASUREMENT),
+    "relative_value": ("relative_value", None, PERCENTAGE, SensorStateClass.MEASUREMENT),
+    "count": ("count", None, None, SensorStateClass.MEASUREMENT),
+    "counter": ("count", None, None, SensorStateClass.TOTAL_INCREASING),
+    "count_rating": ("count", None, None, None),
+    "events": ("number_of_events.count", None, None, SensorStateClass.TOTAL_INCREASING),
+    "hours": ("hours", SensorDeviceClass.DURATION, UnitOfTime.HOURS, SensorStateClass.TOTAL_INCREASING),
+    "hours_rating": ("hours", SensorDeviceClass.DURATION, UnitOfTime.HOURS, None),
+    "seconds": ("seconds", SensorDeviceClass.DURATION, UnitOfTime.SECONDS, SensorStateClass.MEASUREMENT),
+    "seconds_total": ("seconds", SensorDeviceClass.DURATION, UnitOfTime.SECONDS, SensorStateClass.TOTAL_INCREASING),
+    "boolean": ("presence_detected", None, None, None),
+    # device information
+    "string": ("", None, None, None),
+    "date": ("date", SensorDeviceClass.DATE, None, None),
+    "country": ("country_code", None, None, None),
+    "gtin": ("global_trade_item_number", None, None, None),
+    "appearance": ("category", None, None, None),
+    "light_distribution": ("light_distribution", None, None, None),
+    "light_source_type": ("light_source_type", None, None, None),
+}
+
+# Characteristics decoded in the raw resolution: scale to the unit
+SCALES: dict[str, float] = {
+    # cosine of the angle, resolution 0.01
+    "power_factor": 0.01,
+}
+
+# Characteristics reported as is instead of a number
+TEXT_CHARACTERISTICS = frozenset((
+    "string", "date", "country", "gtin", "appearance", "light_distribution", "light_source_type",
+))
+
+# Mesh Device Properties: property, characteristic, name
+# RELATIVE_RUNTIME_IN_A_CORRELATED_COLOR_TEMPERATURE_RANGE is left out, the
+# bluetooth_mesh decodes it with the Luminous Energy format
+PROPERTIES: tuple[tuple[str, str, str], ...] = (
+    # temperature
+    ("AVERAGE_AMBIENT_TEMPERATURE_IN_A_PERIOD_OF_DAY", "temperature", "Average ambient temperature"),
+    ("DESIRED_AMBIENT_TEMPERATURE", "temperature", "Desired ambient temperature"),
+    ("DEVICE_OPERATING_TEMPERATURE_RANGE_SPECIFICATION", "temperature_range", "Device operating temperature range specification"),
+    ("DEVICE_OPERATING_TEMPERATURE_STATISTICAL_VALUES", "temperature_statistics", "Device operating temperature statistical values"),
+    ("INDOOR_AMBIENT_TEMPERATURE_STATISTICAL_VALUES", "temperature_statistics", "Indoor ambient temperature statistical values"),
+    ("LIGHT_SOURCE_TEMPERATURE", "temperature", "Light source temperature"),
+    ("OUTDOOR_STATISTICAL_VALUES", "temperature_statistics", "Outdoor temperature statistical values"),
+    ("PRECISE_PRESENT_AMBIENT_TEMPERATURE", "temperature", "Ambient temperature"),
+    ("PRESENT_AMBIENT_TEMPERATURE", "temperature", "Ambient temperature"),
+    ("PRESENT_DEVICE_OPERATING_TEMPERATURE", "temperature", "Device operating temperature"),
+    ("PRESENT_INDOOR_AMBIENT_TEMPERATURE", "temperature", "Indoor temperature"),
+    ("PRESENT_OUTDOOR_AMBIENT_TEMPERATURE", "temperature", "Outdoor temperature"),
+    ("REFERENCE_TEMPERATURE", "temperature_rating", "Reference temperature"),
+    # humidity
+    ("PRESENT_AMBIENT_RELATIVE_HUMIDITY", "humidity", "Ambient humidity"),
+    ("PRESENT_INDOOR_RELATIVE_HUMIDITY", "humidity", "Indoor humidity"),
+    ("PRESENT_OUTDOOR_RELATIVE_HUMIDITY", "humidity", "Outdoor humidity"),
+    # air quality
+    ("PRESENT_AMBIENT_CARBON_DIOXIDE_CONCENTRATION", "co2", "Carbon dioxide"),
+    ("PRESENT_AMBIENT_VOLATILE_ORGANIC_COMPOUNDS_CONCENTRATION", "voc", "Volatile organic compounds"),
+    # occupancy
+    ("MOTION_SENSED", "percentage", "Motion sensed"),
+    ("MOTION_THRESHOLD", "percentage", "Motion threshold"),
+    ("PEOPLE_COUNT", "count", "People count"),
+    ("PRESENCE_DETECTED", "boolean", "Presence detected"),
+    ("TIME_SINCE_MOTION_SENSED", "seconds", "Time since motion sensed"),
+    ("TIME_SINCE_PRESENCE_DETECTED", "seconds", "Time since presence detected"),
+    # light
+    ("CENTER_BEAM_INTENSITY_AT_FULL_POWER", "luminous_intensity", "Center beam intensity at full power"),
+    ("CHROMATICITY_TOLERANCE", "chromaticity_tolerance", "Chromaticity tolerance"),
+    ("COLOR_RENDERING_INDEX_R9", "color_rendering_index", "Color rendering index R9"),
+    ("COLOR_RENDERING_INDEX_RA", "color_rendering_index", "Color rendering index Ra"),
+    ("INITIAL_CIE1931_CHROMATICITY_COORDINATES", "chromaticity", "Initial CIE 1931 chromaticity coordinates"),
+    ("INITIAL_CORRELATED_COLOR_TEMPERATURE", "color_temperature", "Initial correlated color temperature"),
+    ("INITIAL_LUMINOUS_FLUX", "luminous_flux", "Initial luminous flux"),
+    ("INITIAL_PLANCKIAN_DISTANCE", "planckian_distance", "Initial planckian distance"),
+    ("LIGHT_CONTROL_AMBIENT_LUXLEVEL_ON", "illuminance", "Ambient lux level on"),
+    ("LIGHT_CONTROL_AMBIENT_LUXLEVEL_PROLONG", "illuminance", "Light control ambient lux level prolong"),
+    ("LIGHT_CONTROL_AMBIENT_LUXLEVEL_STANDBY", "illuminance", "Light control ambient lux level standby"),
+    ("LIGHT_DISTRIBUTION", "light_distribution", "Light distribution"),
+    ("LIGHT_SOURCE_TYPE", "light_source_type", "Light source type"),
+    ("LUMINOUS_EFFICACY", "luminous_efficacy", "Luminous efficacy"),
+    ("LUMINOUS_ENERGY_SINCE_TURN_ON", "luminous_energy", "Luminous energy since turn on"),
+    ("LUMINOUS_EXPOSURE", "luminous_exposure", "Luminous exposure"),
+    ("LUMINOUS_FLUX_RANGE", "luminous_flux_range", "Luminous flux range"),
+    ("LUMEN_MAINTENANCE_FACTOR", "percentage", "Lumen maintenance factor"),
+    ("NOMINAL_LIGHT_OUTPUT", "light_output", "Nominal light output"),
+    ("PRESENT_AMBIENT_LIGHT_LEVEL", "illuminance", "Ambient light level"),
+    ("PRESENT_CIE1931_CHROMATICITY_COORDINATES", "chromaticity", "Present CIE 1931 chromaticity coordinates"),
+    ("PRESENT_CORRELATED_COLOR_TEMPERATURE", "color_temperature", "Present correlated color temperature"),
+    ("PRESENT_ILLUMINANCE", "illuminance", "Illuminance"),
+    ("PRESENT_LUMINOUS_FLUX", "luminous_flux", "Present luminous flux"),
+    ("PRESENT_PLANCKIAN_DISTANCE", "planckian_distance", "Present planckian distance"),
+    ("TOTAL_LUMINOUS_ENERGY", "luminous_energy", "Total luminous energy"),
+    # light control
+    ("LIGHT_CONTROL_LIGHTNESS_ON", "lightness", "Light control lightness on"),
+    ("LIGHT_CONTROL_LIGHTNESS_PROLONG", "lightness", "Light control lightness prolong"),
+    ("LIGHT_CONTROL_LIGHTNESS_STANDBY", "lightness", "Light control lightness standby"),
+    ("LIGHT_CONTROL_REGULATOR_ACCURACY", "percentage", "Light control regulator accuracy"),
+    ("LIGHT_CONTROL_REGULATOR_KID", "coefficient", "Light control regulator KID"),
+    ("LIGHT_CONTROL_REGULATOR_KIU", "coefficient", "Light control regulator KIU"),
+    ("LIGHT_CONTROL_REGULATOR_KPD", "coefficient", "Light control regulator KPD"),
+    ("LIGHT_CONTROL_REGULATOR_KPU", "coefficient", "Light control regulator KPU"),
+    ("LIGHT_CONTROL_TIME_FADE", "time_setting", "Light control time fade"),
+    ("LIGHT_CONTROL_TIME_FADE_ON", "time_setting", "Light control time fade on"),
+    ("LIGHT_CONTROL_TIME_FADE_STANDBY_AUTO", "time_setting", "Light control time fade standby auto"),
+    ("LIGHT_CONTROL_TIME_FADE_STANDBY_MANUAL", "time_setting", "Light control time fade standby manual"),
+    ("LIGHT_CONTROL_TIME_OCCUPANCY_DELAY", "time_setting", "Light control time occupancy delay"),
+    ("LIGHT_CONTROL_TIME_PROLONG", "time_setting", "Light control time prolong"),
+    ("LIGHT_CONTROL_TIME_RUN_ON", "time_setting", "Light control time run on"),
+    ("SENSOR_GAIN", "coefficient", "Sensor gain"),
+    # electrical
+    ("ACTIVE_ENERGY_LOAD_SIDE", "energy", "Active energy load side"),
+    ("ACTIVE_POWER_LOAD_SIDE", "power", "Active power load side"),
+    ("APPARENT_ENERGY", "apparent_energy", "Apparent energy"),
+    ("APPARENT_POWER", "apparent_power", "Apparent power"),
+    ("AVERAGE_INPUT_CURRENT", "current_average", "Average input current"),
+    ("AVERAGE_INPUT_VOLTAGE", "voltage_average", "Average input voltage"),
+    ("AVERAGE_OUTPUT_CURRENT", "current_average", "Average output current"),
+    ("AVERAGE_OUTPUT_VOLTAGE", "voltage_average", "Average output voltage"),
+    ("DEVICE_ENERGY_USE_SINCE_TURN_ON", "energy", "Energy since turn on"),
+    ("DEVICE_POWER_RANGE_SPECIFICATION", "power_specification", "Device power range specification"),
+    ("EXTERNAL_SUPPLY_VOLTAGE", "high_voltage", "External supply voltage"),
+    ("EXTERNAL_SUPPLY_VOLTAGE_FREQUENCY", "voltage_frequency", "External supply voltage frequency"),
+    ("INPUT_CURRENT_RANGE_SPECIFICATION", "current_specification", "Input current range specification"),
+    ("INPUT_CURRENT_STATISTICS", "current_statistics", "Input current statistics"),
+    ("INPUT_VOLTAGE_RANGE_SPECIFICATION", "voltage_range", "Input voltage range specification"),
+    ("INPUT_VOLTAGE_RIPPLE_SPECIFICATION", "percentage", "Input voltage ripple specification"),
+    ("INPUT_VOLTAGE_STATISTICS", "voltage_statistics", "Input voltage statistics"),
+    ("LIGHT_SOURCE_CURRENT", "current_average", "Light source current"),
+    ("LIGHT_SOURCE_VOLTAGE", "voltage_average", "Light source voltage"),
+    ("LUMINAIRE_NOMINAL_INPUT_POWER", "power_rating", "Luminaire nominal input power"),
+    ("LUMINAIRE_NOMINAL_MAXIMUM_AC_MAINS_VOLTAGE", "voltage_rating", "Luminaire nominal maximum AC mains voltage"),
+    ("LUMINAIRE_NOMINAL_MINIMUM_AC_MAINS_VOLTAGE", "voltage_rating", "Luminaire nominal minimum AC mains voltage"),
+    ("LUMINAIRE_POWER_AT_MINIMUM_DIM_LEVEL", "power_rating", "Luminaire power at minimum dim level"),
+    ("OUTPUT_CURRENT_RANGE", "current_range", "Output current range"),
+    ("OUTPUT_CURRENT_PERCENT", "percentage", "Output current percent"),
+    ("OUTPUT_CURRENT_STATISTICS", "current_statistics", "Output current statistics"),
+    ("OUTPUT_VOLTAGE_RANGE", "voltage_range", "Output voltage range"),
+    ("OUTPUT_RIPPLE_VOLTAGE_SPECIFICATION", "percentage", "Output ripple voltage specification"),
+    ("OUTPUT_VOLTAGE_STATISTICS", "voltage_statistics", "Output voltage statistics"),
+    ("POWER_FACTOR", "power_factor", "Power factor"),
+    ("PRECISE_TOTAL_DEVICE_ENERGY_USE", "energy", "Total Energy"),
+    ("PRESENT_DEVICE_INPUT_POWER", "power", "Power"),
+    ("PRESENT_DEVICE_OPERATING_EFFICIENCY", "percentage", "Operating efficiency"),
+    ("PRESENT_INPUT_CURRENT", "current", "Current"),
+    ("PRESENT_INPUT_VOLTAGE", "voltage", "Voltage"),
+    ("PRESENT_INPUT_RIPPLE_VOLTAGE", "percentage", "Input ripple voltage"),
+    ("PRESENT_OUTPUT_CURRENT", "current", "Output current"),
+    ("PRESENT_OUTPUT_VOLTAGE", "voltage", "Output voltage"),
+    ("PRESENT_RELATIVE_OUTPUT_RIPPLE_VOLTAGE", "percentage", "Output ripple voltage"),
+    ("RELATIVE_DEVICE_ENERGY_USE_IN_A_PERIOD_OF_DAY", "energy_period", "Relative device energy use in a period of day"),
+    ("TOTAL_DEVICE_ENERGY_USE", "energy", "Total Energy"),
+    ("PRESENT_INPUT_FREQUENCY", "frequency", "Input frequency"),
+    # runtime
+    ("DEVICE_OVER_TEMPERATURE_EVENT_STATISTICS", "events", "Device over temperature event statistics"),
+    ("DEVICE_RUNTIME_SINCE_TURN_ON", "hours", "Device runtime since turn on"),
+    ("DEVICE_RUNTIME_WARRANTY", "hours_rating", "Device runtime warranty"),
+    ("DEVICE_UNDER_TEMPERATURE_EVENT_STATISTICS", "events", "Device under temperature event statistics"),
+    ("INPUT_OVER_CURRENT_EVENT_STATISTICS", "events", "Input over current event statistics"),
+    ("INPUT_OVER_RIPPLE_VOLTAGE_EVENT_STATISTICS", "events", "Input over ripple voltage event statistics"),
+    ("INPUT_OVER_VOLTAGE_EVENT_STATISTICS", "events", "Input over voltage event statistics"),
+    ("INPUT_UNDER_CURRENT_EVENT_STATISTICS", "events", "Input under current event statistics"),
+    ("INPUT_UNDER_VOLTAGE_EVENT_STATISTICS", "events", "Input under voltage event statistics"),
+    ("LIGHT_SOURCE_ON_TIME_NOT_RESETTABLE", "seconds_total", "Light source on time not resettable"),
+    ("LIGHT_SOURCE_ON_TIME_RESETTABLE", "seconds_total", "Light source on time resettable"),
+    ("LIGHT_SOURCE_OPEN_CIRCUIT_STATISTICS", "events", "Light source open circuit statistics"),
+    ("LIGHT_SOURCE_OVERALL_FAILURES_STATISTICS", "events", "Light source overall failures statistics"),
+    ("LIGHT_SOURCE_SHORT_CIRCUIT_STATISTICS", "events", "Light source short circuit statistics"),
+    ("LIGHT_SOURCE_START_COUNTER_RESETTABLE", "counter", "Light source start counter resettable"),
+    ("LIGHT_SOURCE_THERMAL_DERATING_STATISTICS", "events", "Light source thermal derating statistics"),
+    ("LIGHT_SOURCE_THERMAL_SHUTDOWN_STATISTICS", "events", "Light source thermal shutdown statistics"),
+    ("LIGHT_SOURCE_TOTAL_POWER_ON_CYCLES", "counter", "Light source total power on cycles"),
+    ("OPEN_CIRCUIT_EVENT_STATISTICS", "events", "Open circuit event statistics"),
+    ("OUTPUT_POWER_LIMITATION", "events", "Output power limitation events"),
+    ("OVERALL_FAILURE_CONDITION", "events", "Overall failure condition"),
+    ("OVER_OUTPUT_RIPPLE_VOLTAGE_EVENT_STATISTICS", "events", "Over output ripple voltage event statistics"),
+    ("RATED_MEDIAN_USEFUL_LIFE_OF_LUMINAIRE", "hours_rating", "Rated median useful life of luminaire"),
+    ("RATED_MEDIAN_USEFUL_LIGHT_SOURCE_STARTS", "count_rating", "Rated median useful light source starts"),
+    ("RELATIVE_DEVICE_RUNTIME_IN_A_GENERIC_LEVEL_RANGE", "relative_value", "Relative device runtime in a generic level range"),
+    ("RELATIVE_EXPOSURE_TIME_IN_AN_ILLUMINANCE_RANGE", "relative_value", "Relative exposure time in an illuminance range"),
+    ("RELATIVE_RUNTIME_IN_AN_INPUT_CURRENT_RANGE", "relative_value", "Relative runtime in an input current range"),
+    ("RELATIVE_RUNTIME_IN_AN_INPUT_VOLTAGE_RANGE", "relative_value", "Relative runtime in an input voltage range"),
+    ("RELATIVE_RUNTIME_IN_A_DEVICE_OPERATING_TEMPERATURE_RANGE", "relative_value", "Relative runtime in a device operating temperature range"),
+    ("SHORT_CIRCUIT_EVENT_STATISTICS", "events", "Short circuit event statistics"),
+    ("THERMAL_DERATING", "events", "Thermal derating"),
+    ("TOTAL_DEVICE_OFF_ON_CYCLES", "counter", "Total device off on cycles"),
+    ("TOTAL_DEVICE_POWER_ON_CYCLES", "counter", "Power on cycles"),
+    ("TOTAL_DEVICE_POWER_ON_TIME", "hours", "Total power on time"),
+    ("TOTAL_DEVICE_RUNTIME", "hours", "Total runtime"),
+    ("TOTAL_DEVICE_STARTS", "counter", "Total device starts"),
+    ("TOTAL_LIGHT_EXPOSURE_TIME", "hours", "Total light exposure time"),
+    # device information
+    ("DEVICE_APPEARANCE", "appearance", "Device appearance"),
+    ("DEVICE_COUNTRY_OF_ORIGIN", "country", "Device country of origin"),
+    ("DEVICE_DATE_OF_MANUFACTURE", "date", "Device date of manufacture"),
+    ("DEVICE_FIRMWARE_REVISION", "string", "Device firmware revision"),
+    ("DEVICE_GLOBAL_TRADE_ITEM_NUMBER", "gtin", "Device global trade item number"),
+    ("DEVICE_HARDWARE_REVISION", "string", "Device hardware revision"),
+    ("DEVICE_MANUFACTURER_NAME", "string", "Device manufacturer name"),
+    ("DEVICE_MODEL_NUMBER", "string", "Device model number"),
+    ("DEVICE_SERIAL_NUMBER", "string", "Device serial number"),
+    ("DEVICE_SOFTWARE_REVISION", "string", "Device software revision"),
+    ("LUMINAIRE_COLOR", "string", "Luminaire color"),
+    ("LUMINAIRE_IDENTIFICATION_NUMBER", "string", "Luminaire identification number"),
+    ("LUMINAIRE_IDENTIFICATION_STRING", "string", "Luminaire identification string"),
+    ("LUMINAIRE_MANUFACTURER_GTIN", "gtin", "Luminaire manufacturer GTIN"),
+    ("LUMINAIRE_TIME_OF_MANUFACTURE", "date", "Luminaire time of manufacture"),
+)
+
+
+@cache
+def sensor_properties() -> dict[PropertyID, BtMeshSensorEntityDescription]:
+    """Descriptions of the properties known to the bluetooth_mesh, built on
+       first use, the property tables are slow to import."""
+    from bluetooth_mesh.messages.properties import PropertyID
+
+    registry = {}
+    for property_name, characteristic, name in PROPERTIES:
+        try:
+            property_id = PropertyID[property_name]
+        except KeyError:
+            _LOGGER.debug(f"property {property_name} is not supported by bluetooth_mesh")
+            continue
+
+        field, device_class, unit, state_class = CHARACTERISTICS[characteristic]
+        registry[property_id] = BtMeshSensorEntityDescription(
+            key=property_name.lower(),
+            name=name,
+            device_class=device_class,
+            native_unit_of_measurement=unit,
+            state_class=state_class,
+            property_id=property_id,
+            value_path=(property_name.lower(), *filter(None, field.split("."))),
+            scale=SCALES.get(characteristic, 1.0),
+            numeric=characteristic not in TEXT_CHARACTERISTICS,
+        )
+    return registry
+
+
+def to_property_id(value: int) -> PropertyID | int:
+    """PropertyID of the descriptor value, plain int for unknown properties."""
+    from bluetooth_mesh.messages.properties import PropertyID
+
+    try:
+        return PropertyID(value)
+    except ValueError:
+        return value
+
+
+def get_sensor_description(property_id: PropertyID | int) -> BtMeshSensorEntityDescription:
+    """Description of the sensor property, generic one for the properties
+       not in the registry, its value is the first number of the property."""
+    registry = sensor_properties()
+    description = registry.get(property_id)
+    if description is None:
+        name = getattr(property_id, "name", None) or f"{property_id:04x}"
+        description = BtMeshSensorEntityDescription(
+            key=name.lower(),
+            name=name.replace("_", " ").capitalize(),
+            state_class=SensorStateClass.MEASUREMENT,
+            property_id=property_id,
+        )
+        registry[property_id] = description
+    return description
+
+
+# fields of the Sensor Status property header
+_HEADER_FIELDS = frozenset(("format", "length", "sensor_setting_property_id"))
+
+# properties with the value path missing in the received status, logged once
+_MISSING_VALUE_PATHS: set[PropertyID | int] = set()
+
+
+def _first_number(value: any) -> float | None:
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key.startswith("_") or key in _HEADER_FIELDS:
+                continue
+            number = _first_number(item)
+            if number is not None:
+                return number
+        return None
+    if isinstance(value, (bool, int, float)):
+        return float(value)
+    return None
+
+
+def sensor_value(prop: any, description: BtMeshSensorEntityDescription) -> float | str | date | None:
+    """Extract the value of the decoded Sensor Status property, None if the
+       value is unknown or not found by the value path of the description."""
+    if not description.value_path:
+        value = _first_number(prop)
+    else:
+        value = prop
+        try:
+            for key in description.value_path:
+                value = value[key]
+        except (KeyError, TypeError):
+            if description.property_id not in _MISSING_VALUE_PATHS:
+                _MISSING_VALUE_PATHS.add(description.property_id)
+                _LOGGER.warning(
+                    f"sensor property {description.key}: value "
+                    f"{'.'.join(description.value_path)} not found in {prop}"
+                )
+            return None
+
+    if value is None:
+        return None
+    if not description.numeric:
+        if isinstance(value, Enum):
+            return value.name.lower()
+        if description.device_class == SensorDeviceClass.DATE:
+            return value if isinstance(value, date) else None
+        return str(value)
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        _LOGGER.warning(f"sensor property {description.key}: value {value} is not a number")
+        return None
+    return round(value * description.scale, description.precision)
@@ -0,0 +1,163 @@
+"""BT Mesh integration services."""
+from __future__ import annotations
+
+from importlib import import_module
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_ENTITY_ID
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    DOMAIN,
+    SERVICE_TRACE_START,
+    SERVICE_TRACE_STOP,
+    SERVICE_TRACE_REPLAY,
+    SERVICE_SCENE_STORE,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_FILENAME,
+    ATTR_SPEED,
+    ATTR_MAX_DURATION,
+    ATTR_SCENE_NUMBER,
+    CONF_SIMULATION,
+    G_TRACE_MAX_DURATION,
+)
+
+if TYPE_CHECKING:
+    from . import BtMeshConfigEntry
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+
+
+SERVICE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+})
+
+TRACE_START_SCHEMA = SERVICE_SCHEMA.extend({
+    vol.Optional(ATTR_MAX_DURATION, default=G_TRACE_MAX_DURATION): vol.All(
+        vol.Coerce(float), vol.Range(min=1, max=G_TRACE_MAX_DURATION)
+    ),
+})
+
+TRACE_STOP_SCHEMA = SERVICE_SCHEMA.extend({
+    vol.Required(ATTR_FILENAME): cv.string,
+})
+
+TRACE_REPLAY_SCHEMA = SERVICE_SCHEMA.extend({
+    vol.Required(ATTR_FILENAME): cv.string,
+    vol.Optional(ATTR_SPEED, default=1.0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+})
+
+SCENE_STORE_SCHEMA = SERVICE_SCHEMA.extend({
+    vol.Required(ATTR_SCENE_NUMBER): vol.All(vol.Coerce(int), vol.Range(min=1, max=0xffff)),
+    vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+})
+
+
+def get_loaded_entry(hass: HomeAssistant, call: ServiceCall) -> BtMeshConfigEntry:
+    """Config entry of the service call, the only loaded one by default."""
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    entries = [
+        entry for entry in hass.config_entries.async_entries(DOMAIN)
+            if entry.state is ConfigEntryState.LOADED and
+                (entry_id is None or entry.entry_id == entry_id)
+    ]
+    if len(entries) != 1:
+        raise ServiceValidationError(
+            f"{DOMAIN}: specify {ATTR_CONFIG_ENTRY_ID} of a loaded network"
+        )
+    return entries[0]
+
+
+def check_allowed_path(hass: HomeAssistant, filename: str) -> None:
+    if not hass.config.is_allowed_path(filename):
+        raise ServiceValidationError(f"{DOMAIN}: access to {filename} is not allowed")
+
+
+async def async_import_trace(hass: HomeAssistant) -> ModuleType:
+    """Trace module, imported on the first trace service call, it pulls in
+       the bluetooth_mesh message definitions."""
+    return await hass.async_add_import_executor_job(import_module, f"{__package__}.trace")
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Register integration services."""
+
+    async def async_trace_start(call: ServiceCall) -> None:
+        runtime_data = get_loaded_entry(hass, call).runtime_data
+        if runtime_data.app.trace is not None:
+            raise ServiceValidationError(f"{DOMAIN}: trace is already running")
+        trace = await async_import_trace(hass)
+        # one trace of the messages received by all instances of the network
+        recorder = trace.BtMeshTraceRecorder(max_duration=call.data[ATTR_MAX_DURATION])
+        for app in runtime_data.shards.apps:
+            app.trace = recorder
+        _LOGGER.info("trace started")
+
+    async def async_trace_stop(call: ServiceCall) -> ServiceResponse:
+        filename = call.data[ATTR_FILENAME]
+        check_allowed_path(hass, filename)
+        runtime_data = get_loaded_entry(hass, call).runtime_data
+        recorder = runtime_data.app.trace
+        if recorder is None:
+            raise ServiceValidationError(f"{DOMAIN}: trace is not running")
+        for app in runtime_data.shards.apps:
+            app.trace = None
+        trace = await async_import_trace(hass)
+        await trace.async_save_trace(hass, recorder, filename)
+        return {"messages": recorder.records, "dropped": recorder.dropped}
+
+    async def async_trace_replay(call: ServiceCall) -> ServiceResponse:
+        filename = call.data[ATTR_FILENAME]
+        check_allowed_path(hass, filename)
+        entry = get_loaded_entry(hass, call)
+        if not entry.data.get(CONF_SIMULATION):
+            raise ServiceValidationError(f"{DOMAIN}: trace replays on the simulated network only")
+        trace = await async_import_trace(hass)
+        try:
+            return await trace.async_replay_trace(hass, entry, filename, call.data[ATTR_SPEED])
+        except (OSError, ValueError) as e:
+            raise ServiceValidationError(f"{DOMAIN}: failed to replay {filename}: {e}") from e
+
+    async def async_scene_store(call: ServiceCall) -> ServiceResponse:
+        runtime_data = get_loaded_entry(hass, call).runtime_data
+        scenes = runtime_data.scenes
+        if scenes is None or not scenes.servers:
+            raise ServiceValidationError(f"{DOMAIN}: no Scene Server nodes")
+
+        # nodes of the entities, all Scene Server nodes if not set
+        addresses = None
+        if ATTR_ENTITY_ID in call.data:
+            entity_ids = set(call.data[ATTR_ENTITY_ID])
+            addresses = {
+                entity.unicast_addr for entity in runtime_data.state_store.entities
+                    if entity.entity_id in entity_ids
+            }
+            if not addresses & scenes.servers.keys():
+                raise ServiceValidationError(f"{DOMAIN}: entities are not on Scene Server nodes")
+
+        return {"nodes": await scenes.async_store(call.data[ATTR_SCENE_NUMBER], addresses)}
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_TRACE_START, async_trace_start, schema=TRACE_START_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_TRACE_STOP, async_trace_stop, schema=TRACE_STOP_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_TRACE_REPLAY, async_trace_replay, schema=TRACE_REPLAY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SCENE_STORE, async_scene_store, schema=SCENE_STORE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL
+    )
@@ -0,0 +1,196 @@
+"""Nodes of the mesh network sharded across several application instances."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from uuid import NAMESPACE_OID, uuid5
+
+from .const import (
+    SHARD_ROUTING_STATIC,
+    SHARD_ROUTING_REACHABILITY,
+    G_SHARD_REACHABILITY_ALPHA,
+    G_SHARD_REACHABILITY_PRIOR,
+    G_SHARD_SWITCH_MARGIN,
+    G_SHARD_LOAD_PENALTY,
+    G_SHARD_DEDUP_WINDOW,
+)
+
+if TYPE_CHECKING:
+    from .application import BtMeshApplication
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+
+
+# unicast addresses are 0x0001..0x7fff, the others are group and virtual
+UNICAST_ADDR_MAX = 0x7fff
+
+
+def is_unicast(address: any) -> bool:
+    return isinstance(address, int) and 0 < address <= UNICAST_ADDR_MAX
+
+
+class BtMeshReachability:
+    """Exponentially weighted rate of the answered requests to the nodes,
+       the messages received from the node count as answered."""
+    __slots__ = ("alpha", "scores")
+
+    def __init__(self, alpha: float=G_SHARD_REACHABILITY_ALPHA) -> None:
+        self.alpha = alpha
+        self.scores: dict[int, float] = {}
+
+    def observe(self, address: any, reached: bool) -> None:
+        if not is_unicast(address):
+            return
+        score = self.scores.get(address)
+        if score is None:
+            self.scores[address] = 1.0 if reached else 0.0
+        else:
+            self.scores[address] = score + self.alpha * ((1.0 if reached else 0.0) - score)
+
+    def score(self, address: int, default: float) -> float:
+        return self.scores.get(address, default)
+
+
+def shard_uuid(uuid: str, path: str) -> str:
+    """UUID of the additional application instance, derived from the
+       network one and the D-Bus path of the instance."""
+    return str(uuid5(NAMESPACE_OID, f"{uuid}:{path}"))
+
+
+class BtMeshMessageDedup:
+    """Messages received by several application instances, the copies of
+       the same message received within the window are dispatched once."""
+    __slots__ = ("window", "_seen")
+
+    def __init__(self, window: float=G_SHARD_DEDUP_WINDOW) -> None:
+        self.window = window
+        # message key: monotonic time it was first received, oldest first
+        self._seen: dict[tuple, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def duplicate(self, key: tuple, now: float) -> bool:
+        """True if the message was received by other instance already."""
+        seen = self._seen
+        while seen:
+            oldest = next(iter(seen))
+            if now - seen[oldest] <= self.window:
+                break
+            del seen[oldest]
+        if key in seen:
+            return True
+        seen[key] = now
+        return False
+
+
+@dataclass
+class BtMeshShard:
+    """Application instance with its own D-Bus path, token and adapter,
+       the primary one owns the nodes out of the ranges of the others."""
+    name: str
+    app: BtMeshApplication
+    ranges: list[tuple[int, int]] = field(default_factory=list)
+
+    def owns(self, address: int) -> bool:
+        return any(first <= address <= last for first, last in self.ranges)
+
+
+class BtMeshShardRouter:
+    """Route the requests of the node through the application instance
+       the node is assigned to by its unicast address. With reachability
+       routing the request goes through other instance when it answers
+       noticeably better, e.g. the node is out of range of the owner."""
+
+    def __init__(self, routing: str=SHARD_ROUTING_STATIC) -> None:
+        self.routing = routing
+        self.shards: list[BtMeshShard] = []
+        self._owners: dict[int, BtMeshShard] = {}
+        self.dedup = BtMeshMessageDedup()
+
+    def __len__(self) -> int:
+        return len(self.shards)
+
+    @property
+    def primary(self) -> BtMeshShard:
+        return self.shards[0]
+
+    @property
+    def apps(self) -> list[BtMeshApplication]:
+        return [shard.app for shard in self.shards]
+
+    def add(self, name: str, app: BtMeshApplication, ranges: list[tuple[int, int]] | None=None) -> None:
+        self.shards.append(BtMeshShard(name, app, list(ranges or [])))
+        self._owners.clear()
+        # the instances receive the same messages from the network
+        if len(self.shards) > 1:
+            for shard in self.shards:
+                shard.app.dedup = self.dedup
+
+    def remove(self, shard: BtMeshShard) -> None:
+        """Nodes of the removed shard fall back to the primary instance."""
+        self.shards.remove(shard)
+        self._owners.clear()
+        shard.app.dedup = None
+        if len(self.shards) == 1:
+            self.primary.app.dedup = None
+
+    def owner(self, address: int) -> BtMeshShard:
+        shard = self._owners.get(address)
+        if shard is None:
+            shard = next(
+                (shard for shard in self.shards[1:] if shard.owns(address)),
+                self.primary
+            )
+            self._owners[address] = shard
+        return shard
+
+    def app_for(self, destination: any) -> BtMeshApplication:
+        """Application instance to send the request to the destination,
+           group addresses go through the primary one."""
+        if not is_unicast(destination):
+            return self.primary.app
+
+        owner = self.owner(destination)
+        if self.routing != SHARD_ROUTING_REACHABILITY:
+            return owner.app
+
+        best = owner
+        best_score = self._score(owner, destination, 1.0)
+        for shard in self.shards:
+            if shard is owner:
+                continue
+            score = self._score(shard, destination, G_SHARD_REACHABILITY_PRIOR)
+            if score > best_score + G_SHARD_SWITCH_MARGIN:
+                best, best_score = shard, score
+        return best.app
+
+    @staticmethod
+    def _score(shard: BtMeshShard, address: int, prior: float) -> float:
+        return shard.app.reachability.score(address, prior) - G_SHARD_LOAD_PENALTY * shard.app.queue_depth
+
+    def as_dict(self) -> dict:
+        return {
+            "routing": self.routing,
+            "dedup_messages": len(self.dedup),
+            "shards": [
+                {
+                    "name": shard.name,
+                    "ranges": [f"{first:04x}-{last:04x}" for first, last in shard.ranges],
+                    "owned_nodes": sorted(
+                        f"{address:04x}" for address, owner in self._owners.items() if owner is shard
+                    ),
+                    "connected": shard.app.connected,
+                    "reconnects": shard.app.reconnects,
+                    "pending_sets": shard.app.pending_sets,
+                    "queue_depth": shard.app.queue_depth,
+                    "reachability": {
+                        f"{address:04x}": round(score, 3)
+                            for address, score in sorted(shard.app.reachability.scores.items())
+                    },
+                }
+                    for shard in self.shards
+            ],
+        }
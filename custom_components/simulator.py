@@ -0,0 +1,698 @@
+"""Simulated BT Mesh network, standing in for bluetooth-meshd over D-Bus."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import json
+import math
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+
+from construct import Container
+
+from bluetooth_mesh.models.generic.onoff import GenericOnOffClient
+from bluetooth_mesh.models.generic.level import GenericLevelClient
+from bluetooth_mesh.models.generic.battery import GenericBatteryClient
+from bluetooth_mesh.models.sensor import SensorClient
+from bluetooth_mesh.models.light.lightness import LightLightnessClient
+from bluetooth_mesh.models.light.ctl import LightCTLClient
+from bluetooth_mesh.models.light.hsl import LightHSLClient
+from bluetooth_mesh.models.vendor.thermostat import ThermostatClient
+from bluetooth_mesh.models.scene import SceneClient
+from bluetooth_mesh.messages.generic.onoff import GenericOnOffOpcode
+from bluetooth_mesh.messages.generic.battery import GenericBatteryOpcode
+from bluetooth_mesh.messages.light.lightness import LightLightnessOpcode
+from bluetooth_mesh.messages.light.ctl import LightCTLOpcode
+from bluetooth_mesh.messages.light.hsl import LightHSLOpcode
+from bluetooth_mesh.messages.sensor import SensorOpcode
+from bluetooth_mesh.messages.scene import SceneStatusCode
+from bluetooth_mesh.messages.vendor.thermostat import (
+    ThermostatOpcode,
+    ThermostatSubOpcode,
+    ThermostatMode,
+    ThermostatStatusCode,
+)
+from bluetooth_mesh.messages.properties import PropertyID
+
+from homeassistant.core import HomeAssistant
+
+from bt_mesh_ctrl import BtMeshModelId
+
+from .application import BtMeshApplication
+from .entity import opcode_key
+from .const import (
+    DOMAIN,
+    CONF_SIM_NODES,
+    CONF_SIM_MODELS,
+    CONF_SIM_LATENCY,
+    CONF_SIM_JITTER,
+    CONF_SIM_HOPS,
+    CONF_SIM_LOSS,
+    CONF_SIM_PUBLISH_INTERVAL,
+    CONF_SIM_SEGMENT_DELAY,
+    CONF_SIM_SEED,
+    SIM_MODEL_ONOFF,
+    SIM_MODEL_LIGHTNESS,
+    SIM_MODEL_CTL,
+    SIM_MODEL_HSL,
+    SIM_MODEL_SENSOR,
+    SIM_MODEL_THERMOSTAT,
+    SIM_MODELS,
+    DEFAULT_SIM_NODES,
+    DEFAULT_SIM_LATENCY,
+    DEFAULT_SIM_JITTER,
+    DEFAULT_SIM_HOPS,
+    DEFAULT_SIM_LOSS,
+    DEFAULT_SIM_PUBLISH_INTERVAL,
+    DEFAULT_SIM_SEGMENT_DELAY,
+)
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+
+
+SIM_FIRST_ADDR = 0x0100
+SIM_PUBLISH_ADDR = 0xc000
+SIM_APP_KEY = 0
+SIM_CID = 0x05f1
+SIM_PID = 0x5349
+
+# largest unsegmented access payload
+UNSEGMENTED_MAX = 11
+SEGMENT_SIZE = 12
+
+# server models of the simulated node kinds, sensor nodes are battery powered
+SIM_NODE_MODELS: dict[str, tuple[int, ...]] = {
+    SIM_MODEL_ONOFF: (BtMeshModelId.GenericOnOffServer, BtMeshModelId.SceneServer),
+    SIM_MODEL_LIGHTNESS: (BtMeshModelId.GenericOnOffServer, BtMeshModelId.LightLightnessServer, BtMeshModelId.SceneServer),
+    SIM_MODEL_CTL: (BtMeshModelId.GenericOnOffServer, BtMeshModelId.LightCTLServer, BtMeshModelId.SceneServer),
+    SIM_MODEL_HSL: (BtMeshModelId.GenericOnOffServer, BtMeshModelId.LightHSLServer, BtMeshModelId.SceneServer),
+    SIM_MODEL_SENSOR: (BtMeshModelId.SensorServer, BtMeshModelId.GenericBatteryServer),
+    SIM_MODEL_THERMOSTAT: (BtMeshModelId.ThermostatServer,),
+}
+
+# property, value field, initial value, random walk step
+SIM_SENSOR_PROPERTIES: tuple[tuple[str, str, float, float], ...] = (
+    ("PRESENT_AMBIENT_TEMPERATURE", "temperature", 21.5, 0.2),
+    ("PRESENT_AMBIENT_RELATIVE_HUMIDITY", "humidity", 45.0, 0.5),
+    ("PRESENT_AMBIENT_LIGHT_LEVEL", "illuminance", 300.0, 10.0),
+)
+
+
+@dataclass
+class SimulationOptions:
+    """Simulated network parameters, latency is per hop."""
+    nodes: int = DEFAULT_SIM_NODES
+    models: tuple[str, ...] = SIM_MODELS
+    latency: float = DEFAULT_SIM_LATENCY
+    jitter: float = DEFAULT_SIM_JITTER
+    hops: int = DEFAULT_SIM_HOPS
+    loss: float = DEFAULT_SIM_LOSS
+    publish_interval: float = DEFAULT_SIM_PUBLISH_INTERVAL
+    segment_delay: float = DEFAULT_SIM_SEGMENT_DELAY
+    seed: int | None = None
+
+    @classmethod
+    def from_config(cls, config: dict | None) -> SimulationOptions:
+        config = config or {}
+        return cls(
+            nodes=config.get(CONF_SIM_NODES, DEFAULT_SIM_NODES),
+            models=tuple(config.get(CONF_SIM_MODELS, SIM_MODELS)),
+            latency=config.get(CONF_SIM_LATENCY, DEFAULT_SIM_LATENCY),
+            jitter=config.get(CONF_SIM_JITTER, DEFAULT_SIM_JITTER),
+            hops=config.get(CONF_SIM_HOPS, DEFAULT_SIM_HOPS),
+            loss=config.get(CONF_SIM_LOSS, DEFAULT_SIM_LOSS),
+            publish_interval=config.get(CONF_SIM_PUBLISH_INTERVAL, DEFAULT_SIM_PUBLISH_INTERVAL),
+            segment_delay=config.get(CONF_SIM_SEGMENT_DELAY, DEFAULT_SIM_SEGMENT_DELAY),
+            seed=config.get(CONF_SIM_SEED),
+        )
+
+
+@dataclass
+class SimulatedNode:
+    """Virtual node with the state of its server models."""
+    unicast_addr: int
+    kind: str
+    uuid: uuid.UUID
+    hops: int
+    onoff: int = 0
+    lightness: int = 0
+    last_lightness: int = 0xffff
+    temperature: int = 4000
+    temperature_range: tuple[int, int] = (2700, 6500)
+    hue: int = 0
+    saturation: int = 0
+    battery_level: int = 100
+    sensors: dict[PropertyID, float] = field(default_factory=dict)
+    thermostat_onoff: int = 0
+    target_temperature: float = 21.0
+    present_temperature: float = 20.0
+    thermostat_range: tuple[float, float] = (5.0, 35.0)
+    # scene number: stored light state
+    scenes: dict[int, tuple] = field(default_factory=dict)
+
+    @property
+    def model_ids(self) -> tuple[int, ...]:
+        return SIM_NODE_MODELS[self.kind]
+
+    def set_onoff(self, onoff: int) -> None:
+        self.onoff = 1 if onoff else 0
+        if self.kind == SIM_MODEL_ONOFF:
+            return
+        if onoff and self.lightness == 0:
+            self.lightness = self.last_lightness
+        elif not onoff and self.lightness > 0:
+            self.last_lightness = self.lightness
+            self.lightness = 0
+
+    def set_lightness(self, lightness: int) -> None:
+        self.lightness = lightness
+        self.onoff = 1 if lightness > 0 else 0
+        if lightness > 0:
+            self.last_lightness = lightness
+
+    def store_scene(self, number: int) -> None:
+        self.scenes[number] = (self.onoff, self.lightness, self.temperature, self.hue, self.saturation)
+
+    def recall_scene(self, number: int) -> bool:
+        if number not in self.scenes:
+            return False
+        self.onoff, self.lightness, self.temperature, self.hue, self.saturation = self.scenes[number]
+        if self.lightness > 0:
+            self.last_lightness = self.lightness
+        return True
+
+    def onoff_status(self) -> Container:
+        return Container(present_onoff=self.onoff)
+
+    def lightness_status(self) -> Container:
+        return Container(present_lightness=self.lightness)
+
+    def ctl_status(self) -> Container:
+        return Container(
+            present_ctl_lightness=self.lightness,
+            present_ctl_temperature=self.temperature,
+        )
+
+    def ctl_temperature_range_status(self) -> Container:
+        return Container(
+            status_code=0,
+            range_min=self.temperature_range[0],
+            range_max=self.temperature_range[1],
+        )
+
+    def hsl_status(self) -> Container:
+        return Container(
+            hsl_lightness=self.lightness,
+            hsl_hue=self.hue,
+            hsl_saturation=self.saturation,
+        )
+
+    def battery_status(self) -> Container:
+        return Container(
+            battery_level=self.battery_level,
+            time_to_discharge=0xffffff,
+            time_to_charge=0xffffff,
+        )
+
+    def sensor_status(self) -> list[Container]:
+        result = []
+        for property_name, value_field, _value, _step in SIM_SENSOR_PROPERTIES:
+            property_id = PropertyID[property_name]
+            result.append(Container(
+                sensor_setting_property_id=property_id,
+                **{property_name.lower(): Container(**{value_field: self.sensors[property_id]})}
+            ))
+        return result
+
+    def sensor_descriptor_status(self, update_interval: float) -> list[Container]:
+        return [
+            Container(
+                sensor_property_id=PropertyID[property_name],
+                sensor_positive_tolerance=0,
+                sensor_negative_tolerance=0,
+                sensor_sampling_funcion=0,
+                sensor_measurement_period=0,
+                sensor_update_interval=update_interval,
+            )
+                for property_name, _field, _value, _step in SIM_SENSOR_PROPERTIES
+        ]
+
+    def scene_register_status(self) -> Container:
+        return Container(
+            status_code=SceneStatusCode.SUCCESS,
+            current_scene=0,
+            scenes=sorted(self.scenes),
+        )
+
+    def thermostat_status(self) -> Container:
+        return Container(
+            status_code=ThermostatStatusCode.GOOD,
+            heater_status=int(self.thermostat_onoff and self.present_temperature < self.target_temperature),
+            mode=ThermostatMode.MANUAL,
+            onoff_status=self.thermostat_onoff,
+            target_temperature=self.target_temperature,
+            present_temperature=self.present_temperature,
+        )
+
+    def thermostat_range_status(self) -> Container:
+        return Container(
+            min_temperature=self.thermostat_range[0],
+            max_temperature=self.thermostat_range[1],
+        )
+
+    def step(self, rng: random.Random) -> None:
+        """Drift of the measured values between publications."""
+        for property_name, _field, _value, step in SIM_SENSOR_PROPERTIES:
+            property_id = PropertyID[property_name]
+            self.sensors[property_id] = round(self.sensors[property_id] + rng.uniform(-step, step), 2)
+        if self.kind == SIM_MODEL_SENSOR and rng.random() < 0.01:
+            self.battery_level = max(0, self.battery_level - 1)
+        if self.kind == SIM_MODEL_THERMOSTAT:
+            target = self.target_temperature if self.thermostat_onoff else 18.0
+            self.present_temperature = round(
+                self.present_temperature + (target - self.present_temperature) * 0.1, 1
+            )
+
+
+class SimulatedMesh:
+    """Virtual nodes and the radio model of the simulated network: per hop
+       latency with jitter, independent loss of every transmission and
+       the extra delay of the segmented messages."""
+
+    def __init__(self, options: SimulationOptions) -> None:
+        self.options = options
+        self.rng = random.Random(options.seed)
+        self.nodes: dict[int, SimulatedNode] = {}
+        self.publish_callback = None
+
+        models = [model for model in options.models if model in SIM_NODE_MODELS] or list(SIM_MODELS)
+        for index in range(options.nodes):
+            kind = models[index % len(models)]
+            unicast_addr = SIM_FIRST_ADDR + index
+            node = SimulatedNode(
+                unicast_addr=unicast_addr,
+                kind=kind,
+                uuid=uuid.uuid5(uuid.NAMESPACE_OID, f"{DOMAIN}.simulation.{unicast_addr:04x}"),
+                hops=1 + self.rng.randrange(options.hops),
+            )
+            for property_name, _field, value, step in SIM_SENSOR_PROPERTIES:
+                node.sensors[PropertyID[property_name]] = round(value + self.rng.uniform(-10, 10) * step, 2)
+            self.nodes[unicast_addr] = node
+
+    def transit_delay(self, node: SimulatedNode, size: int) -> float:
+        """One way delay of the message of size octets."""
+        latency = self.options.latency * node.hops
+        latency *= 1 + self.rng.uniform(-self.options.jitter, self.options.jitter)
+        if size > UNSEGMENTED_MAX:
+            latency += (math.ceil(size / SEGMENT_SIZE) - 1) * self.options.segment_delay
+        return max(0.0, latency)
+
+    def delivered(self) -> bool:
+        return self.rng.random() >= self.options.loss
+
+    async def request(
+        self,
+        destination: int,
+        request_size: int,
+        response_size: int,
+        handler: callable,
+        send_interval: float,
+        timeout: float
+    ) -> any:
+        """Acknowledged request, retransmitted every send_interval until
+           the response arrives or timeout, as the client models do."""
+        node = self.nodes.get(destination)
+        start = time.monotonic()
+        attempt = 0
+        while node is not None:
+            sent = attempt * send_interval
+            if sent >= timeout:
+                break
+            if self.delivered() and self.delivered():
+                arrival = sent + self.transit_delay(node, request_size) + \
+                    self.transit_delay(node, response_size)
+                if arrival < timeout:
+                    await asyncio.sleep(max(0.0, start + arrival - time.monotonic()))
+                    return handler(node)
+                break
+            attempt += 1
+
+        await asyncio.sleep(max(0.0, start + timeout - time.monotonic()))
+        raise asyncio.TimeoutError
+
+    async def run_publications(self) -> None:
+        """Periodic status publication of every node with random phase."""
+        interval = self.options.publish_interval
+        if interval <= 0 or not self.nodes:
+            return
+
+        now = time.monotonic()
+        queue = [(now + self.rng.uniform(0, interval), addr) for addr in self.nodes]
+        heapq.heapify(queue)
+        while True:
+            due, addr = heapq.heappop(queue)
+            delay = due - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            heapq.heappush(queue, (due + interval, addr))
+
+            node = self.nodes[addr]
+            node.step(self.rng)
+            self.publish(node)
+
+    def publish(self, node: SimulatedNode) -> None:
+        """Status publication of the node."""
+        if self.publish_callback is not None and self.delivered():
+            for opcode, status in self.publications(node):
+                self.publish_callback(node.unicast_addr, status_message(opcode, status))
+
+    @staticmethod
+    def publications(node: SimulatedNode) -> list[tuple[int, Container]]:
+        if node.kind == SIM_MODEL_ONOFF:
+            return [(GenericOnOffOpcode.GENERIC_ONOFF_STATUS, node.onoff_status())]
+        if node.kind == SIM_MODEL_LIGHTNESS:
+            return [(LightLightnessOpcode.LIGHT_LIGHTNESS_STATUS, node.lightness_status())]
+        if node.kind == SIM_MODEL_CTL:
+            return [(LightCTLOpcode.LIGHT_CTL_STATUS, node.ctl_status())]
+        if node.kind == SIM_MODEL_HSL:
+            return [(LightHSLOpcode.LIGHT_HSL_STATUS, node.hsl_status())]
+        if node.kind == SIM_MODEL_SENSOR:
+            return [
+                (SensorOpcode.SENSOR_STATUS, node.sensor_status()),
+                (GenericBatteryOpcode.GENERIC_BATTERY_STATUS, node.battery_status()),
+            ]
+        if node.kind == SIM_MODEL_THERMOSTAT:
+            return [(
+                ThermostatOpcode.VENDOR_THERMOSTAT,
+                Container(
+                    subopcode=ThermostatSubOpcode.THERMOSTAT_STATUS,
+                    thermostat_status=node.thermostat_status(),
+                )
+            )]
+        return []
+
+
+def status_message(opcode: int, status: any) -> Container:
+    """Parsed access message as received from the client model."""
+    return Container(opcode=opcode, **{opcode_key(opcode): status})
+
+
+class SimulatedClient:
+    """Client model surface used by the BtMeshApplication requests."""
+
+    def __init__(self, mesh: SimulatedMesh) -> None:
+        self.mesh = mesh
+        self.app_message_callbacks = {}
+
+    async def _request(self, destination: int, request_size: int, response_size: int, handler, **kwargs) -> any:
+        return await self.mesh.request(
+            destination,
+            request_size,
+            response_size,
+            handler,
+            kwargs["send_interval"],
+            kwargs["timeout"],
+        )
+
+
+class SimulatedGenericOnOffClient(SimulatedClient):
+    async def get(self, destination: int, app_index: int, **kwargs) -> any:
+        return await self._request(destination, 2, 3, SimulatedNode.onoff_status, **kwargs)
+
+    async def set(self, destination: int, app_index: int, onoff: int, **kwargs) -> any:
+        def handler(node: SimulatedNode) -> Container:
+            node.set_onoff(onoff)
+            return node.onoff_status()
+        return await self._request(destination, 4, 3, handler, **kwargs)
+
+
+class SimulatedGenericLevelClient(SimulatedClient):
+    """Generic Level bound to the lightness, the move runs to the range
+       limit at once."""
+
+    @staticmethod
+    def level_status(node: SimulatedNode) -> Container:
+        return Container(present_level=node.lightness - 0x8000)
+
+    async def delta_set(self, destination: int, app_index: int, delta_level: int, **kwargs) -> any:
+        def handler(node: SimulatedNode) -> Container:
+            node.set_lightness(min(max(node.lightness + delta_level, 0), 0xffff))
+            return self.level_status(node)
+        return await self._request(destination, 8, 3, handler, **kwargs)
+
+    async def move_set(self, destination: int, app_index: int, delta_level: int, **kwargs) -> any:
+        def handler(node: SimulatedNode) -> Container:
+            if delta_level:
+                node.set_lightness(0xffff if delta_level > 0 else 0)
+            return self.level_status(node)
+        return await self._request(destination, 6, 3, handler, **kwargs)
+
+
+class SimulatedLightLightnessClient(SimulatedClient):
+    async def get(self, destination: int, app_index: int, **kwargs) -> any:
+        return await self._request(destination, 2, 5, SimulatedNode.lightness_status, **kwargs)
+
+    async def set(self, destination: int, app_index: int, lightness: int, **kwargs) -> any:
+        def handler(node: SimulatedNode) -> Container:
+            node.set_lightness(lightness)
+            return node.lightness_status()
+        return await self._request(destination, 5, 5, handler, **kwargs)
+
+
+class SimulatedLightCTLClient(SimulatedClient):
+    async def get(self, destination: int, app_index: int, **kwargs) -> any:
+        return await self._request(destination, 2, 9, SimulatedNode.ctl_status, **kwargs)
+
+    async def temperature_range_get(self, destination: int, app_index: int, **kwargs) -> any:
+        return await self._request(destination, 2, 7, SimulatedNode.ctl_temperature_range_status, **kwargs)
+
+    async def set(
+        self,
+        destination: int,
+        app_index: int,
+        ctl_lightness: int,
+        ctl_temperature: int,
+        **kwargs
+    ) -> any:
+        def handler(node: SimulatedNode) -> Container:
+            node.set_lightness(ctl_lightness)
+            node.temperature = min(max(ctl_temperature, node.temperature_range[0]), node.temperature_range[1])
+            return node.ctl_status()
+        return await self._request(destination, 9, 9, handler, **kwargs)
+
+
+class SimulatedLightHSLClient(SimulatedClient):
+    async def get(self, destination: int, app_index: int, **kwargs) -> any:
+        return await self._request(destination, 2, 7, SimulatedNode.hsl_status, **kwargs)
+
+    async def target_get(self, destination: int, app_index: int, **kwargs) -> any:
+        return await self._request(destination, 2, 7, SimulatedNode.hsl_status, **kwargs)
+
+    async def set(
+        self,
+        destination: int,
+        app_index: int,
+        hsl_lightness: int,
+        hsl_hue: int,
+        hsl_saturation: int,
+        **kwargs
+    ) -> any:
+        def handler(node: SimulatedNode) -> Container:
+            node.set_lightness(hsl_lightness)
+            node.hue = hsl_hue
+            node.saturation = hsl_saturation
+            return node.hsl_status()
+        return await self._request(destination, 9, 7, handler, **kwargs)
+
+
+class SimulatedGenericBatteryClient(SimulatedClient):
+    async def get(self, destination: int, app_index: int, **kwargs) -> any:
+        return await self._request(destination, 2, 9, SimulatedNode.battery_status, **kwargs)
+
+
+class SimulatedSensorClient(SimulatedClient):
+    async def get(self, destination: int, app_index: int, **kwargs) -> any:
+        size = 1 + 6 * len(SIM_SENSOR_PROPERTIES)
+        return await self._request(destination, 2, size, SimulatedNode.sensor_status, **kwargs)
+
+    async def descriptor_get(self, destination: int, app_index: int, **kwargs) -> any:
+        size = 1 + 8 * len(SIM_SENSOR_PROPERTIES)
+        update_interval = self.mesh.options.publish_interval
+        return await self._request(
+            destination, 2, size,
+            lambda node: node.sensor_descriptor_status(update_interval),
+            **kwargs
+        )
+
+
+class SimulatedSceneClient(SimulatedClient):
+    async def register_get(self, destination: int, app_index: int, **kwargs) -> any:
+        return await self._request(destination, 2, 21, SimulatedNode.scene_register_status, **kwargs)
+
+    async def store(self, destination: int, app_index: int, scene_number: int, **kwargs) -> any:
+        def handler(node: SimulatedNode) -> Container:
+            node.store_scene(scene_number)
+            return node.scene_register_status()
+        return await self._request(destination, 4, 21, handler, **kwargs)
+
+    async def recall_unack(self, destination: int, app_index: int, scene_number: int, **kwargs) -> None:
+        """Recall on every node storing the scene, the nodes publish their
+           state once the message arrives."""
+        loop = asyncio.get_running_loop()
+        target = self.mesh.nodes.get(destination)
+        for node in [target] if target is not None else list(self.mesh.nodes.values()):
+            if self.mesh.delivered() and node.recall_scene(scene_number):
+                loop.call_later(self.mesh.transit_delay(node, 6), self.mesh.publish, node)
+
+
+class SimulatedThermostatClient(SimulatedClient):
+    async def get(self, destination: int, app_index: int, **kwargs) -> any:
+        return await self._request(destination, 4, 12, SimulatedNode.thermostat_status, **kwargs)
+
+    async def range_get(self, destination: int, app_index: int, **kwargs) -> any:
+        return await self._request(destination, 4, 8, SimulatedNode.thermostat_range_status, **kwargs)
+
+    async def set(
+        self,
+        destination: int,
+        app_index: int,
+        onoff: int,
+        temperature: float,
+        **kwargs
+    ) -> any:
+        def handler(node: SimulatedNode) -> Container:
+            node.thermostat_onoff = 1 if onoff else 0
+            node.target_temperature = min(max(temperature, node.thermostat_range[0]), node.thermostat_range[1])
+            return node.thermostat_status()
+        return await self._request(destination, 8, 12, handler, **kwargs)
+
+
+class SimulatedElement:
+    """Element of the client models, indexed by the model class."""
+
+    def __init__(self, mesh: SimulatedMesh) -> None:
+        self.models = {
+            GenericOnOffClient: SimulatedGenericOnOffClient(mesh),
+            GenericLevelClient: SimulatedGenericLevelClient(mesh),
+            GenericBatteryClient: SimulatedGenericBatteryClient(mesh),
+            SensorClient: SimulatedSensorClient(mesh),
+            LightLightnessClient: SimulatedLightLightnessClient(mesh),
+            LightCTLClient: SimulatedLightCTLClient(mesh),
+            LightHSLClient: SimulatedLightHSLClient(mesh),
+            ThermostatClient: SimulatedThermostatClient(mesh),
+            SceneClient: SimulatedSceneClient(mesh),
+        }
+
+    def __getitem__(self, model_class: type) -> SimulatedClient:
+        return self.models[model_class]
+
+
+class BtMeshSimulatedApplication(BtMeshApplication):
+    """BtMeshApplication running against the simulated network instead of
+       bluetooth-meshd, the requests, metrics and message dispatch are the
+       same, only the client models and the D-Bus connection are replaced."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        uuid,
+        path,
+        token=None,
+        options: SimulationOptions | None=None,
+        mesh: SimulatedMesh | None=None
+    ):
+        # the shards share the network, publications are received by the
+        # instance running the network
+        self._owns_mesh = mesh is None
+        self.mesh = SimulatedMesh(options or SimulationOptions()) if mesh is None else mesh
+        self._simulated_elements = {0: SimulatedElement(self.mesh)}
+        self._publish_task: asyncio.Task | None = None
+        super().__init__(hass, uuid, path, token)
+        if self._owns_mesh:
+            self.mesh.publish_callback = self._publish
+
+    @property
+    def elements(self) -> dict[int, SimulatedElement]:
+        return self._simulated_elements
+
+    @elements.setter
+    def elements(self, _value: any) -> None:
+        # elements of the D-Bus application are not used
+        pass
+
+    async def dbus_connect(self) -> None:
+        _LOGGER.info(f"simulated mesh network: {len(self.mesh.nodes)} nodes, {self.mesh.options}")
+
+    async def connect(self) -> None:
+        if not self._owns_mesh:
+            return
+        self._publish_task = self.hass.async_create_background_task(
+            self.mesh.run_publications(),
+            f"{DOMAIN}_simulation_publications"
+        )
+
+    async def dbus_disconnect(self) -> None:
+        if self._publish_task is not None:
+            self._publish_task.cancel()
+            self._publish_task = None
+
+    async def mesh_join(self, pin_cb=None) -> int:
+        return 0
+
+    def _publish(self, source: int, message: Container) -> None:
+        self._bt_mesh_msg_callback(source, SIM_APP_KEY, SIM_PUBLISH_ADDR, message)
+
+
+def mesh_conf_data(mesh: SimulatedMesh) -> dict:
+    """Network configuration of the simulated nodes in the mesh-cfgclient
+       config_db.json format."""
+
+    def model_id(model: int) -> str:
+        return f"{int(model):08x}" if int(model) > 0xffff else f"{int(model):04x}"
+
+    return {
+        "netKeys": [{"index": 0, "phase": 0}],
+        "appKeys": [{"index": SIM_APP_KEY, "boundNetKey": 0}],
+        "nodes": [
+            {
+                "uuid": node.uuid.hex,
+                "unicastAddress": f"{node.unicast_addr:04x}",
+                "deviceKey": f"{node.unicast_addr:032x}",
+                "cid": f"{SIM_CID:04x}",
+                "pid": f"{SIM_PID:04x}",
+                "vid": "0001",
+                "crpl": "0080",
+                "features": {"relay": 1, "proxy": 2, "friend": 2, "lpn": 2},
+                "netKeys": [{"index": 0, "updated": False}],
+                "appKeys": [{"index": SIM_APP_KEY, "updated": False}],
+                "elements": [
+                    {
+                        "elementIndex": 0,
+                        "location": "0000",
+                        "models": [
+                            {"modelId": model_id(model), "bind": [SIM_APP_KEY]}
+                                for model in node.model_ids
+                        ],
+                    }
+                ],
+            }
+                for node in mesh.nodes.values()
+        ],
+    }
+
+
+def write_mesh_conf(filename: str, mesh: SimulatedMesh) -> None:
+    """Write the network configuration, unchanged file is not touched."""
+    data = json.dumps(mesh_conf_data(mesh), indent=2)
+    try:
+        with open(filename, "r") as file:
+            if file.read() == data:
+                return
+    except OSError:
+        pass
+    with open(filename, "w") as file:
+        file.write(data)
@@ -0,0 +1,147 @@
+"""Persistent snapshot of the BT Mesh entities model state."""
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta
+from enum import Enum
+
+from homeassistant.core import HomeAssistant, Event, callback
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    STORAGE_MODEL_STATES,
+    G_MESH_STATE_SAVE_INTERVAL,
+    G_MESH_STATE_RESTORE_MAX_AGE,
+)
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+
+
+def _serialize(value: any) -> any:
+    """Convert decoded model state to JSON compatible types."""
+    if isinstance(value, dict):
+        return {
+            key: _serialize(item)
+                for key, item in value.items()
+                    if not str(key).startswith("_")
+        }
+    if isinstance(value, (list, tuple)):
+        return [_serialize(item) for item in value]
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int):
+        return int(value)
+    if value is None or isinstance(value, (float, str)):
+        return value
+    raise TypeError(f"unsupported model state type {type(value).__name__}")
+
+
+def _deserialize(value: any) -> any:
+    """Convert JSON data back to the decoded model state."""
+    from construct import Container
+
+    if isinstance(value, dict):
+        return Container({key: _deserialize(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return [_deserialize(item) for item in value]
+    return value
+
+
+class BtMeshStateStore:
+    """Last known model state of the entities, restored as provisional
+       state on startup and refreshed from the network afterwards."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self.hass = hass
+        self._store: Store[dict[str, dict]] = Store(hass, 1, f"{STORAGE_MODEL_STATES}.{entry_id}")
+        self._data: dict[str, dict] = {}
+        self._entities: dict[str, BtMeshEntity] = {}
+        self._unsub_interval: Callable[[], None] | None = None
+        self._unsub_stop: Callable[[], None] | None = None
+
+    async def async_load(self) -> None:
+        """Load the snapshot and start periodic saving."""
+        data = await self._store.async_load()
+        if data is not None:
+            min_time = time.time() - G_MESH_STATE_RESTORE_MAX_AGE
+            self._data = {
+                unique_id: snapshot
+                    for unique_id, snapshot in data.items()
+                        if snapshot.get("last_update", 0) >= min_time
+            }
+        _LOGGER.debug(f"BtMeshStateStore: loaded {len(self._data)} model states")
+
+        self._unsub_interval = async_track_time_interval(
+            self.hass,
+            self._async_save_interval,
+            timedelta(seconds=G_MESH_STATE_SAVE_INTERVAL),
+        )
+        self._unsub_stop = self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP,
+            self._async_save_stop,
+        )
+
+    async def async_unload(self) -> None:
+        """Save the snapshot and stop periodic saving."""
+        if self._unsub_interval is not None:
+            self._unsub_interval()
+            self._unsub_interval = None
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+        await self.async_save()
+
+    @property
+    def entities(self) -> list[BtMeshEntity]:
+        return list(self._entities.values())
+
+    @callback
+    def async_register(self, entity: BtMeshEntity) -> None:
+        self._entities[entity.unique_id] = entity
+
+    @callback
+    def async_unregister(self, entity: BtMeshEntity) -> None:
+        self._snapshot_entity(entity)
+        self._entities.pop(entity.unique_id, None)
+
+    def get(self, unique_id: str) -> any:
+        """Return restored model state or None."""
+        snapshot = self._data.get(unique_id)
+        if snapshot is None:
+            return None
+        return _deserialize(snapshot["state"])
+
+    def _snapshot_entity(self, entity: BtMeshEntity) -> None:
+        # keep the restored state until the entity gets the fresh one
+        if entity.cached_model_state is None or entity.state_restored:
+            return
+        try:
+            self._data[entity.unique_id] = {
+                "state": _serialize(entity.cached_model_state),
+                "last_update": entity.last_update,
+            }
+        except TypeError as e:
+            _LOGGER.debug(f"BtMeshStateStore: skip {entity.unique_id}: {e}")
+
+    async def async_save(self) -> None:
+        """Write the model state of all entities to persistent storage."""
+        for entity in self._entities.values():
+            self._snapshot_entity(entity)
+        await self._store.async_save(self._data)
+
+    async def _async_save_interval(self, _now: datetime) -> None:
+        await self.async_save()
+
+    async def _async_save_stop(self, _event: Event) -> None:
+        self._unsub_stop = None
+        await self.async_save()
+
+    async def async_remove(self) -> None:
+        """Remove the snapshot of the removed config entry."""
+        await self._store.async_remove()
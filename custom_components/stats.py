@@ -0,0 +1,21 @@
+"""Summary statistics of the measured samples."""
+from __future__ import annotations
+
+
+
+def percentile(values: list[float], fraction: float) -> float | None:
+    """Nearest rank percentile."""
+    if not values:
+        return None
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, int(round(fraction * len(values) + 0.5)) - 1))
+    return values[index]
+
+
+def summary(values: list[float]) -> dict:
+    return {
+        "count": len(values),
+        "p50": percentile(values, 0.5),
+        "p99": percentile(values, 0.99),
+        "max": max(values) if values else None,
+    }
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from typing import TYPE_CHECKING
 
 from construct import Container
 
@@ -13,12 +14,10 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.const import Platform
 
 from bluetooth_mesh.messages.generic.onoff import GenericOnOffOpcode
-from bluetooth_mesh.models.generic.onoff import GenericOnOffClient
 
 from bt_mesh_ctrl import BtMeshModelId
 from bt_mesh_ctrl.mesh_cfgclient_conf import MeshCfgModel
 
-from .application import BtMeshApplication
 from .entity import BtMeshEntity
 from .const import (
     BT_MESH_DISCOVERY_ENTITY_NEW,
@@ -28,8 +27,12 @@ from .const import (
     G_TIMEOUT,
     G_MESH_CACHE_UPDATE_TIMEOUT,
     G_MESH_CACHE_INVALIDATE_TIMEOUT,
+    REFRESH_PRIORITY_CONTROL,
 )
 
+if TYPE_CHECKING:
+    from .application import BtMeshApplication
+
 import logging
 _LOGGER = logging.getLogger(__name__)
 
@@ -83,6 +86,8 @@ class BtMeshSwitch_GenericOnOff(BtMeshEntity, SwitchEntity):
         GenericOnOffOpcode.GENERIC_ONOFF_STATUS,
     )
 
+    refresh_priority = REFRESH_PRIORITY_CONTROL
+
     async def query_model_state(self) -> any:
         """Query GenericOnOff state."""
         return await self.app.generic_onoff_get(
@@ -90,15 +95,16 @@ class BtMeshSwitch_GenericOnOff(BtMeshEntity, SwitchEntity):
             app_index=self.app_key,
         )
 
-    async def async_update(self):
+    @callback
+    def update_attributes(self, state: any) -> None:
         """Extract switch state from GenericOnOff model state."""
-        if self.model_state is not None:
-            if "target_onoff" in self.model_state and \
-                    "remaining_time" in self.model_state and \
-                    self.model_state.remaining_time > 0:
-                self._attr_is_on = self.model_state.target_onoff
+        if state is not None:
+            if "target_onoff" in state and \
+                    "remaining_time" in state and \
+                    state.remaining_time > 0:
+                self._attr_is_on = state.target_onoff
             else:
-                self._attr_is_on = self.model_state.present_onoff
+                self._attr_is_on = state.present_onoff
         else:
             self._attr_is_on = None
 
@@ -0,0 +1,61 @@
+"""Persistent cache of the BT Mesh vendor thermostat temperature ranges."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    STORAGE_THERMOSTAT_RANGES,
+    G_THERMOSTAT_RANGES_SAVE_DELAY,
+)
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+
+
+class BtMeshThermostatRanges:
+    """Temperature range of the thermostats keyed by the unicast address,
+       the range is the node configuration, it's requested once."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self.hass = hass
+        self._store: Store[dict[str, list[float]]] = Store(hass, 1, f"{STORAGE_THERMOSTAT_RANGES}.{entry_id}")
+        self._data: dict[str, list[float]] = {}
+
+    async def async_load(self) -> None:
+        self._data = await self._store.async_load() or {}
+        _LOGGER.debug(f"BtMeshThermostatRanges: loaded {len(self._data)} ranges")
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, unicast_addr_key: str) -> tuple[float, float] | None:
+        value = self._data.get(unicast_addr_key)
+        return None if value is None else tuple(value)
+
+    @callback
+    def async_set(self, unicast_addr_key: str, min_temperature: float, max_temperature: float) -> None:
+        value = [min_temperature, max_temperature]
+        if self._data.get(unicast_addr_key) == value:
+            return
+        self._data[unicast_addr_key] = value
+        self._async_schedule_save()
+
+    @callback
+    def async_pop_node(self, unicast_addr_key: str) -> None:
+        """Forget the range of the removed node."""
+        if self._data.pop(unicast_addr_key, None) is not None:
+            self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, G_THERMOSTAT_RANGES_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, list[float]]:
+        return self._data
+
+    async def async_remove(self) -> None:
+        """Remove the ranges of the removed config entry."""
+        await self._store.async_remove()
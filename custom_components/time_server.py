@@ -3,10 +3,18 @@ from __future__ import annotations
 
 
 import time
+from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
 from typing import Union
 from uuid import UUID
 
+from homeassistant.core import callback
+import homeassistant.util.dt as dt_util
+from homeassistant.helpers.event import (
+    async_track_point_in_utc_time,
+    async_track_time_interval,
+)
+
 from bluetooth_mesh.utils import ParsedMeshMessage
 from bluetooth_mesh.messages.time import (
     TimeOpcode,
@@ -15,14 +23,106 @@ from bluetooth_mesh.messages.time import (
 )
 from bluetooth_mesh.models.time import TimeServer, TimeSetupServer
 
+from .const import (
+    DOMAIN,
+    G_TIME_ZONE_CHECK_INTERVAL,
+    G_TIME_ZONE_CHANGE_HORIZON,
+)
+
 import logging
 _LOGGER = logging.getLogger(__name__)
 
 
 
+TAI_UTC_DELTA = timedelta(seconds=CURRENT_TAI_UTC_DELTA)
+NO_UNCERTAINTY = timedelta(0)
+
+# mesh TAI epoch 2000-01-01T00:00:00 as unix time
+MESH_TAI_EPOCH = 946684800
+
+
+def local_utc_offset(timestamp: float) -> timedelta:
+    """Offset of the Home Assistant time zone at the time, including DST.
+       The configured zone is followed, the process TZ is not updated when
+       it's changed."""
+    return datetime.fromtimestamp(timestamp, dt_util.get_default_time_zone()).utcoffset()
+
+
+def next_zone_change(now: float, horizon: float=G_TIME_ZONE_CHANGE_HORIZON) -> tuple[float, timedelta] | None:
+    """Time and the new offset of the next local time offset change
+       (DST) within the horizon, the day of the change is found by daily
+       steps, then the second by bisection."""
+    offset = local_utc_offset(now)
+    day = 86400
+    start = now
+    while start < now + horizon:
+        end = start + day
+        if local_utc_offset(end) != offset:
+            while end - start > 1:
+                middle = (start + end) // 2
+                if local_utc_offset(middle) == offset:
+                    start = middle
+                else:
+                    end = middle
+            return end, local_utc_offset(end)
+        start = end
+    return None
+
+
+class TimeZoneCache:
+    """Local time zone and its next change, checked periodically instead
+       of on every Time Server request."""
+
+    def __init__(self) -> None:
+        self.offset = timedelta(0)
+        self.timezone = timezone.utc
+        self.next_change: tuple[float, timedelta] | None = None
+        self.checked: float | None = None
+
+    def refresh(self, now: float | None=None) -> bool:
+        """Update the cached zone, True if the offset is changed."""
+        now = time.time() if now is None else now
+        offset = local_utc_offset(now)
+        changed = self.checked is not None and offset != self.offset
+        if self.checked is None or changed or \
+                (self.next_change is not None and now >= self.next_change[0]):
+            self.next_change = next_zone_change(now)
+        self.offset = offset
+        self.timezone = timezone(offset)
+        self.checked = now
+        return changed
+
+    def get(self) -> TimeZoneCache:
+        now = time.time()
+        if self.checked is None or now - self.checked > G_TIME_ZONE_CHECK_INTERVAL or \
+                (self.next_change is not None and now >= self.next_change[0]):
+            self.refresh(now)
+        return self
+
+    @property
+    def offset_new(self) -> timedelta:
+        return self.offset if self.next_change is None else self.next_change[1]
+
+    @property
+    def tai_of_zone_change(self) -> int:
+        if self.next_change is None:
+            return 0
+        return int(self.next_change[0]) - MESH_TAI_EPOCH + CURRENT_TAI_UTC_DELTA
+
+
 class TimeServerMixin:
     # self.elements
     # self.loop
+    # self.hass
+    # self.connected
+
+    _time_zone: TimeZoneCache | None = None
+
+    @property
+    def time_zone(self) -> TimeZoneCache:
+        if self._time_zone is None:
+            self._time_zone = TimeZoneCache()
+        return self._time_zone.get()
 
     def time_server_init(self):
         # Time Server message handlers
@@ -32,9 +132,7 @@ class TimeServerMixin:
             _destination: Union[int, UUID],
             message: ParsedMeshMessage,
         ):
-            system_timezone_offset = time.timezone * -1
-            system_timezone = timezone(offset=timedelta(seconds=system_timezone_offset))
-            date = datetime.now(system_timezone)
+            date = datetime.now(self.time_zone.timezone)
 
             server = self.elements[0][TimeServer]
             self.loop.create_task(
@@ -42,8 +140,8 @@ class TimeServerMixin:
                     _source,
                     _app_index,
                     date,
-                    timedelta(seconds=CURRENT_TAI_UTC_DELTA),
-                    timedelta(0),
+                    TAI_UTC_DELTA,
+                    NO_UNCERTAINTY,
                     True
                 )
             )
@@ -54,17 +152,16 @@ class TimeServerMixin:
             _destination: Union[int, UUID],
             message: ParsedMeshMessage,
         ):
-            system_timezone_offset = time.timezone * -1
-            system_timezone_delta = timedelta(seconds=system_timezone_offset)
+            time_zone = self.time_zone
 
             server = self.elements[0][TimeServer]
             self.loop.create_task(
                 server.time_zone_status(
                     _source,
                     _app_index,
-                    system_timezone_delta,
-                    system_timezone_delta,
-                    0
+                    time_zone.offset,
+                    time_zone.offset_new,
+                    time_zone.tai_of_zone_change
                 )
             )
 
@@ -112,3 +209,68 @@ class TimeServerMixin:
 
         server = self.elements[0][TimeSetupServer]
         server.app_message_callbacks[TimeOpcode.TIME_SET].add(receive_set)
+
+    def time_server_publish_start(self, address: int, app_index: int, period: float) -> Callable[[], None]:
+        """Publish Time Status to the address on the period and on the local
+           time offset change, the nodes subscribed to it sync without the
+           Time Get requests. Returns the function stopping it."""
+        unsubs: dict[str, Callable[[], None]] = {}
+
+        @callback
+        def _async_publish(*_args) -> None:
+            if not self.connected:
+                return
+            server = self.elements[0][TimeServer]
+            time_zone = self.time_zone
+            self.hass.async_create_background_task(
+                server.time_status(
+                    address,
+                    app_index,
+                    datetime.now(time_zone.timezone),
+                    TAI_UTC_DELTA,
+                    NO_UNCERTAINTY,
+                    True
+                ),
+                f"{DOMAIN}_time_status_{address:04x}"
+            )
+
+        @callback
+        def _async_track_zone_change() -> None:
+            unsub = unsubs.pop("zone_change", None)
+            if unsub is not None:
+                unsub()
+            next_change = self.time_zone.next_change
+            if next_change is not None:
+                unsubs["zone_change"] = async_track_point_in_utc_time(
+                    self.hass,
+                    _async_zone_changed,
+                    datetime.fromtimestamp(next_change[0], timezone.utc)
+                )
+
+        @callback
+        def _async_zone_changed(_now: datetime) -> None:
+            unsubs.pop("zone_change", None)
+            self._time_zone.refresh()
+            _LOGGER.info(f"local time offset changed to {self._time_zone.offset}, publish time")
+            _async_publish()
+            _async_track_zone_change()
+
+        @callback
+        def _async_periodic(_now: datetime) -> None:
+            # the system time zone could be changed out of DST schedule
+            if self._time_zone.refresh():
+                _async_track_zone_change()
+            _async_publish()
+
+        @callback
+        def _async_stop() -> None:
+            for unsub in unsubs.values():
+                unsub()
+            unsubs.clear()
+
+        unsubs["periodic"] = async_track_time_interval(
+            self.hass, _async_periodic, timedelta(seconds=period)
+        )
+        _async_track_zone_change()
+        _async_publish()
+        return _async_stop
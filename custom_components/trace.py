@@ -0,0 +1,204 @@
+"""Capture and replay of the BT Mesh inbound message traces."""
+from __future__ import annotations
+
+import asyncio
+import struct
+import time
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from bluetooth_mesh.messages import AccessMessage
+from bluetooth_mesh.utils import ParsedMeshMessage
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import (
+    G_TRACE_MAX_DURATION,
+    G_TRACE_MAX_RECORDS,
+)
+
+if TYPE_CHECKING:
+    from . import BtMeshConfigEntry
+    from .entity import BtMeshEntity
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+
+
+# file header: magic, version, capture start unix time
+TRACE_MAGIC = b"BTMESH"
+TRACE_VERSION = 2
+TRACE_HEADER = struct.Struct("<6sHd")
+
+# record: microseconds since start, source, app index, destination,
+# message length, followed by the encoded access message
+TRACE_RECORD = struct.Struct("<QHHHH")
+
+
+class BtMeshTraceRecorder:
+    """Recorder of the messages passed to the entities, kept in memory
+       and written to the file when stopped."""
+
+    def __init__(
+        self,
+        max_records: int=G_TRACE_MAX_RECORDS,
+        max_duration: float=G_TRACE_MAX_DURATION
+    ) -> None:
+        self.max_records = max_records
+        self.max_duration = min(max_duration, G_TRACE_MAX_DURATION)
+        self.start_time = time.time()
+        self.records = 0
+        self.dropped = 0
+        self._start = time.monotonic()
+        self._data = bytearray(TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, self.start_time))
+
+    @property
+    def full(self) -> bool:
+        return self.records >= self.max_records or \
+            time.monotonic() - self._start >= self.max_duration
+
+    def record(
+        self,
+        source: int,
+        app_index: int,
+        destination: int | UUID,
+        message: ParsedMeshMessage
+    ) -> None:
+        if self.full:
+            self.dropped += 1
+            return
+        # the recorder must never break the dispatch of the message
+        try:
+            data = AccessMessage.build(message)
+            record = TRACE_RECORD.pack(
+                int((time.monotonic() - self._start) * 1_000_000),
+                source,
+                app_index,
+                destination if isinstance(destination, int) else 0,
+                len(data)
+            )
+        except Exception as e:
+            _LOGGER.debug(f"trace: failed to record message from {source}: {repr(e)}")
+            self.dropped += 1
+            return
+        self._data += record
+        self._data += data
+        self.records += 1
+
+    def to_bytes(self) -> bytes:
+        return bytes(self._data)
+
+
+def decode_trace(data: bytes) -> tuple[float, list[tuple[float, int, int, int, bytes]]]:
+    """Capture start time and records (seconds since start, source,
+       app index, destination, encoded message) of the trace."""
+    magic, version, start_time = TRACE_HEADER.unpack_from(data, 0)
+    if magic != TRACE_MAGIC or version != TRACE_VERSION:
+        raise ValueError("not a BT Mesh trace file")
+
+    records = []
+    offset = TRACE_HEADER.size
+    while offset + TRACE_RECORD.size <= len(data):
+        timestamp, source, app_index, destination, length = TRACE_RECORD.unpack_from(data, offset)
+        offset += TRACE_RECORD.size
+        records.append((timestamp / 1_000_000, source, app_index, destination, data[offset:offset + length]))
+        offset += length
+    return start_time, records
+
+
+def _write_file(filename: str, data: bytes) -> None:
+    with open(filename, "wb") as file:
+        file.write(data)
+
+
+def _read_file(filename: str) -> bytes:
+    with open(filename, "rb") as file:
+        return file.read()
+
+
+async def async_save_trace(hass: HomeAssistant, recorder: BtMeshTraceRecorder, filename: str) -> None:
+    await hass.async_add_executor_job(_write_file, filename, recorder.to_bytes())
+    _LOGGER.info(
+        f"trace saved to {filename}: {recorder.records} messages, "
+        f"{recorder.dropped} dropped"
+    )
+
+
+async def async_replay_trace(
+    hass: HomeAssistant,
+    entry: BtMeshConfigEntry,
+    filename: str,
+    speed: float=1.0
+) -> dict:
+    """Feed the recorded messages to the entities of the simulated network
+       with the recorded timing divided by speed, as fast as possible if
+       speed is 0. The messages go straight to the entities subscribed to
+       the source and opcode, the application metrics, reachability and
+       trace are not touched. Returns the dispatch cost and the number of
+       the state writes of the integration entities."""
+    data = await hass.async_add_executor_job(_read_file, filename)
+    _start_time, records = decode_trace(data)
+
+    # messages are parsed before the replay, only dispatch is measured
+    messages = []
+    for timestamp, source, app_index, destination, payload in records:
+        try:
+            messages.append((timestamp, source, app_index, destination, AccessMessage.parse(payload)))
+        except Exception as e:
+            _LOGGER.debug(f"replay: failed to parse message from {source:04x}: {repr(e)}")
+
+    receivers: dict[tuple[int, int], list[BtMeshEntity]] = {}
+    for entity in entry.runtime_data.state_store.entities:
+        for opcode in getattr(entity, "status_opcodes", ()):
+            receivers.setdefault((entity.unicast_addr, opcode), []).append(entity)
+    entity_ids = {entity.entity_id for entity in entry.runtime_data.state_store.entities}
+
+    state_writes = 0
+
+    @callback
+    def _count_state_write(event: Event) -> None:
+        nonlocal state_writes
+        if event.data["entity_id"] in entity_ids:
+            state_writes += 1
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _count_state_write)
+    delivered = 0
+    dispatch_time = 0.0
+    max_dispatch = 0.0
+    start = time.monotonic()
+    try:
+        for timestamp, source, app_index, destination, message in messages:
+            if speed > 0:
+                delay = timestamp / speed - (time.monotonic() - start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            entities = receivers.get((source, message.opcode))
+            if not entities:
+                continue
+            dispatched = time.perf_counter()
+            for entity in entities:
+                entity.receive_message(source, app_index, destination, message)
+            elapsed = time.perf_counter() - dispatched
+            delivered += 1
+            dispatch_time += elapsed
+            max_dispatch = max(max_dispatch, elapsed)
+        # state writes of the last messages
+        await asyncio.sleep(0)
+    finally:
+        unsub()
+
+    duration = time.monotonic() - start
+    result = {
+        "messages": len(messages),
+        "skipped": len(records) - len(messages),
+        "delivered": delivered,
+        "duration": round(duration, 3),
+        "dispatch_time": round(dispatch_time, 6),
+        "dispatch_max": round(max_dispatch, 6),
+        "dispatch_mean": round(dispatch_time / delivered, 6) if delivered else None,
+        "state_writes": state_writes,
+    }
+    _LOGGER.info(f"trace {filename} replayed: {result}")
+    return result
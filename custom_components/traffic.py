@@ -0,0 +1,116 @@
+"""Ring buffer of the recent BT Mesh access messages."""
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from uuid import UUID
+
+from .const import (
+    G_TRAFFIC_LOG_SIZE,
+    G_TRAFFIC_LATENCY_TIMEOUT,
+)
+
+
+
+TRAFFIC_IN = 0
+TRAFFIC_OUT = 1
+
+# unassigned address, e.g. virtual destination
+ADDRESS_UNASSIGNED = 0x0000
+
+
+def access_opcode(data: bytes) -> int | None:
+    """Opcode of the encoded access message, 1, 2 or 3 octets long."""
+    if not data:
+        return None
+    if data[0] & 0x80 == 0:
+        length = 1
+    elif data[0] & 0x40 == 0:
+        length = 2
+    else:
+        length = 3
+    if len(data) < length:
+        return None
+    return int.from_bytes(data[:length], "big")
+
+
+class BtMeshTrafficLog:
+    """Fixed size log of the inbound and outbound access messages, stored
+       in parallel arrays. Latency of the inbound message is the time since
+       the last message sent to its source."""
+
+    def __init__(
+        self,
+        size: int=G_TRAFFIC_LOG_SIZE,
+        latency_timeout: float=G_TRAFFIC_LATENCY_TIMEOUT
+    ) -> None:
+        self.size = size
+        self.latency_timeout = latency_timeout
+
+        self._timestamp = array("d", bytes(8 * size))
+        self._direction = array("B", bytes(size))
+        self._source = array("H", bytes(2 * size))
+        self._destination = array("H", bytes(2 * size))
+        self._opcode = array("L", bytes(array("L").itemsize * size))
+        self._length = array("H", bytes(2 * size))
+        self._latency = array("f", bytes(4 * size))
+
+        self._next = 0
+        self._count = 0
+        # destination: monotonic time of the last sent message
+        self._last_sent: dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def record(
+        self,
+        direction: int,
+        source: int | None,
+        destination: int | UUID | None,
+        data: bytes
+    ) -> None:
+        if not isinstance(destination, int):
+            destination = None
+        latency = math.nan
+        now = time.monotonic()
+        if direction == TRAFFIC_OUT:
+            if destination is not None:
+                self._last_sent[destination] = now
+        elif source is not None:
+            sent = self._last_sent.pop(source, None)
+            if sent is not None and now - sent <= self.latency_timeout:
+                latency = now - sent
+
+        opcode = access_opcode(data)
+
+        index = self._next
+        self._timestamp[index] = time.time()
+        self._direction[index] = direction
+        self._source[index] = ADDRESS_UNASSIGNED if source is None else source & 0xffff
+        self._destination[index] = ADDRESS_UNASSIGNED if destination is None else destination & 0xffff
+        self._opcode[index] = 0 if opcode is None else opcode
+        self._length[index] = min(len(data), 0xffff)
+        self._latency[index] = latency
+
+        self._next = (index + 1) % self.size
+        self._count = min(self._count + 1, self.size)
+
+    def records(self) -> list[dict]:
+        """Logged messages, oldest first."""
+        result = []
+        start = (self._next - self._count) % self.size
+        for offset in range(self._count):
+            index = (start + offset) % self.size
+            latency = self._latency[index]
+            result.append({
+                "timestamp": round(self._timestamp[index], 3),
+                "direction": "in" if self._direction[index] == TRAFFIC_IN else "out",
+                "source": f"{self._source[index]:04x}",
+                "destination": f"{self._destination[index]:04x}",
+                "opcode": f"{self._opcode[index]:x}",
+                "size": self._length[index],
+                "latency": None if math.isnan(latency) else round(latency, 3),
+            })
+        return result
@@ -0,0 +1,208 @@
+"""Event loop lag watchdog attributing the stalls to the integration callbacks."""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Callable
+from functools import wraps
+from itertools import count
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DOMAIN,
+    DEFAULT_WATCHDOG_THRESHOLD,
+    DEFAULT_WATCHDOG_INTERVAL,
+    G_WATCHDOG_MAX_EVENTS,
+    G_WATCHDOG_LAG_SAMPLES,
+    G_WATCHDOG_STACK_LIMIT,
+)
+from .stats import summary
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+
+
+def stack_sample(thread_id: int) -> list[str] | None:
+    """Current stack of the thread, innermost frame last."""
+    frame = sys._current_frames().get(thread_id)
+    if frame is None:
+        return None
+    return [
+        f"{frame.filename}:{frame.lineno} {frame.name}"
+            for frame in traceback.extract_stack(frame, limit=G_WATCHDOG_STACK_LIMIT)
+    ]
+
+
+class BtMeshWatchdog:
+    """Loop lag sampler and timing of the instrumented callbacks.
+
+       The callbacks running longer than the threshold and the loop stalls
+       are sampled from a monitor thread while they are still running, so
+       the stack shows where the time is spent."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        threshold: float=DEFAULT_WATCHDOG_THRESHOLD,
+        interval: float=DEFAULT_WATCHDOG_INTERVAL
+    ) -> None:
+        self.hass = hass
+        self.threshold = threshold
+        self.interval = interval
+
+        # callback name: [calls, total time, max time, slow calls]
+        self.stats: dict[str, list] = {}
+        self.events: deque[dict] = deque(maxlen=G_WATCHDOG_MAX_EVENTS)
+        self.lag: deque[float] = deque(maxlen=G_WATCHDOG_LAG_SAMPLES)
+        self.stalls = 0
+
+        # in-flight calls: token -> [name, source, start, thread id, stack]
+        self._running: dict[int, list] = {}
+        self._running_lock = threading.Lock()
+        self._tokens = count()
+
+        self._loop_thread_id: int | None = None
+        self._heartbeat = time.monotonic()
+        self._stall_stack: list[str] | None = None
+        self._task: asyncio.Task | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def instrument(self, obj: any, *names: str) -> None:
+        """Replace the methods of the object with the timed ones, must be
+           done before the methods are registered as callbacks."""
+        source = getattr(obj, "entity_id", None)
+        for name in names:
+            func = getattr(obj, name, None)
+            if func is None:
+                continue
+            setattr(obj, name, self.timed(f"{type(obj).__name__}.{name}", source, func))
+
+    def timed(self, name: str, source: str | None, func: Callable) -> Callable:
+        """Timed wrapper, keeps the HA callback marker of the function. The
+           coroutine time includes its awaits, entity updates do not wait
+           for the network."""
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                token = self._enter(name, source)
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self._exit(token)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            token = self._enter(name, source)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._exit(token)
+        return wrapper
+
+    def _enter(self, name: str, source: str | None) -> int:
+        token = next(self._tokens)
+        with self._running_lock:
+            self._running[token] = [name, source, time.perf_counter(), threading.get_ident(), None]
+        return token
+
+    def _exit(self, token: int) -> None:
+        end = time.perf_counter()
+        with self._running_lock:
+            name, source, start, _thread_id, stack = self._running.pop(token)
+            elapsed = end - start
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = [0, 0.0, 0.0, 0]
+            stats[0] += 1
+            stats[1] += elapsed
+            if elapsed > stats[2]:
+                stats[2] = elapsed
+            if elapsed > self.threshold:
+                stats[3] += 1
+
+        if elapsed > self.threshold:
+            self.events.append({
+                "time": time.time(),
+                "callback": name,
+                "source": source,
+                "duration": round(elapsed, 4),
+                "stack": stack,
+            })
+            _LOGGER.warning(f"{name} ({source}) blocked for {elapsed:.3f}s")
+
+    def async_start(self, entry: BtMeshConfigEntry) -> None:
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._task = entry.async_create_background_task(
+            self.hass, self._async_sample_lag(), f"{DOMAIN}_{entry.title}_watchdog"
+        )
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._monitor, name=f"{DOMAIN}_watchdog", daemon=True)
+        self._thread.start()
+
+    def async_stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._stop.set()
+        self._thread = None
+
+    async def _async_sample_lag(self) -> None:
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self.interval)
+            self._heartbeat = now = time.monotonic()
+            lag = max(0.0, now - start - self.interval)
+            self.lag.append(lag)
+            if lag > self.threshold:
+                self.stalls += 1
+                self.events.append({
+                    "time": time.time(),
+                    "callback": "event_loop",
+                    "source": None,
+                    "duration": round(lag, 4),
+                    "stack": self._stall_stack,
+                })
+            self._stall_stack = None
+
+    def _monitor(self) -> None:
+        """Monitor thread, samples the stack of the slow in-flight calls
+           and of the loop missing its heartbeat."""
+        period = self.threshold / 2
+        while not self._stop.wait(period):
+            now = time.perf_counter()
+            with self._running_lock:
+                for call in self._running.values():
+                    if call[4] is None and now - call[2] > self.threshold:
+                        call[4] = stack_sample(call[3])
+
+            if self._stall_stack is None and \
+                    time.monotonic() - self._heartbeat > self.interval + self.threshold:
+                self._stall_stack = stack_sample(self._loop_thread_id)
+
+    def as_dict(self) -> dict:
+        return {
+            "threshold": self.threshold,
+            "interval": self.interval,
+            "loop_lag": summary(list(self.lag)),
+            "stalls": self.stalls,
+            "callbacks": {
+                name: {
+                    "calls": calls,
+                    "mean": round(total / calls, 6) if calls else None,
+                    "max": round(max_time, 6),
+                    "slow": slow,
+                }
+                    for name, (calls, total, max_time, slow) in self.stats.items()
+            },
+            "events": list(self.events),
+        }
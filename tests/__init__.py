@@ -0,0 +1 @@
+"""Tests of the BT Mesh integration."""
@@ -0,0 +1 @@
+"""Benchmarks of the BT Mesh integration."""
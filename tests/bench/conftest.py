@@ -0,0 +1,140 @@
+"""Stubs of the microbenchmarks, the entities run without D-Bus and
+   without being added to Home Assistant."""
+from __future__ import annotations
+
+import json
+import os
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.bt_mesh.application import BtMeshApplication
+from custom_components.bt_mesh.const import G_SEND_INTERVAL
+from custom_components.bt_mesh.metrics import BtMeshMetrics
+from custom_components.bt_mesh.shards import BtMeshReachability
+from custom_components.bt_mesh.entity import BtMeshEntity, discard_device_info
+
+
+BENCH_ADDR = 0x0100
+
+BASELINES_FILE = Path(__file__).with_name("baselines.json")
+
+# baselines are the best time of the run on the reference machine,
+# the slack covers the slower machines and the noise of the shared ones
+TIME_TOLERANCE = 3.0
+ALLOC_TOLERANCE = 1.25
+ALLOC_SLACK = 64
+
+# BT_MESH_BENCH_UPDATE=1 writes the measured values as the new baselines
+UPDATE_BASELINES = os.environ.get("BT_MESH_BENCH_UPDATE") == "1"
+
+
+class StubApplication:
+    """Application layer without D-Bus, the message callback of
+       BtMeshApplication runs on the stub state."""
+    _bt_mesh_msg_callback = BtMeshApplication._bt_mesh_msg_callback
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self.metrics = BtMeshMetrics(send_interval=G_SEND_INTERVAL)
+        self.reachability = BtMeshReachability()
+        self.trace = None
+        self.dedup = None
+        self._received_payload = None
+
+
+def cfg_model(model_id: int, address: int=BENCH_ADDR) -> SimpleNamespace:
+    device = SimpleNamespace(
+        uuid=UUID(int=address),
+        unique_id=UUID(int=address),
+        unicast_addr=address,
+        cid=0x05f1,
+        pid=0x0001,
+        vid=0x0001,
+    )
+    return SimpleNamespace(
+        unique_id=f"{address:04x}-{model_id:04x}-bench",
+        name=f"{address:04x}-bench",
+        unicast_addr=address,
+        app_key=0,
+        model_id=model_id,
+        device=device,
+    )
+
+
+def quiet(entity: BtMeshEntity) -> BtMeshEntity:
+    """Entity not added to HA, the attributes are updated from the model
+       state, state writes and queries are no-op."""
+    entity.hass = entity.app.hass
+    entity.async_write_ha_state = lambda: None
+    entity._query_model_state = lambda: None
+    return entity
+
+
+def allocated_bytes(func: Callable[[], any], samples: int=100) -> float:
+    """Mean peak of the traced allocations of a single call."""
+    func()
+    tracemalloc.start()
+    try:
+        peaks = 0
+        for _ in range(samples):
+            current, _peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            func()
+            peaks += tracemalloc.get_traced_memory()[1] - current
+    finally:
+        tracemalloc.stop()
+    return peaks / samples
+
+
+class Baselines:
+    """Committed per call time and allocation baselines."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, dict[str, float]] = json.loads(BASELINES_FILE.read_text())
+        self.measured: dict[str, dict[str, float]] = {}
+
+    def check(self, name: str, benchmark, func: Callable[[], any]) -> None:
+        """Fail if the call is slower or allocates more than its baseline."""
+        measured = {"bytes_per_call": round(allocated_bytes(func))}
+        if not benchmark.disabled:
+            measured["ns_per_call"] = round(benchmark.stats.stats.min * 1e9)
+        self.measured[name] = measured
+        if UPDATE_BASELINES:
+            return
+
+        baseline = self.data[name]
+        assert measured["bytes_per_call"] <= baseline["bytes_per_call"] * ALLOC_TOLERANCE + ALLOC_SLACK, \
+            f"{name}: {measured['bytes_per_call']} bytes per call, baseline {baseline['bytes_per_call']}"
+        if "ns_per_call" in measured:
+            assert measured["ns_per_call"] <= baseline["ns_per_call"] * TIME_TOLERANCE, \
+                f"{name}: {measured['ns_per_call']} ns per call, baseline {baseline['ns_per_call']}"
+
+    def save(self) -> None:
+        data = {**self.data, **self.measured}
+        BASELINES_FILE.write_text(json.dumps(dict(sorted(data.items())), indent=2) + "\n")
+
+
+@pytest.fixture(scope="session")
+def baselines():
+    baselines = Baselines()
+    yield baselines
+    if UPDATE_BASELINES:
+        baselines.save()
+
+
+@pytest.fixture
+def stub_app(hass: HomeAssistant) -> StubApplication:
+    return StubApplication(hass)
+
+
+@pytest.fixture(autouse=True)
+def forget_device_info():
+    yield
+    discard_device_info(cfg_model(0).device)
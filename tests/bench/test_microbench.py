@@ -0,0 +1,111 @@
+"""Microbenchmarks of the per-message hot path, the time and the
+   allocations per call must stay within the committed baselines."""
+from __future__ import annotations
+
+from construct import Container
+
+from bluetooth_mesh.messages.generic.onoff import GenericOnOffOpcode
+from bluetooth_mesh.messages.properties import PropertyID
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from bt_mesh_ctrl import BtMeshModelId
+
+from custom_components.bt_mesh.const import BT_MESH_MSG
+from custom_components.bt_mesh.entity import BtMeshEntity
+from custom_components.bt_mesh.light import BtMeshLightEntity
+from custom_components.bt_mesh.sensor_properties import get_sensor_description, sensor_value
+from custom_components.bt_mesh.switch import BtMeshSwitch_GenericOnOff
+
+from .conftest import BENCH_ADDR, cfg_model, quiet
+
+
+ONOFF_STATUS = Container(
+    opcode=GenericOnOffOpcode.GENERIC_ONOFF_STATUS,
+    generic_onoff_status=Container(present_onoff=1, target_onoff=1, remaining_time=0),
+)
+
+
+def onoff_switch(app) -> BtMeshSwitch_GenericOnOff:
+    switch = quiet(BtMeshSwitch_GenericOnOff(app=app, cfg_model=cfg_model(BtMeshModelId.GenericOnOffServer)))
+    switch.update_model_state(ONOFF_STATUS.generic_onoff_status)
+    return switch
+
+
+def test_receive_message(benchmark, baselines, stub_app) -> None:
+    switch = onoff_switch(stub_app)
+
+    def receive_message() -> None:
+        switch.receive_message(BENCH_ADDR, 0, BENCH_ADDR, ONOFF_STATUS)
+
+    benchmark(receive_message)
+    baselines.check("receive_message", benchmark, receive_message)
+
+
+def test_model_state(benchmark, baselines, stub_app) -> None:
+    switch = onoff_switch(stub_app)
+
+    def model_state() -> None:
+        switch.model_state
+
+    benchmark(model_state)
+    baselines.check("model_state", benchmark, model_state)
+
+
+def test_sensor_value(benchmark, baselines) -> None:
+    description = get_sensor_description(PropertyID.PRESENT_AMBIENT_TEMPERATURE)
+    prop = Container(
+        sensor_setting_property_id=PropertyID.PRESENT_AMBIENT_TEMPERATURE,
+        present_ambient_temperature=Container(temperature=21.5),
+    )
+
+    def value() -> None:
+        sensor_value(prop, description)
+
+    benchmark(value)
+    baselines.check("sensor_value", benchmark, value)
+
+
+def test_light_conversion(benchmark, baselines) -> None:
+    def light_conversion() -> None:
+        brightness = BtMeshLightEntity.brightness_hass_to_btmesh(128)
+        BtMeshLightEntity.brightness_btmesh_to_hass(brightness)
+        hue, saturation = BtMeshLightEntity.color_hass_to_btmesh((120.0, 50.0))
+        BtMeshLightEntity.color_btmesh_to_hass(hue, saturation)
+
+    benchmark(light_conversion)
+    baselines.check("light_conversion", benchmark, light_conversion)
+
+
+def test_unique_id_sensor(benchmark, baselines) -> None:
+    sensor_cfg_model = cfg_model(BtMeshModelId.SensorServer)
+
+    def unique_id() -> None:
+        BtMeshEntity.unique_id_sensor(sensor_cfg_model, PropertyID.PRESENT_AMBIENT_TEMPERATURE)
+
+    benchmark(unique_id)
+    baselines.check("unique_id_sensor", benchmark, unique_id)
+
+
+async def test_dispatch(hass: HomeAssistant, benchmark, baselines, stub_app) -> None:
+    """Application message callback through the dispatcher to the entity."""
+    switch = onoff_switch(stub_app)
+    switch._last_update = None
+    unsub = async_dispatcher_connect(
+        hass,
+        BT_MESH_MSG.format(BENCH_ADDR, GenericOnOffOpcode.GENERIC_ONOFF_STATUS),
+        switch.receive_message
+    )
+
+    def dispatch() -> None:
+        stub_app._bt_mesh_msg_callback(BENCH_ADDR, 0, BENCH_ADDR, ONOFF_STATUS)
+
+    try:
+        benchmark(dispatch)
+        baselines.check("dispatch", benchmark, dispatch)
+    finally:
+        unsub()
+    # delivered synchronously, not through an executor job
+    assert switch.last_update is not None
+    assert switch.is_on
@@ -0,0 +1,168 @@
+"""Scale benchmark of the integration on the simulated network: startup,
+   refresh cycle and command latency at increasing node counts.
+
+   BT_MESH_BENCH_NODES selects the network sizes, e.g. "50,200,1000",
+   BT_MESH_BENCH_REPORT is the file the JSON report is written to."""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import resource
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from custom_components.bt_mesh.const import (
+    DOMAIN,
+    CONF_DBUS_APP_PATH,
+    CONF_DBUS_APP_TOKEN,
+    CONF_MESH_CFGCLIENT_CONFIG_PATH,
+    CONF_SIMULATION,
+    CONF_SIM_NODES,
+    CONF_SIM_LATENCY,
+    CONF_SIM_PUBLISH_INTERVAL,
+    CONF_SIM_SEED,
+)
+from custom_components.bt_mesh.stats import summary
+
+
+SCALE_NODES = [int(nodes) for nodes in os.environ.get("BT_MESH_BENCH_NODES", "50").split(",")]
+REPORT_FILE = os.environ.get("BT_MESH_BENCH_REPORT")
+
+COMMANDS = 100
+TIMEOUT = 900
+LAG_INTERVAL = 0.05
+
+
+class LoopLagSampler:
+    """Event loop lag, the delay of a periodic sleep over its interval."""
+
+    def __init__(self, interval: float=LAG_INTERVAL) -> None:
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> dict:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        return summary(self.samples)
+
+    async def _run(self) -> None:
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, time.monotonic() - start - self.interval))
+
+
+def peak_memory() -> int:
+    """Peak resident memory of the process, KiB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+async def async_wait_for(predicate: Callable[[], bool], timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        await asyncio.sleep(0.1)
+    return True
+
+
+@pytest.fixture(scope="module")
+def report():
+    report = {"timestamp": time.time(), "commands": COMMANDS, "results": []}
+    yield report
+    if REPORT_FILE is not None:
+        Path(REPORT_FILE).write_text(json.dumps(report, indent=2) + "\n")
+
+
+@pytest.mark.parametrize("nodes", SCALE_NODES)
+async def test_scale(hass: HomeAssistant, tmp_path: Path, report: dict, nodes: int) -> None:
+    assert await async_setup_component(hass, "http", {})
+    assert await async_setup_component(hass, DOMAIN, {
+        DOMAIN: {
+            CONF_SIMULATION: {
+                CONF_SIM_LATENCY: 0.005,
+                CONF_SIM_PUBLISH_INTERVAL: 0,
+                CONF_SIM_SEED: 1,
+            },
+        },
+    })
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_DBUS_APP_PATH: "/bt_mesh/benchmark",
+            CONF_DBUS_APP_TOKEN: 0,
+            CONF_MESH_CFGCLIENT_CONFIG_PATH: str(tmp_path / "config_db.json"),
+            CONF_SIMULATION: True,
+        },
+        options={CONF_SIM_NODES: nodes},
+    )
+    entry.add_to_hass(hass)
+
+    result: dict = {"nodes": nodes}
+    lag = LoopLagSampler()
+    lag.start()
+    try:
+        # time from async_setup_entry until all entities are refreshed
+        setup_start = time.monotonic()
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        scheduler = entry.runtime_data.scheduler
+        assert await async_wait_for(lambda: scheduler.warmup_done, TIMEOUT)
+        entities = entry.runtime_data.state_store.entities
+        result["startup"] = {
+            "setup_time": round(time.monotonic() - setup_start, 3),
+            "warmup_time": scheduler.warmup_time,
+            "stage_times": dict(scheduler.stage_times),
+            "entities": len(entities),
+            "available": sum(1 for entity in entities if entity.available),
+        }
+
+        # steady state refresh of all active entities
+        refresh_start = time.monotonic()
+        for entity in entities:
+            if not entity.passive:
+                scheduler.async_schedule(entity)
+        assert await async_wait_for(lambda: scheduler.queue_depth == 0, TIMEOUT)
+        result["refresh_cycle_time"] = round(time.monotonic() - refresh_start, 3)
+
+        # command to confirmation latency, the service call returns
+        # when the node acknowledged the state or the request timed out
+        controls = [
+            entity.entity_id for entity in entities
+                if entity.entity_id.split(".")[0] in (Platform.SWITCH, Platform.LIGHT)
+        ]
+        latencies = []
+        for index in range(COMMANDS if controls else 0):
+            entity_id = controls[index % len(controls)]
+            start = time.monotonic()
+            await hass.services.async_call(
+                entity_id.split(".")[0],
+                "toggle",
+                {"entity_id": entity_id},
+                blocking=True
+            )
+            latencies.append(round(time.monotonic() - start, 4))
+        result["command_latency"] = summary(latencies)
+    finally:
+        result["loop_lag"] = await lag.stop()
+        result["peak_memory_kib"] = peak_memory()
+        report["results"].append(result)
+        await hass.config_entries.async_unload(entry.entry_id)
+
+    assert result["startup"]["entities"] > 0
+    assert result["startup"]["available"] == result["startup"]["entities"]
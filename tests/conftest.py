@@ -0,0 +1,32 @@
+"""Fixtures of the BT Mesh integration tests."""
+from __future__ import annotations
+
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# the repository is the bt_mesh custom component, it's imported as
+# custom_components.bt_mesh the way Home Assistant loads it
+_ROOT = Path(tempfile.mkdtemp(prefix="bt_mesh_tests_"))
+(_ROOT / "custom_components").mkdir()
+(_ROOT / "custom_components" / "__init__.py").touch()
+(_ROOT / "custom_components" / "bt_mesh").symlink_to(
+    Path(__file__).resolve().parents[1] / "custom_components"
+)
+sys.path.insert(0, str(_ROOT))
+# imported before Home Assistant mounts the testing config directory,
+# which has its own custom_components package
+import custom_components  # noqa: E402,F401
+
+
+@pytest.fixture(scope="session")
+def integration_root() -> Path:
+    """Directory with the custom_components package of the integration."""
+    return _ROOT
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    yield
@@ -0,0 +1,70 @@
+"""Application connection to bluetooth-meshd."""
+from __future__ import annotations
+
+import time
+from unittest.mock import AsyncMock
+
+from bluetooth_mesh.messages.generic.onoff import GenericOnOffOpcode
+from bluetooth_mesh.messages.time import TimeOpcode
+from bluetooth_mesh.models.generic.onoff import GenericOnOffClient
+from bluetooth_mesh.models.time import TimeServer
+from homeassistant.core import HomeAssistant
+
+from custom_components.bt_mesh.application import BtMeshApplication
+
+NODE = 0x0100
+
+
+async def test_reconnect_replays_sets_once(hass: HomeAssistant, monkeypatch) -> None:
+    monkeypatch.setattr("custom_components.bt_mesh.application.G_RECONNECT_MIN_DELAY", 0)
+    app = BtMeshApplication(hass, "0123456789abcdef0123456789abcdef", "/mesh/ha/test")
+    await app.connect()
+    onoff = app.elements[0][GenericOnOffClient]
+    onoff.set = AsyncMock(return_value=None)
+
+    for reconnects in (1, 2):
+        app._async_disconnected()
+        reconnect_task = app._reconnect_task
+        # the latest SET of the node is kept until the reconnect
+        await app.generic_onoff_set(destination=NODE, app_index=0, onoff=1)
+        await app.generic_onoff_set(destination=NODE, app_index=0, onoff=0)
+        assert app.pending_sets == 1
+        assert not onoff.set.called
+
+        await reconnect_task
+        assert app.connected
+        assert app.reconnects == reconnects
+        assert app.pending_sets == 0
+        onoff.set.assert_awaited_once()
+        assert onoff.set.await_args.kwargs["onoff"] == 0
+        onoff.set.reset_mock()
+
+    time_server = app.elements[0][TimeServer]
+    assert len(time_server.app_message_callbacks[TimeOpcode.TIME_GET]) == 1
+    assert len(onoff.app_message_callbacks[GenericOnOffOpcode.GENERIC_ONOFF_STATUS]) == 1
+
+
+async def test_reconnect_backoff(hass: HomeAssistant, monkeypatch) -> None:
+    monkeypatch.setattr("custom_components.bt_mesh.application.G_RECONNECT_MIN_DELAY", 0.01)
+    monkeypatch.setattr("custom_components.bt_mesh.application.G_RECONNECT_MAX_DELAY", 0.04)
+    app = BtMeshApplication(hass, "0123456789abcdef0123456789abcdef", "/mesh/ha/test")
+    attempts = []
+
+    async def connect() -> None:
+        attempts.append(time.monotonic())
+        if len(attempts) < 5:
+            raise OSError("bluetooth-meshd is not running")
+
+    app.connect = connect
+    disconnected = time.monotonic()
+    app._async_disconnected()
+    assert not app.connected
+    await app._reconnect_task
+
+    assert app.connected
+    assert app.reconnects == 1
+    assert app._reconnect_task is None
+    # the delay doubles after each failed attempt up to the maximum
+    delays = [later - earlier for earlier, later in zip([disconnected, *attempts], attempts)]
+    for delay, expected in zip(delays, (0.01, 0.02, 0.04, 0.04, 0.04)):
+        assert delay >= expected * 0.9
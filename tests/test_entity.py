@@ -0,0 +1,46 @@
+"""Device info shared by the entities of the device."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from uuid import UUID
+
+from custom_components.bt_mesh.entity import (
+    _device_info_cache,
+    device_info,
+    discard_device_info,
+    prune_device_info,
+)
+
+
+def cfg_device(address: int, vid: int=0x0001) -> SimpleNamespace:
+    return SimpleNamespace(
+        uuid=UUID(int=address),
+        unique_id=UUID(int=address),
+        unicast_addr=address,
+        cid=0x05f1,
+        pid=0x0001,
+        vid=vid,
+    )
+
+
+def test_device_info_shared_until_changed() -> None:
+    first, second = cfg_device(0x0100), cfg_device(0x0200)
+    try:
+        info = device_info(first)
+        assert device_info(cfg_device(0x0100)) is info
+        assert info["name"] == "bt_mesh_0100"
+        assert info["sw_version"] == "0001"
+
+        # firmware update of the device rebuilds its device info
+        updated = device_info(cfg_device(0x0100, vid=0x0002))
+        assert updated is not info
+        assert updated["sw_version"] == "0002"
+
+        device_info(second)
+        prune_device_info([second])
+        assert str(first.uuid) not in _device_info_cache
+        discard_device_info(second)
+        assert str(second.uuid) not in _device_info_cache
+    finally:
+        discard_device_info(first)
+        discard_device_info(second)
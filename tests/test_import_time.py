@@ -0,0 +1,86 @@
+"""Import of the integration package, profiled with python -X importtime,
+   stays off the mesh stack and the modules loaded on demand."""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+# loaded by Home Assistant or the requirements before the integration
+PRELOADED = (
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity",
+    "homeassistant.helpers.storage",
+    "homeassistant.components.http",
+    "homeassistant.components.sensor",
+    "bt_mesh_ctrl",
+    "bt_mesh_ctrl.mesh_cfgclient_conf",
+)
+
+# imported on setup of the config entry, the platforms and the services
+LAZY_MODULES = (
+    "bluetooth_mesh",
+    "bluetooth_numbers",
+    "construct",
+    "custom_components.bt_mesh.application",
+    "custom_components.bt_mesh.simulator",
+    "custom_components.bt_mesh.services",
+    "custom_components.bt_mesh.trace",
+    "custom_components.bt_mesh.scene",
+)
+
+# own import time of the integration modules is about 60 ms on the
+# reference machine, the bluetooth_mesh message definitions take 2 s
+IMPORT_TIME_BUDGET = 0.3
+
+MARKER = "--- bt_mesh import ---"
+
+
+def import_profile(integration_root: Path) -> list[tuple[str, int]]:
+    """Modules imported by the integration package and their own import
+       time, us, in the python -X importtime order."""
+    code = "\n".join((
+        "import sys",
+        *(f"import {module}" for module in PRELOADED),
+        f"sys.stderr.write({MARKER!r} + '\\n')",
+        "import custom_components.bt_mesh",
+    ))
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join((str(integration_root), *sys.path))}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        # python -c puts the working directory first on the path, the
+        # repository itself is a custom_components package
+        cwd=integration_root,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    lines = result.stderr.splitlines()
+    profile = []
+    for line in lines[lines.index(MARKER) + 1:]:
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, _cumulative, module = line[len("import time:"):].split("|")
+        profile.append((module.strip(), int(self_us)))
+    return profile
+
+
+def test_import_time(integration_root: Path) -> None:
+    profile = import_profile(integration_root)
+    modules = [module for module, _self_us in profile]
+    assert "custom_components.bt_mesh" in modules
+
+    eager = [
+        module for module in modules
+            if any(module == lazy or module.startswith(f"{lazy}.") for lazy in LAZY_MODULES)
+    ]
+    assert not eager, f"imported with the integration: {eager}"
+
+    import_time = sum(self_us for _module, self_us in profile) / 1_000_000
+    slowest = sorted(profile, key=lambda item: item[1], reverse=True)[:10]
+    assert import_time <= IMPORT_TIME_BUDGET, f"import time {import_time:.3f}s, slowest: {slowest}"
@@ -0,0 +1,14 @@
+"""Generic Level conversions of the light entities."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.bt_mesh.light import BtMeshLightEntity, LEVEL_MOVE_DELTA_MAX
+
+
+@pytest.mark.parametrize("speed", [0, 0.1, 10, 49.9, 50, 75, 100, -50, -100])
+def test_level_move_step(speed: float) -> None:
+    delta_level, transition_time = BtMeshLightEntity.level_move_step(speed)
+    assert -LEVEL_MOVE_DELTA_MAX <= delta_level <= LEVEL_MOVE_DELTA_MAX
+    assert 0.1 <= transition_time <= 1.0
+    assert delta_level / transition_time == pytest.approx(speed * 65535 / 100, abs=1, rel=1e-3)
@@ -0,0 +1,41 @@
+"""Watcher of the meshcfg network configuration file."""
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.bt_mesh.mesh_conf_watcher import MeshConfWatcher
+
+DEBOUNCE = 0.05
+
+
+async def test_atomic_rename_debounced(hass: HomeAssistant, tmp_path: Path) -> None:
+    filename = tmp_path / "config_db.json"
+    filename.write_text("{}")
+    calls = []
+    watcher = MeshConfWatcher(hass, str(filename), lambda: calls.append(True), debounce=DEBOUNCE)
+    watcher.async_start()
+    if watcher.mode != "inotify":
+        watcher.async_stop()
+        pytest.skip("inotify is not available")
+
+    try:
+        # meshcfg writes the new file and renames it over the old one
+        for generation in range(3):
+            temporary = tmp_path / "config_db.json.tmp"
+            temporary.write_text(f'{{"generation": {generation}}}')
+            os.replace(temporary, filename)
+        (tmp_path / "other.json").write_text("{}")
+        await asyncio.sleep(DEBOUNCE * 4)
+        assert calls == [True]
+
+        (tmp_path / "other.json").write_text("[]")
+        await asyncio.sleep(DEBOUNCE * 4)
+        assert calls == [True]
+    finally:
+        watcher.async_stop()
+    assert watcher.mode == "stopped"
@@ -0,0 +1,39 @@
+"""Difference between two loads of the Mesh network configuration."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from custom_components.bt_mesh.mesh_diff import MeshConfSnapshot, diff_mesh_conf
+
+
+def snapshot(models: dict[str, int], devices: list[str]) -> MeshConfSnapshot:
+    return MeshConfSnapshot(
+        models={
+            unique_id: SimpleNamespace(unique_id=unique_id, app_key=app_key)
+                for unique_id, app_key in models.items()
+        },
+        devices={unique_id: SimpleNamespace(unique_id=unique_id) for unique_id in devices},
+    )
+
+
+def unique_ids(items: list) -> set[str]:
+    return {item.unique_id for item in items}
+
+
+def test_diff_mesh_conf() -> None:
+    old = snapshot({"0100-1000": 0, "0100-1300": 0, "0200-1000": 0}, ["dev1", "dev2"])
+    new = snapshot({"0100-1000": 0, "0100-1300": 1, "0300-1000": 0}, ["dev1", "dev3"])
+
+    diff = diff_mesh_conf(old, new)
+    assert unique_ids(diff.models_added) == {"0300-1000"}
+    assert unique_ids(diff.models_removed) == {"0200-1000"}
+    assert unique_ids(diff.models_changed) == {"0100-1300"}
+    assert unique_ids(diff.devices_added) == {"dev3"}
+    assert unique_ids(diff.devices_removed) == {"dev2"}
+    assert not diff.is_empty
+    assert str(diff) == "models +1 -1 ~1, devices +1 -1"
+
+
+def test_diff_of_same_conf_is_empty() -> None:
+    conf = snapshot({"0100-1000": 0}, ["dev1"])
+    assert diff_mesh_conf(conf, conf).is_empty
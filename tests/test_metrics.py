@@ -0,0 +1,65 @@
+"""Request metrics of the mesh network."""
+from __future__ import annotations
+
+import pytest
+from bluetooth_mesh.messages.generic.level import GenericLevelOpcode
+from bluetooth_mesh.messages.light.ctl import LightCTLOpcode
+from bluetooth_mesh.messages.light.hsl import LightHSLOpcode
+from bluetooth_mesh.messages.light.lightness import LightLightnessOpcode
+
+from custom_components.bt_mesh.application import BtMeshApplication
+from custom_components.bt_mesh.metrics import BtMeshMetrics, METRIC_CONFIRM_LATENCY
+
+STATUS = 0x8204
+OTHER_STATUS = 0x8252
+
+
+def test_confirm_latency_from_request_to_matching_status(monkeypatch) -> None:
+    now = 100.0
+    monkeypatch.setattr("custom_components.bt_mesh.metrics.time.monotonic", lambda: now)
+    metrics = BtMeshMetrics(send_interval=0.5, confirm_timeout=10)
+
+    metrics.set_started("0100", "generic_onoff_set", 99.0, (STATUS,))
+    # repeated before the confirmation, measured from the first request
+    metrics.set_started("0100", "generic_onoff_set", 99.5, (STATUS,))
+    metrics.state_confirmed("0100", OTHER_STATUS)
+    metrics.state_confirmed("0200", STATUS)
+    assert METRIC_CONFIRM_LATENCY not in {key[0] for key in metrics.histograms}
+
+    metrics.state_confirmed("0100", STATUS)
+    histogram = metrics.histograms[(METRIC_CONFIRM_LATENCY, "0100", "generic_onoff_set")]
+    assert (histogram.count, histogram.sum) == (1, 1.0)
+
+    # completed, the next status is not a confirmation
+    metrics.state_confirmed("0100", STATUS)
+    assert histogram.count == 1
+
+
+@pytest.mark.parametrize(
+    "bound_status",
+    [
+        LightLightnessOpcode.LIGHT_LIGHTNESS_STATUS,
+        LightCTLOpcode.LIGHT_CTL_STATUS,
+        LightHSLOpcode.LIGHT_HSL_STATUS,
+    ],
+    ids=["lightness", "ctl", "hsl"],
+)
+@pytest.mark.parametrize("request_name", ["generic_level_delta_set", "generic_level_move_set"])
+def test_level_set_confirmed_by_bound_model(monkeypatch, request_name: str, bound_status: int) -> None:
+    now = 100.0
+    monkeypatch.setattr("custom_components.bt_mesh.metrics.time.monotonic", lambda: now)
+    metrics = BtMeshMetrics(send_interval=0.5, confirm_timeout=10)
+    opcodes = BtMeshApplication.confirm_opcodes[request_name]
+
+    # published status of the light model bound to the level
+    metrics.set_started("0100", request_name, 99.0, opcodes)
+    metrics.state_confirmed("0100", bound_status)
+    histogram = metrics.histograms[(METRIC_CONFIRM_LATENCY, "0100", request_name)]
+    assert (histogram.count, histogram.sum) == (1, 1.0)
+
+    # Level Status of the node, the refresh GET that follows doesn't
+    # confirm the SET again
+    metrics.set_started("0100", request_name, 99.5, opcodes)
+    metrics.state_confirmed("0100", GenericLevelOpcode.GENERIC_LEVEL_STATUS)
+    metrics.state_confirmed("0100", bound_status)
+    assert (histogram.count, histogram.sum) == (2, 1.5)
@@ -0,0 +1,111 @@
+"""Startup warm-up through the refresh scheduler."""
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.bt_mesh.const import (
+    REFRESH_PRIORITY_BATTERY,
+    REFRESH_PRIORITY_CONTROL,
+    REFRESH_PRIORITY_SENSOR,
+)
+from custom_components.bt_mesh.scheduler import BtMeshRefreshScheduler
+
+SEND_INTERVAL = 0.05
+
+
+class StubEntity:
+    """Entity answering the model state query, or not."""
+
+    def __init__(self, hass: HomeAssistant, unique_id: str, priority: int, refreshed: list, responding: bool=True) -> None:
+        self.hass = hass
+        self.unique_id = unique_id
+        self.name = unique_id
+        self.refresh_priority = priority
+        self.passive = False
+        self.refresh_pending = False
+        self.cached_model_state = None
+        self._refreshed = refreshed
+        self._responding = responding
+
+    async def async_refresh_model_state(self) -> None:
+        assert self.refresh_pending
+        self._refreshed.append((self.unique_id, time.monotonic()))
+        if self._responding:
+            self.cached_model_state = {"present_onoff": 1}
+
+
+def stub_entry() -> SimpleNamespace:
+    return SimpleNamespace(
+        title="test",
+        async_create_background_task=lambda hass, target, name: hass.async_create_background_task(target, name),
+    )
+
+
+async def test_priority_order_and_budget(hass: HomeAssistant) -> None:
+    scheduler = BtMeshRefreshScheduler(hass, concurrency=2, send_interval=SEND_INTERVAL)
+    refreshed = []
+    entities = [
+        StubEntity(hass, "battery", REFRESH_PRIORITY_BATTERY, refreshed),
+        StubEntity(hass, "sensor", REFRESH_PRIORITY_SENSOR, refreshed, responding=False),
+        StubEntity(hass, "light1", REFRESH_PRIORITY_CONTROL, refreshed),
+        StubEntity(hass, "light2", REFRESH_PRIORITY_CONTROL, refreshed),
+    ]
+    for entity in entities:
+        scheduler.async_schedule(entity)
+    # queued once until refreshed
+    scheduler.async_schedule(entities[0])
+    assert scheduler.queue_depth == 4
+    assert all(entity.refresh_pending for entity in entities)
+
+    scheduler.async_start(stub_entry())
+    scheduler.async_discovery_done()
+    await scheduler._queue.join()
+    scheduler.async_stop()
+
+    assert [unique_id for unique_id, _ in refreshed] == ["light1", "light2", "sensor", "battery"]
+    # the queries are spaced by the budget, not by the number of workers
+    times = [sent for _, sent in refreshed]
+    assert all(later - earlier >= SEND_INTERVAL * 0.9 for earlier, later in zip(times, times[1:]))
+
+    assert not any(entity.refresh_pending for entity in entities)
+    assert scheduler.queue_depth == 0
+    assert scheduler.warmup_done
+    assert (scheduler.warmup_entities, scheduler.warmup_failed) == (4, 1)
+
+
+class StaleEntity(StubEntity):
+    """Entity of the push-only network checked for the state age."""
+
+    def __init__(self, hass: HomeAssistant | None, unique_id: str, age: float | None, passive: bool=False) -> None:
+        super().__init__(hass, unique_id, REFRESH_PRIORITY_SENSOR, [])
+        self.passive = passive
+        self.available = True
+        self.last_update = None if age is None else time.time() - age
+        self.update_timeout = 60
+        self.invalidate_timeout = 300
+        self.written = False
+
+    def async_write_model_state(self) -> None:
+        self.written = True
+
+
+async def test_schedule_stale_entities(hass: HomeAssistant) -> None:
+    scheduler = BtMeshRefreshScheduler(hass, concurrency=1, send_interval=SEND_INTERVAL)
+    entities = {
+        "fresh": StaleEntity(hass, "fresh", 10),
+        "outdated": StaleEntity(hass, "outdated", 120),
+        "expired": StaleEntity(hass, "expired", 600),
+        "unknown": StaleEntity(hass, "unknown", None),
+        "passive": StaleEntity(hass, "passive", 600, passive=True),
+        "removed": StaleEntity(None, "removed", 600),
+    }
+    scheduler.async_schedule_stale(entities.values())
+
+    queued = {scheduler._queue.get_nowait()[2].unique_id for _ in range(scheduler.queue_depth)}
+    assert queued == {"outdated", "expired", "unknown"}
+    # the expired state is written to mark the entity unavailable
+    written = {unique_id for unique_id, entity in entities.items() if entity.written}
+    assert written == {"expired", "unknown", "passive"}
@@ -0,0 +1,74 @@
+"""Sensor cadence configured on the nodes."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import HomeAssistant
+
+from custom_components.bt_mesh.sensor_cadence import BtMeshSensorCadence, cadence_from_descriptor
+
+DESCRIPTOR = {
+    "sensor_property_id": 0x004f,
+    "sensor_positive_tolerance": 0,
+    "sensor_negative_tolerance": 0,
+    "sensor_sampling_funcion": 0,
+    "sensor_measurement_period": 0,
+    "sensor_update_interval": 0,
+}
+
+
+class CadenceApp:
+    def __init__(self) -> None:
+        self.requests = []
+
+    async def sensor_cadence_set(self, **kwargs) -> any:
+        self.requests.append(kwargs)
+        return SimpleNamespace(**kwargs)
+
+
+async def test_cadence_per_entry(hass: HomeAssistant, hass_storage: dict) -> None:
+    app = CadenceApp()
+    cfg_model = SimpleNamespace(unicast_addr=0x0100, app_key=0)
+    first = BtMeshSensorCadence(hass, "entry1")
+    second = BtMeshSensorCadence(hass, "entry2")
+    await first.async_load()
+    await second.async_load()
+    assert await first.async_configure(app, cfg_model, 0x004f, DESCRIPTOR)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    assert len(second) == 0
+
+    # the configured cadence is not sent again after restart
+    restored = BtMeshSensorCadence(hass, "entry1")
+    await restored.async_load()
+    assert await restored.async_configure(app, cfg_model, 0x004f, DESCRIPTOR)
+    assert len(app.requests) == 1
+
+    await restored.async_remove()
+    assert "bt_mesh.sensor_cadence.entry1" not in hass_storage
+
+
+def test_cadence_from_descriptor() -> None:
+    descriptor = {
+        **DESCRIPTOR,
+        # 2 % and 1 % of 4095
+        "sensor_positive_tolerance": 82,
+        "sensor_negative_tolerance": 41,
+        "sensor_measurement_period": 10,
+    }
+    assert cadence_from_descriptor(descriptor) == {
+        "fast_cadence_period_divisor": 0,
+        "status_trigger_type": 1,
+        "status_trigger_delta_down": 1.0,
+        "status_trigger_delta_up": 2.0,
+        # 10 s is rounded up to 2^14 ms
+        "status_min_interval": 14,
+        "fast_cadence_low": 0,
+        "fast_cadence_high": 0,
+    }
+
+    # unspecified tolerance and period use the minimums
+    cadence = cadence_from_descriptor(DESCRIPTOR)
+    assert cadence["status_min_interval"] == 10
+    assert cadence["status_trigger_delta_up"] == 1.0
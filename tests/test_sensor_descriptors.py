@@ -0,0 +1,103 @@
+"""Sensor descriptor templates of the products."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import HomeAssistant
+
+from custom_components.bt_mesh.sensor_descriptors import (
+    BtMeshSensorDescriptors,
+    BtMeshSensorDescriptorTemplates,
+    RetryBackoff,
+)
+
+DEVICE = SimpleNamespace(cid=0x05f1, pid=0x0001, vid=0x0002)
+OLD = [{"sensor_property_id": 0x004f, "sensor_update_interval": 0}]
+NEW = [{"sensor_property_id": 0x004f, "sensor_update_interval": 10}]
+
+
+async def test_template_replaced_by_fetch(hass: HomeAssistant) -> None:
+    descriptors = BtMeshSensorDescriptors(hass, "entry1", BtMeshSensorDescriptorTemplates(hass))
+    descriptors.async_set_template(DEVICE, OLD)
+    descriptors.async_set_template(DEVICE, NEW, fetched=True)
+    assert descriptors.get_template(DEVICE) == NEW
+
+
+async def test_template_invalidated_on_mismatch(hass: HomeAssistant) -> None:
+    descriptors = BtMeshSensorDescriptors(hass, "entry1", BtMeshSensorDescriptorTemplates(hass))
+    descriptors.async_set_template(DEVICE, OLD)
+    descriptors.async_set_template(DEVICE, NEW)
+    assert descriptors.get_template(DEVICE) is None
+    # stored descriptors of the next node don't bring the template back
+    descriptors.async_set_template(DEVICE, OLD)
+    assert descriptors.get_template(DEVICE) is None
+
+    descriptors.async_set_template(DEVICE, NEW, fetched=True)
+    assert descriptors.get_template(DEVICE) == NEW
+
+
+async def test_descriptors_per_entry(hass: HomeAssistant, hass_storage: dict) -> None:
+    templates = BtMeshSensorDescriptorTemplates(hass)
+    first = BtMeshSensorDescriptors(hass, "entry1", templates)
+    second = BtMeshSensorDescriptors(hass, "entry2", templates)
+    first.async_set("0100", OLD)
+    second.async_set("0100", NEW)
+    # templates are shared by the entries
+    first.async_set_template(DEVICE, NEW, fetched=True)
+    assert second.get_template(DEVICE) == NEW
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+    assert hass_storage["bt_mesh.sensor_descriptors.entry1"]["data"] == {"0100": OLD}
+    assert hass_storage["bt_mesh.sensor_descriptors.entry2"]["data"] == {"0100": NEW}
+
+    await first.async_remove()
+    assert "bt_mesh.sensor_descriptors.entry1" not in hass_storage
+    assert "bt_mesh.sensor_descriptors.entry2" in hass_storage
+
+
+async def test_descriptors_saved_with_delay(hass: HomeAssistant, hass_storage: dict) -> None:
+    templates = BtMeshSensorDescriptorTemplates(hass)
+    descriptors = BtMeshSensorDescriptors(hass, "entry1", templates)
+    descriptors.async_set("0100", OLD)
+    descriptors.async_set("0200", NEW)
+    descriptors.async_pop("0300")
+    # the changes are batched in one delayed save
+    assert "bt_mesh.sensor_descriptors.entry1" not in hass_storage
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    assert hass_storage["bt_mesh.sensor_descriptors.entry1"]["data"] == {"0100": OLD, "0200": NEW}
+
+    loaded = BtMeshSensorDescriptors(hass, "entry1", templates)
+    await loaded.async_load()
+    assert len(loaded) == 2
+    assert "0100" in loaded and loaded.get("0200") == NEW
+    assert loaded.async_pop("0100") == OLD
+    assert "0100" not in loaded
+
+
+def test_retry_backoff(monkeypatch) -> None:
+    now = 100.0
+    monkeypatch.setattr("custom_components.bt_mesh.sensor_descriptors.time.monotonic", lambda: now)
+    backoff = RetryBackoff(min_delay=5, max_delay=30)
+    assert backoff.ready("0100")
+    assert backoff.next_retry_delay(60) == 60
+
+    # the delay doubles with each failure up to the maximum
+    delays = []
+    for _ in range(5):
+        backoff.failed("0100")
+        delays.append(backoff.as_dict()["0100"]["retry_in"])
+    assert delays == [5, 10, 20, 30, 30]
+    assert not backoff.ready("0100")
+
+    backoff.failed("0200")
+    assert backoff.next_retry_delay(60) == 5
+    now += 5
+    assert backoff.ready("0200") and not backoff.ready("0100")
+
+    backoff.succeeded("0200")
+    assert backoff.ready("0200")
+    assert set(backoff.as_dict()) == {"0100"}
+    assert backoff.next_retry_delay(60) == 25
@@ -0,0 +1,65 @@
+"""Sensor property registry of the Mesh Device Properties."""
+from __future__ import annotations
+
+import logging
+from datetime import date
+
+import pytest
+from bluetooth_mesh.messages.properties import PropertyDict, PropertyID
+
+from custom_components.bt_mesh.sensor_properties import (
+    get_sensor_description,
+    sensor_properties,
+    sensor_value,
+)
+
+
+def test_registry_covers_properties() -> None:
+    registry = sensor_properties()
+    missing = {
+        property_id.name
+        for property_id in PropertyDict
+        if property_id not in registry
+    }
+    assert missing == {"RELATIVE_RUNTIME_IN_A_CORRELATED_COLOR_TEMPERATURE_RANGE"}
+
+
+@pytest.mark.parametrize(
+    "property_id",
+    [property_id for property_id in PropertyDict if property_id in sensor_properties()],
+    ids=lambda property_id: property_id.name,
+)
+def test_value_path(property_id: PropertyID, caplog: pytest.LogCaptureFixture) -> None:
+    """The value path of the description is found in the decoded property."""
+    prop = {property_id.name.lower(): PropertyDict[property_id].parse(bytes(64))}
+    with caplog.at_level(logging.WARNING):
+        sensor_value(prop, get_sensor_description(property_id))
+    assert not caplog.records
+
+
+def test_sensor_value() -> None:
+    temperature = get_sensor_description(PropertyID.PRESENT_AMBIENT_TEMPERATURE)
+    assert sensor_value({"present_ambient_temperature": {"temperature": 21.5}}, temperature) == 21.5
+    assert sensor_value({"present_ambient_temperature": {"temperature": None}}, temperature) is None
+
+    manufacture = get_sensor_description(PropertyID.DEVICE_DATE_OF_MANUFACTURE)
+    assert sensor_value({"device_date_of_manufacture": {"date": date(2024, 5, 1)}}, manufacture) == date(2024, 5, 1)
+
+    firmware = get_sensor_description(PropertyID.DEVICE_FIRMWARE_REVISION)
+    assert sensor_value({"device_firmware_revision": "1.2.3"}, firmware) == "1.2.3"
+
+
+def test_sensor_value_scaled() -> None:
+    """Power factor is decoded as the cosine in hundredths."""
+    power_factor = get_sensor_description(PropertyID.POWER_FACTOR)
+    prop = {"power_factor": PropertyDict[PropertyID.POWER_FACTOR].parse(bytes([0xa9]))}
+    assert sensor_value(prop, power_factor) == -0.87
+    assert power_factor.native_unit_of_measurement is None
+
+
+def test_sensor_value_missing_path(caplog: pytest.LogCaptureFixture) -> None:
+    description = get_sensor_description(PropertyID.PRESENT_INPUT_VOLTAGE)
+    with caplog.at_level(logging.WARNING):
+        assert sensor_value({"present_input_voltage": {"power": 1.0}}, description) is None
+        assert sensor_value({"present_input_voltage": {"power": 1.0}}, description) is None
+    assert len(caplog.records) == 1
@@ -0,0 +1,26 @@
+"""Nodes of the network sharded across application instances."""
+from __future__ import annotations
+
+from custom_components.bt_mesh.shards import BtMeshMessageDedup, shard_uuid
+
+
+def test_dedup_within_window() -> None:
+    dedup = BtMeshMessageDedup(window=0.5)
+    key = (0x0100, bytes.fromhex("820401"))
+
+    assert not dedup.duplicate(key, 10.0)
+    assert dedup.duplicate(key, 10.3)
+    assert not dedup.duplicate((0x0101, bytes.fromhex("820401")), 10.3)
+    # the same state reported again after the window is a new message
+    assert not dedup.duplicate(key, 10.6)
+    assert len(dedup) == 2
+    assert not dedup.duplicate((0x0102, bytes.fromhex("820400")), 20.0)
+    assert len(dedup) == 1
+
+
+def test_shard_uuid() -> None:
+    primary = "0123456789abcdef0123456789abcdef"
+    uuids = {shard_uuid(primary, path) for path in ("/mesh/ha/1", "/mesh/ha/2")}
+    assert len(uuids) == 2
+    assert primary not in uuids
+    assert shard_uuid(primary, "/mesh/ha/1") == shard_uuid(primary, "/mesh/ha/1")
@@ -0,0 +1,35 @@
+"""Client models of the simulated network."""
+from __future__ import annotations
+
+import asyncio
+
+from bluetooth_mesh.models.scene import SceneClient
+
+from custom_components.bt_mesh.const import SIM_MODEL_LIGHTNESS, SIM_MODEL_SENSOR
+from custom_components.bt_mesh.simulator import (
+    SIM_FIRST_ADDR,
+    SIM_PUBLISH_ADDR,
+    SimulatedElement,
+    SimulatedMesh,
+    SimulationOptions,
+)
+
+
+async def test_scene_store_recall() -> None:
+    mesh = SimulatedMesh(SimulationOptions(
+        nodes=2, models=(SIM_MODEL_LIGHTNESS, SIM_MODEL_SENSOR), latency=0.001, jitter=0, loss=0, seed=1
+    ))
+    published = []
+    mesh.publish_callback = lambda source, message: published.append(source)
+    client = SimulatedElement(mesh)[SceneClient]
+    light = mesh.nodes[SIM_FIRST_ADDR]
+
+    light.set_lightness(0x4000)
+    status = await client.store(SIM_FIRST_ADDR, 0, 3, send_interval=0.5, timeout=1.0)
+    assert list(status.scenes) == [3]
+
+    light.set_lightness(0)
+    await client.recall_unack(SIM_PUBLISH_ADDR, 0, 3)
+    await asyncio.sleep(0.05)
+    assert light.lightness == 0x4000 and light.onoff == 1
+    assert published == [SIM_FIRST_ADDR]
@@ -0,0 +1,59 @@
+"""Persistent snapshot of the entities model state."""
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.bt_mesh.const import G_MESH_STATE_RESTORE_MAX_AGE
+from custom_components.bt_mesh.state_store import BtMeshStateStore
+
+KEY = "bt_mesh.model_states.entry1"
+
+
+def entity(unique_id: str, state: any, last_update: float, restored: bool=False) -> SimpleNamespace:
+    return SimpleNamespace(
+        unique_id=unique_id,
+        cached_model_state=state,
+        last_update=last_update,
+        state_restored=restored,
+    )
+
+
+async def test_restore_skips_aged_out_states(hass: HomeAssistant, hass_storage: dict) -> None:
+    now = time.time()
+    hass_storage[KEY] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": KEY,
+        "data": {
+            "fresh": {"state": {"present_onoff": 1}, "last_update": now - 60},
+            "aged": {"state": {"present_onoff": 0}, "last_update": now - G_MESH_STATE_RESTORE_MAX_AGE - 60},
+        },
+    }
+    store = BtMeshStateStore(hass, "entry1")
+    await store.async_load()
+
+    assert store.get("fresh").present_onoff == 1
+    assert store.get("aged") is None
+    await store.async_unload()
+    assert set(hass_storage[KEY]["data"]) == {"fresh"}
+
+
+async def test_snapshot_of_received_states(hass: HomeAssistant, hass_storage: dict) -> None:
+    now = time.time()
+    store = BtMeshStateStore(hass, "entry1")
+    await store.async_load()
+    store.async_register(entity("received", {"present_lightness": 0x4000, "_io": None}, now))
+    store.async_register(entity("unknown", None, None))
+    await store.async_save()
+
+    assert hass_storage[KEY]["data"] == {
+        "received": {"state": {"present_lightness": 0x4000}, "last_update": now},
+    }
+
+    # the restored state is kept until the entity receives the fresh one
+    store.async_register(entity("received", {"present_lightness": 0}, now + 10, restored=True))
+    await store.async_unload()
+    assert hass_storage[KEY]["data"]["received"]["last_update"] == now
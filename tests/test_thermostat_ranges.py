@@ -0,0 +1,43 @@
+"""Persistent thermostat temperature ranges."""
+from __future__ import annotations
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import HomeAssistant
+
+from custom_components.bt_mesh.thermostat_ranges import BtMeshThermostatRanges
+
+
+async def _flush(hass: HomeAssistant) -> None:
+    """Write the delayed saves."""
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+
+async def test_ranges_per_entry(hass: HomeAssistant, hass_storage: dict) -> None:
+    first = BtMeshThermostatRanges(hass, "entry1")
+    second = BtMeshThermostatRanges(hass, "entry2")
+    await first.async_load()
+    await second.async_load()
+    first.async_set("0100", 5.0, 30.0)
+    second.async_set("0100", 10.0, 25.0)
+    await _flush(hass)
+
+    restored = BtMeshThermostatRanges(hass, "entry1")
+    await restored.async_load()
+    assert restored.get("0100") == (5.0, 30.0)
+    restored = BtMeshThermostatRanges(hass, "entry2")
+    await restored.async_load()
+    assert restored.get("0100") == (10.0, 25.0)
+
+
+async def test_ranges_pop_and_remove(hass: HomeAssistant, hass_storage: dict) -> None:
+    ranges = BtMeshThermostatRanges(hass, "entry1")
+    await ranges.async_load()
+    ranges.async_set("0100", 5.0, 30.0)
+    ranges.async_set("0101", 5.0, 30.0)
+    ranges.async_pop_node("0100")
+    await _flush(hass)
+    assert hass_storage["bt_mesh.thermostat_ranges.entry1"]["data"] == {"0101": [5.0, 30.0]}
+
+    await ranges.async_remove()
+    assert "bt_mesh.thermostat_ranges.entry1" not in hass_storage
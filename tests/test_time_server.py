@@ -0,0 +1,30 @@
+"""Time zone of the Time Server."""
+from __future__ import annotations
+
+import homeassistant.util.dt as dt_util
+import pytest
+
+from custom_components.bt_mesh.time_server import TimeZoneCache
+
+# 2023-11-14T22:13:20Z, winter time in both zones
+NOW = 1700000000
+
+
+@pytest.fixture
+def restore_time_zone():
+    time_zone = dt_util.get_default_time_zone()
+    yield
+    dt_util.set_default_time_zone(time_zone)
+
+
+def test_time_zone_follows_config(restore_time_zone) -> None:
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Berlin"))
+    cache = TimeZoneCache()
+    assert not cache.refresh(NOW)
+    assert cache.offset.total_seconds() == 3600
+    assert cache.offset_new.total_seconds() == 7200
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("America/New_York"))
+    assert cache.refresh(NOW + 60)
+    assert cache.offset.total_seconds() == -5 * 3600
+    assert cache.offset_new.total_seconds() == -4 * 3600
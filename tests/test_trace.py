@@ -0,0 +1,36 @@
+"""Capture of the inbound message traces."""
+from __future__ import annotations
+
+from uuid import UUID
+
+import pytest
+from bluetooth_mesh.messages import AccessMessage
+
+from custom_components.bt_mesh.trace import BtMeshTraceRecorder, decode_trace
+
+ONOFF_STATUS = bytes.fromhex("820401")
+LIGHTNESS_STATUS = bytes.fromhex("824e0040")
+
+
+def test_trace_round_trip() -> None:
+    recorder = BtMeshTraceRecorder(max_records=2)
+    recorder.record(0x0100, 0, 0x0001, AccessMessage.parse(ONOFF_STATUS))
+    recorder.record(0x0200, 1, UUID(int=1), AccessMessage.parse(LIGHTNESS_STATUS))
+    recorder.record(0x0300, 0, 0x0001, AccessMessage.parse(ONOFF_STATUS))
+    assert recorder.full
+    assert (recorder.records, recorder.dropped) == (2, 1)
+
+    start_time, records = decode_trace(recorder.to_bytes())
+    assert start_time == recorder.start_time
+    assert [record[1:] for record in records] == [
+        (0x0100, 0, 0x0001, ONOFF_STATUS),
+        # virtual destination is recorded unassigned
+        (0x0200, 1, 0x0000, LIGHTNESS_STATUS),
+    ]
+    assert 0 <= records[0][0] <= records[1][0]
+    assert AccessMessage.parse(records[1][4]) == AccessMessage.parse(LIGHTNESS_STATUS)
+
+
+def test_decode_trace_rejects_other_files() -> None:
+    with pytest.raises(ValueError):
+        decode_trace(b"NOTATRACEFILE" + bytes(16))
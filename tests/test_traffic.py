@@ -0,0 +1,46 @@
+"""Ring buffer of the recent access messages."""
+from __future__ import annotations
+
+from uuid import UUID
+
+from custom_components.bt_mesh.traffic import (
+    TRAFFIC_IN,
+    TRAFFIC_OUT,
+    BtMeshTrafficLog,
+    access_opcode,
+)
+
+ONOFF_GET = bytes.fromhex("8201")
+ONOFF_STATUS = bytes.fromhex("820401")
+
+
+def test_access_opcode() -> None:
+    assert access_opcode(bytes.fromhex("52")) == 0x52
+    assert access_opcode(ONOFF_STATUS) == 0x8204
+    assert access_opcode(bytes.fromhex("c5f105ff")) == 0xc5f105
+    assert access_opcode(bytes.fromhex("82")) is None
+    assert access_opcode(b"") is None
+
+
+def test_ring_buffer_keeps_latest(monkeypatch) -> None:
+    now = 100.0
+    monkeypatch.setattr("custom_components.bt_mesh.traffic.time.monotonic", lambda: now)
+    log = BtMeshTrafficLog(size=3, latency_timeout=5)
+
+    log.record(TRAFFIC_OUT, None, 0x0100, ONOFF_GET)
+    now += 0.25
+    log.record(TRAFFIC_IN, 0x0100, 0x0001, ONOFF_STATUS)
+    # no request to the node, no latency
+    log.record(TRAFFIC_IN, 0x0200, 0x0001, ONOFF_STATUS)
+    log.record(TRAFFIC_OUT, None, UUID(int=1), ONOFF_GET)
+    assert len(log) == 3
+
+    records = log.records()
+    assert [record["direction"] for record in records] == ["in", "in", "out"]
+    assert records[0]["source"] == "0100"
+    assert records[0]["opcode"] == "8204"
+    assert records[0]["size"] == 3
+    assert records[0]["latency"] == 0.25
+    assert records[1]["latency"] is None
+    # virtual destination is logged unassigned
+    assert records[2]["destination"] == "0000"
@@ -0,0 +1,48 @@
+"""Timing of the callbacks instrumented by the watchdog."""
+from __future__ import annotations
+
+import time
+
+from homeassistant.core import HomeAssistant, callback, is_callback
+
+from custom_components.bt_mesh.watchdog import BtMeshWatchdog
+
+THRESHOLD = 0.02
+
+
+class Receiver:
+    entity_id = "light.bt_mesh_0100"
+
+    @callback
+    def receive(self, value: int) -> int:
+        return value
+
+    def receive_slow(self) -> None:
+        time.sleep(THRESHOLD * 2)
+
+    async def async_update(self) -> str:
+        return "updated"
+
+
+async def test_callback_stats(hass: HomeAssistant) -> None:
+    watchdog = BtMeshWatchdog(hass, threshold=THRESHOLD, interval=1.0)
+    receiver = Receiver()
+    watchdog.instrument(receiver, "receive", "receive_slow", "async_update", "missing")
+
+    # the HA callback marker is kept, the wrapper runs in the loop
+    assert is_callback(receiver.receive)
+    assert receiver.receive(1) == 1
+    assert receiver.receive(2) == 2
+    receiver.receive_slow()
+    assert await receiver.async_update() == "updated"
+
+    callbacks = watchdog.as_dict()["callbacks"]
+    assert set(callbacks) == {"Receiver.receive", "Receiver.receive_slow", "Receiver.async_update"}
+    assert (callbacks["Receiver.receive"]["calls"], callbacks["Receiver.receive"]["slow"]) == (2, 0)
+    assert callbacks["Receiver.receive_slow"]["slow"] == 1
+    assert callbacks["Receiver.receive_slow"]["max"] >= THRESHOLD * 2
+
+    [event] = watchdog.events
+    assert event["callback"] == "Receiver.receive_slow"
+    assert event["source"] == "light.bt_mesh_0100"
+    assert event["duration"] >= THRESHOLD * 2